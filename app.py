@@ -9,13 +9,31 @@ import threading
 import subprocess
 import math
 import uuid
+import socket
 import tempfile
 import json
+import base64
 import hashlib
-import zipfile
+import zlib
+import struct
+import bisect
+import contextlib
+import cProfile
+import hmac
+import random
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from urllib.parse import quote
 
-from flask import Flask, jsonify, render_template, request, send_file, g, Response, after_this_request
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - nur POSIX
+    fcntl = None
+
+from flask import Flask, jsonify, render_template, request, send_file, g, Response, redirect
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.http import http_date, parse_date
 
 import config
 
@@ -41,6 +59,227 @@ def _tool_missing_details(name: str):
     }
 
 
+# Prozessinterne Metriken (Prometheus-Textformat unter /metrics); jeder Worker-Prozess zählt für sich.
+_METRICS_LOCK = threading.Lock()
+_METRICS_COUNTERS = {}
+_METRICS_GAUGES = {}
+_METRICS_HISTOGRAMS = {}
+_METRICS_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+_METRICS_BUILD_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+_METRICS_SPEED_BUCKETS = (0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0, 32.0, 64.0)
+_METRICS_DIR_SIZES = {}
+_METRICS_DIR_SIZE_MAX_AGE_SECONDS = 60.0
+_METRICS_HELP = {
+    "http_requests_total": ("counter", "HTTP-Requests nach Route, Methode und Status."),
+    "http_request_duration_seconds": ("histogram", "Antwortzeit bis zum Response-Objekt (ohne Streaming-Body)."),
+    "tool_invocations_total": ("counter", "Aufrufe von ffmpeg/ffprobe nach Ergebnis."),
+    "tool_duration_seconds_total": ("counter", "Summierte Laufzeit von ffmpeg/ffprobe."),
+    "tag_index_build_seconds": ("histogram", "Dauer eines Tag-Index-Aufbaus."),
+    "tag_index_entries": ("gauge", "Einträge im zuletzt gebauten Tag-Index."),
+    "dedupe_hashed_bytes_total": ("counter", "Von der Duplikatsuche gehashte Bytes."),
+    "dedupe_hash_seconds_total": ("counter", "Zeit für das Hashen in der Duplikatsuche."),
+    "merge_jobs_total": ("counter", "Abgeschlossene Merge-Jobs nach Status und Profil."),
+    "merge_media_seconds_total": ("counter", "Verarbeitete Videolänge erfolgreicher Merges."),
+    "merge_wall_seconds_total": ("counter", "Laufzeit erfolgreicher Merges."),
+    "merge_encode_speed_ratio": ("histogram", "Videolänge / Laufzeit pro Merge (1.0 = Echtzeit)."),
+    "jobs_running": ("gauge", "Laufende Hintergrundjobs in diesem Prozess (Transfers: alle Prozesse)."),
+    "cache_entries": ("gauge", "Einträge in den Caches im Speicher."),
+    "cache_bytes": ("gauge", "Belegung der Caches auf der Platte."),
+}
+
+
+def _metric_inc(name: str, value: float = 1.0, **labels):
+    key = (name, tuple(sorted(labels.items())))
+    with _METRICS_LOCK:
+        _METRICS_COUNTERS[key] = _METRICS_COUNTERS.get(key, 0.0) + value
+
+
+def _metric_set(name: str, value: float, **labels):
+    key = (name, tuple(sorted(labels.items())))
+    with _METRICS_LOCK:
+        _METRICS_GAUGES[key] = float(value)
+
+
+def _metric_observe(name: str, value: float, buckets=_METRICS_LATENCY_BUCKETS, **labels):
+    key = (name, tuple(sorted(labels.items())))
+    idx = bisect.bisect_left(buckets, value)
+    with _METRICS_LOCK:
+        h = _METRICS_HISTOGRAMS.get(key)
+        if h is None:
+            h = _METRICS_HISTOGRAMS[key] = [buckets, [0] * len(buckets), 0.0, 0]
+        if idx < len(buckets):
+            h[1][idx] += 1
+        h[2] += value
+        h[3] += 1
+
+
+def _metric_tool(cmd: list[str], started: float, ok: bool):
+    tool = os.path.basename(str(cmd[0])) if cmd else "?"
+    _metric_inc("tool_invocations_total", tool=tool, result="ok" if ok else "error")
+    _metric_inc("tool_duration_seconds_total", time.perf_counter() - started, tool=tool)
+
+
+def _tool_run(cmd: list[str], **kwargs) -> subprocess.CompletedProcess:
+    started = time.perf_counter()
+    ok = False
+    try:
+        res = subprocess.run(cmd, **kwargs)
+        ok = res.returncode == 0
+        return res
+    finally:
+        _metric_tool(cmd, started, ok)
+
+
+def _tool_output(cmd: list[str], **kwargs):
+    started = time.perf_counter()
+    ok = False
+    try:
+        out = subprocess.check_output(cmd, **kwargs)
+        ok = True
+        return out
+    finally:
+        _metric_tool(cmd, started, ok)
+
+
+def _metrics_label_str(labels) -> str:
+    if not labels:
+        return ""
+    parts = []
+    for k, v in labels:
+        v = str(v).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        parts.append(f'{k}="{v}"')
+    return "{" + ",".join(parts) + "}"
+
+
+def _metrics_num(v: float) -> str:
+    if v == int(v) and abs(v) < 1e15:
+        return str(int(v))
+    return repr(float(v))
+
+
+def _metrics_render() -> str:
+    with _METRICS_LOCK:
+        counters = dict(_METRICS_COUNTERS)
+        gauges = dict(_METRICS_GAUGES)
+        histograms = {k: (h[0], list(h[1]), h[2], h[3]) for k, h in _METRICS_HISTOGRAMS.items()}
+
+    samples = {}
+    for (name, labels), v in counters.items():
+        samples.setdefault(name, []).append(f"{name}{_metrics_label_str(labels)} {_metrics_num(v)}")
+    for (name, labels), v in gauges.items():
+        samples.setdefault(name, []).append(f"{name}{_metrics_label_str(labels)} {_metrics_num(v)}")
+    for (name, labels), (buckets, counts, total, count) in histograms.items():
+        lines = samples.setdefault(name, [])
+        cum = 0
+        for le, n in zip(buckets, counts):
+            cum += n
+            lines.append(f"{name}_bucket{_metrics_label_str(labels + (('le', _metrics_num(le)),))} {cum}")
+        lines.append(f"{name}_bucket{_metrics_label_str(labels + (('le', '+Inf'),))} {count}")
+        lines.append(f"{name}_sum{_metrics_label_str(labels)} {_metrics_num(total)}")
+        lines.append(f"{name}_count{_metrics_label_str(labels)} {count}")
+
+    out = []
+    for name in sorted(samples):
+        kind, help_text = _METRICS_HELP.get(name, ("untyped", ""))
+        if help_text:
+            out.append(f"# HELP {name} {help_text}")
+        out.append(f"# TYPE {name} {kind}")
+        out.extend(sorted(samples[name]) if kind != "histogram" else samples[name])
+    return "\n".join(out) + "\n"
+
+
+# Phasenzeiten des laufenden Requests (Server-Timing). Thread-lokal statt in g, weil
+# Hilfsfunktionen eigene App-Kontexte öffnen; Hintergrund-Threads messen nichts.
+_REQUEST_LOCAL = threading.local()
+_SERVER_TIMING_PHASES = ("index", "db", "fs", "serialize")
+
+
+@contextlib.contextmanager
+def _phase(name: str):
+    st = getattr(_REQUEST_LOCAL, "timing", None)
+    if st is None:
+        yield
+        return
+    # Exklusive Zeiten: eine verschachtelte Phase pausiert die äußere.
+    stack = st["stack"]
+    now = time.perf_counter()
+    if stack:
+        st[stack[-1]] = st.get(stack[-1], 0.0) + now - st["mark"]
+    stack.append(name)
+    st["mark"] = now
+    try:
+        yield
+    finally:
+        now = time.perf_counter()
+        st[name] = st.get(name, 0.0) + now - st["mark"]
+        stack.pop()
+        st["mark"] = now
+
+
+def _server_timing_header(st: dict, total: float) -> str:
+    parts = [f"{p};dur={st[p] * 1000:.2f}" for p in _SERVER_TIMING_PHASES if st.get(p)]
+    parts.append(f"total;dur={total * 1000:.2f}")
+    return ", ".join(parts)
+
+
+class _TimedJSONProvider(DefaultJSONProvider):
+    def dumps(self, obj, **kwargs):
+        with _phase("serialize"):
+            return super().dumps(obj, **kwargs)
+
+
+app.json = _TimedJSONProvider(app)
+
+
+_PROFILE_LOCK = threading.Lock()
+_PROFILE_NAME_RE = re.compile(r"^(\d+)ms_.*\.pstats$")
+
+
+def _profiles_dir(route_key: str) -> str:
+    d = os.path.join(os.path.dirname(app.config["DB_PATH"]), "profiles", route_key)
+    os.makedirs(d, exist_ok=True)
+    return d
+
+
+def _profile_wanted() -> bool:
+    token = app.config.get("PROFILE_ADMIN_TOKEN") or ""
+    sent = request.headers.get("X-Profile-Token")
+    if token and sent and hmac.compare_digest(sent, token):
+        return True
+    if not app.config.get("PROFILE_REQUESTS"):
+        return False
+    return random.random() < float(app.config.get("PROFILE_SAMPLE_RATE", 1.0))
+
+
+def _profile_keep(route_key: str, seconds: float, prof: cProfile.Profile) -> str | None:
+    # Nur die langsamsten N Requests je Route behalten; der Ordnerinhalt ist maßgeblich,
+    # damit mehrere Worker-Prozesse sich dieselbe Auswahl teilen.
+    keep = max(1, int(app.config.get("PROFILE_KEEP_PER_ROUTE", 5)))
+    ms = int(seconds * 1000)
+    d = _profiles_dir(route_key)
+    with _PROFILE_LOCK:
+        kept = []
+        for fn in os.listdir(d):
+            m = _PROFILE_NAME_RE.match(fn)
+            if m:
+                kept.append((int(m.group(1)), fn))
+        kept.sort()
+        if len(kept) >= keep and ms <= kept[0][0]:
+            return None
+        name = f"{ms:08d}ms_{int(time.time())}_{uuid.uuid4().hex[:8]}.pstats"
+        tmp = os.path.join(d, f".{name}.tmp")
+        prof.dump_stats(tmp)
+        os.replace(tmp, os.path.join(d, name))
+        kept.append((ms, name))
+        kept.sort()
+        for _ms, fn in kept[: max(0, len(kept) - keep)]:
+            try:
+                os.remove(os.path.join(d, fn))
+            except OSError:
+                pass
+    return name
+
+
 def _ensure_dirs():
     os.makedirs(app.config["VIDEO_ROOT"], exist_ok=True)
     os.makedirs(app.config["TARGET_ROOT"], exist_ok=True)
@@ -87,24 +326,151 @@ def _safe_abs_path(root: str, relpath: str | None) -> tuple[str, str]:
     return abs_path, norm
 
 
+_DB_LOCAL = threading.local()
+_DB_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-16000",
+    "PRAGMA mmap_size=67108864",
+    "PRAGMA foreign_keys=ON",
+)
+
+
+def _db_connect(path: str) -> sqlite3.Connection:
+    db = sqlite3.connect(path, timeout=30, cached_statements=256)
+    db.row_factory = sqlite3.Row
+    for pragma in _DB_PRAGMAS:
+        db.execute(pragma)
+    return db
+
+
 def _get_db():
-    db = getattr(g, "_db", None)
-    if db is None:
-        db = sqlite3.connect(app.config["DB_PATH"])
-        db.row_factory = sqlite3.Row
-        g._db = db
+    # Eine Verbindung pro Thread, über Requests hinweg wiederverwendet.
+    path = app.config["DB_PATH"]
+    db = getattr(_DB_LOCAL, "conn", None)
+    if db is None or getattr(_DB_LOCAL, "path", None) != path:
+        if db is not None:
+            try:
+                db.close()
+            except Exception:
+                pass
+        db = _db_connect(path)
+        _DB_LOCAL.conn = db
+        _DB_LOCAL.path = path
+    g._db = db
     return db
 
 
 @app.teardown_appcontext
 def _close_db(_exc):
     db = getattr(g, "_db", None)
-    if db is not None:
-        db.close()
+    if db is not None and db.in_transaction:
+        db.rollback()
 
 
-def _init_db():
-    db = _get_db()
+@app.before_request
+def _request_start():
+    _REQUEST_LOCAL.timing = {"stack": [], "mark": 0.0}
+    _REQUEST_LOCAL.profiler = None
+    if _profile_wanted():
+        prof = cProfile.Profile()
+        try:
+            prof.enable()
+            _REQUEST_LOCAL.profiler = prof
+        except ValueError:
+            # Ein anderer Profiler ist in diesem Thread bereits aktiv.
+            pass
+    _REQUEST_LOCAL.started = time.perf_counter()
+
+
+@app.after_request
+def _request_done(resp):
+    started = getattr(_REQUEST_LOCAL, "started", None)
+    if started is None:
+        return resp
+    elapsed = time.perf_counter() - started
+    prof = getattr(_REQUEST_LOCAL, "profiler", None)
+    if prof is not None:
+        prof.disable()
+    route = request.url_rule.rule if request.url_rule is not None else "unmatched"
+    _metric_observe("http_request_duration_seconds", elapsed, route=route, method=request.method)
+    _metric_inc("http_requests_total", route=route, method=request.method, status=str(resp.status_code))
+
+    st = getattr(_REQUEST_LOCAL, "timing", None)
+    if st is not None and app.config.get("SERVER_TIMING", True):
+        resp.headers["Server-Timing"] = _server_timing_header(st, elapsed)
+    if prof is not None:
+        route_key = f"{request.method}_{re.sub(r'[^A-Za-z0-9]+', '_', route).strip('_') or 'root'}"
+        try:
+            name = _profile_keep(route_key, elapsed, prof)
+        except OSError:
+            name = None
+        if name:
+            resp.headers["X-Profile-File"] = f"{route_key}/{name}"
+    return resp
+
+
+@app.teardown_request
+def _request_cleanup(_exc):
+    prof = getattr(_REQUEST_LOCAL, "profiler", None)
+    if prof is not None:
+        prof.disable()
+    _REQUEST_LOCAL.timing = None
+    _REQUEST_LOCAL.profiler = None
+    _REQUEST_LOCAL.started = None
+
+
+def _reset_after_fork():
+    # Prefork-Server (z.B. gunicorn --preload): Verbindungen, Pools und Flusher-Thread
+    # des Elternprozesses sind im Kind nicht nutzbar.
+    # Threads (Tag-Index-Build, Job-Worker) laufen im Kind nicht weiter: ihre
+    # Zustände und evtl. gehaltenen Sperren werden neu angelegt.
+    global _DB_LOCAL, _MEDIA_POOL, _THUMB_POOL, _COPY_POOL, _CATALOG_POOL, _JOB_FLUSHER_STARTED
+    global _TAG_INDEX_BUILDING, _TAG_INDEX_LOCK, _QUEUE_RENUMBER_PENDING, _QUEUE_RENUMBER_LOCK, _COPY_POOL_LOCK
+    global _DEDUPE_SCANS_LOCK, _FASTSTART_JOBS_LOCK, _CLIP_JOBS_LOCK, _MERGE_JOBS_LOCK, _MERGE_JOBS_SAVE_LOCK
+    global _SHARED_JOBS_LOCK, _EVENTS_COND, _MEDIA_TASKS_LOCK
+    _DB_LOCAL = threading.local()
+    _MEDIA_POOL = None
+    _THUMB_POOL = None
+    _COPY_POOL = None
+    _CATALOG_POOL = None
+    _JOB_FLUSHER_STARTED = False
+    _TAG_INDEX_BUILDING = False
+    _TAG_INDEX_LOCK = threading.Lock()
+    _QUEUE_RENUMBER_PENDING = False
+    _QUEUE_RENUMBER_LOCK = threading.Lock()
+    _COPY_POOL_LOCK = threading.Lock()
+    _DEDUPE_SCANS_LOCK = threading.Lock()
+    _FASTSTART_JOBS_LOCK = threading.Lock()
+    _CLIP_JOBS_LOCK = threading.Lock()
+    _MERGE_JOBS_LOCK = threading.Lock()
+    _MERGE_JOBS_SAVE_LOCK = threading.Lock()
+    _SHARED_JOBS_LOCK = threading.Lock()
+    _EVENTS_COND = threading.Condition()
+    _MEDIA_TASKS_LOCK = threading.Lock()
+    for state in (
+        _SHARED_JOBS_DIRTY,
+        _SHARED_JOBS_SAVED_AT,
+        _EVENTS_PENDING,
+        _EVENTS_SENT_AT,
+        _MEDIA_TASKS,
+        _MERGE_JOBS,
+        _MERGE_JOBS_DIRTY,
+        _MERGE_JOBS_SAVED_AT,
+        _DEDUPE_SCANS,
+        _FASTSTART_JOBS,
+        _CLIP_JOBS,
+    ):
+        state.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _migration_1_queue_items(db):
     db.execute(
         """
         CREATE TABLE IF NOT EXISTS queue_items (
@@ -119,18 +485,164 @@ def _init_db():
     )
     cols = [r[1] for r in db.execute("PRAGMA table_info(queue_items)").fetchall()]
     if "source_relpath" not in cols:
+        db.execute("ALTER TABLE queue_items ADD COLUMN source_relpath TEXT")
+
+
+def _migration_2_queue_indexes(db):
+    db.execute("CREATE INDEX IF NOT EXISTS idx_queue_items_position ON queue_items(position)")
+    db.execute("CREATE INDEX IF NOT EXISTS idx_queue_items_source_relpath ON queue_items(source_relpath)")
+
+
+def _migration_3_keyframe_index(db):
+    db.execute(
+        """
+        CREATE TABLE IF NOT EXISTS keyframe_index (
+            content_key TEXT PRIMARY KEY,
+            relpath TEXT,
+            count INTEGER NOT NULL,
+            times BLOB NOT NULL,
+            created_at TEXT NOT NULL
+        )
+        """
+    )
+
+
+def _migration_4_media_catalog(db):
+    db.execute(
+        """
+        CREATE TABLE IF NOT EXISTS media_catalog (
+            relpath TEXT PRIMARY KEY,
+            size INTEGER NOT NULL,
+            mtime_ns INTEGER NOT NULL,
+            duration REAL,
+            vcodec TEXT,
+            acodec TEXT,
+            width INTEGER,
+            height INTEGER,
+            updated_at TEXT NOT NULL
+        )
+        """
+    )
+
+
+def _migration_5_queue_transfer_state(db):
+    db.execute("ALTER TABLE queue_items ADD COLUMN state TEXT NOT NULL DEFAULT 'ready'")
+    db.execute("ALTER TABLE queue_items ADD COLUMN bytes_done INTEGER NOT NULL DEFAULT 0")
+    db.execute("ALTER TABLE queue_items ADD COLUMN bytes_total INTEGER NOT NULL DEFAULT 0")
+    db.execute("ALTER TABLE queue_items ADD COLUMN error TEXT")
+
+
+def _migration_6_file_crc(db):
+    db.execute(
+        """
+        CREATE TABLE IF NOT EXISTS file_crc (
+            content_key TEXT PRIMARY KEY,
+            crc INTEGER NOT NULL,
+            created_at TEXT NOT NULL
+        )
+        """
+    )
+
+
+def _migration_7_shared_state(db):
+    db.execute(
+        """
+        CREATE TABLE IF NOT EXISTS jobs (
+            job_id TEXT PRIMARY KEY,
+            kind TEXT NOT NULL,
+            owner TEXT,
+            data TEXT NOT NULL,
+            updated_at REAL NOT NULL
+        )
+        """
+    )
+    db.execute("CREATE INDEX IF NOT EXISTS idx_jobs_kind_updated ON jobs(kind, updated_at)")
+    db.execute(
+        """
+        CREATE TABLE IF NOT EXISTS tag_index_entries (
+            root TEXT NOT NULL,
+            relpath TEXT NOT NULL,
+            name TEXT NOT NULL,
+            tags TEXT NOT NULL,
+            PRIMARY KEY (root, relpath)
+        )
+        """
+    )
+    db.execute(
+        """
+        CREATE TABLE IF NOT EXISTS app_state (
+            key TEXT PRIMARY KEY,
+            value TEXT,
+            updated_at REAL NOT NULL
+        )
+        """
+    )
+
+
+def _migration_8_events(db):
+    db.execute(
+        """
+        CREATE TABLE IF NOT EXISTS events (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            topic TEXT NOT NULL,
+            job_id TEXT NOT NULL,
+            type TEXT NOT NULL,
+            data TEXT NOT NULL,
+            created_at REAL NOT NULL
+        )
+        """
+    )
+    db.execute("CREATE INDEX IF NOT EXISTS idx_events_created ON events(created_at)")
+
+
+def _migration_9_job_revision(db):
+    db.execute("ALTER TABLE jobs ADD COLUMN rev INTEGER NOT NULL DEFAULT 0")
+
+
+def _migration_10_transfer_owner(db):
+    db.execute("ALTER TABLE queue_items ADD COLUMN transfer_owner TEXT")
+
+
+_DB_MIGRATIONS = (
+    (1, _migration_1_queue_items),
+    (2, _migration_2_queue_indexes),
+    (3, _migration_3_keyframe_index),
+    (4, _migration_4_media_catalog),
+    (5, _migration_5_queue_transfer_state),
+    (6, _migration_6_file_crc),
+    (7, _migration_7_shared_state),
+    (8, _migration_8_events),
+    (9, _migration_9_job_revision),
+    (10, _migration_10_transfer_owner),
+)
+
+
+def _db_migrate(db):
+    for version, migrate in _DB_MIGRATIONS:
+        if db.execute("PRAGMA user_version").fetchone()[0] >= version:
+            continue
+        db.execute("BEGIN IMMEDIATE")
         try:
-            db.execute("ALTER TABLE queue_items ADD COLUMN source_relpath TEXT")
+            # Erneut prüfen: ein anderer Worker kann die Migration inzwischen ausgeführt haben.
+            if db.execute("PRAGMA user_version").fetchone()[0] < version:
+                migrate(db)
+                db.execute(f"PRAGMA user_version = {int(version)}")
+            db.commit()
         except Exception:
-            pass
-    db.commit()
+            db.rollback()
+            raise
+
+
+def _init_db():
+    _db_migrate(_get_db())
 
 
+@_phase("db")
 def _queue_get_items():
     db = _get_db()
     rows = db.execute(
         """
-        SELECT id, filename, target_relpath, added_at, position
+        SELECT id, filename, target_relpath, added_at, position, state, bytes_done, bytes_total, error
         FROM queue_items
         ORDER BY position ASC
         """
@@ -138,17 +650,118 @@ def _queue_get_items():
     return [dict(r) for r in rows]
 
 
+_QUEUE_POSITION_GAP = 1024
+_QUEUE_RENUMBER_LOCK = threading.Lock()
+_QUEUE_RENUMBER_PENDING = False
+
+
 def _queue_next_position():
     db = _get_db()
-    row = db.execute("SELECT COALESCE(MAX(position), -1) AS maxpos FROM queue_items").fetchone()
-    return int(row["maxpos"]) + 1
+    row = db.execute("SELECT position FROM queue_items ORDER BY position DESC LIMIT 1").fetchone()
+    return (int(row["position"]) if row else 0) + _QUEUE_POSITION_GAP
+
+
+def _queue_renumber_rows(db):
+    # Schreibt nur; Transaktion liegt beim Aufrufer.
+    rows = db.execute("SELECT id, position FROM queue_items ORDER BY position ASC, id ASC").fetchall()
+    updates = [
+        ((idx + 1) * _QUEUE_POSITION_GAP, r["id"])
+        for idx, r in enumerate(rows)
+        if r["position"] != (idx + 1) * _QUEUE_POSITION_GAP
+    ]
+    if updates:
+        db.executemany("UPDATE queue_items SET position = ? WHERE id = ?", updates)
+
+
+def _queue_renumber(db):
+    with db:
+        db.execute("BEGIN IMMEDIATE")
+        _queue_renumber_rows(db)
+
+
+def _queue_schedule_renumber():
+    global _QUEUE_RENUMBER_PENDING
+    with _QUEUE_RENUMBER_LOCK:
+        if _QUEUE_RENUMBER_PENDING:
+            return
+        _QUEUE_RENUMBER_PENDING = True
+
+    def _worker():
+        global _QUEUE_RENUMBER_PENDING
+        try:
+            with app.app_context():
+                _queue_renumber(_get_db())
+        except Exception:
+            pass
+        finally:
+            with _QUEUE_RENUMBER_LOCK:
+                _QUEUE_RENUMBER_PENDING = False
+
+    t = threading.Thread(target=_worker, daemon=True)
+    t.start()
+
+
+def _queue_position_between(db, item_id: int, before_id: int | None, after_id: int | None) -> int | None:
+    # Position für "vor before_id" bzw. "nach after_id"; None, wenn keine Lücke mehr frei ist.
+    if before_id is not None:
+        anchor = db.execute("SELECT position FROM queue_items WHERE id = ?", (before_id,)).fetchone()
+        if not anchor:
+            raise LookupError("anchor_not_found")
+        hi = int(anchor["position"])
+        row = db.execute(
+            "SELECT position FROM queue_items WHERE position < ? AND id != ? ORDER BY position DESC LIMIT 1",
+            (hi, item_id),
+        ).fetchone()
+        lo = int(row["position"]) if row else hi - 2 * _QUEUE_POSITION_GAP
+    else:
+        anchor = db.execute("SELECT position FROM queue_items WHERE id = ?", (after_id,)).fetchone()
+        if not anchor:
+            raise LookupError("anchor_not_found")
+        lo = int(anchor["position"])
+        row = db.execute(
+            "SELECT position FROM queue_items WHERE position > ? AND id != ? ORDER BY position ASC LIMIT 1",
+            (lo, item_id),
+        ).fetchone()
+        hi = int(row["position"]) if row else lo + 2 * _QUEUE_POSITION_GAP
+    if hi - lo < 2:
+        return None
+    return lo + (hi - lo) // 2
+
+
+def _queue_move_item(item_id: int, before_id: int | None = None, after_id: int | None = None):
+    db = _get_db()
+    # Nachbarn lesen und neue Position schreiben unter einer Schreibsperre, sonst
+    # berechnen parallele Moves denselben Mittelwert.
+    with db:
+        db.execute("BEGIN IMMEDIATE")
+        if not db.execute("SELECT 1 FROM queue_items WHERE id = ?", (item_id,)).fetchone():
+            raise LookupError("item_not_found")
+        pos = _queue_position_between(db, item_id, before_id, after_id)
+        if pos is None:
+            _queue_renumber_rows(db)
+            pos = _queue_position_between(db, item_id, before_id, after_id)
+        db.execute("UPDATE queue_items SET position = ? WHERE id = ?", (pos, item_id))
+
+    neighbors = db.execute(
+        """
+        SELECT
+            (SELECT position FROM queue_items WHERE position < ? ORDER BY position DESC LIMIT 1) AS prev_pos,
+            (SELECT position FROM queue_items WHERE position > ? ORDER BY position ASC LIMIT 1) AS next_pos
+        """,
+        (pos, pos),
+    ).fetchone()
+    gaps = [pos - neighbors["prev_pos"] if neighbors["prev_pos"] is not None else _QUEUE_POSITION_GAP]
+    gaps.append(neighbors["next_pos"] - pos if neighbors["next_pos"] is not None else _QUEUE_POSITION_GAP)
+    if min(gaps) < 8:
+        _queue_schedule_renumber()
+    return _queue_get_by_id(item_id)
 
 
 def _queue_get_by_target_relpath(target_relpath: str):
     db = _get_db()
     row = db.execute(
         """
-        SELECT id, filename, target_relpath, added_at, position
+        SELECT id, filename, target_relpath, added_at, position, state, bytes_done, bytes_total, error
         FROM queue_items
         WHERE target_relpath = ?
         """,
@@ -161,7 +774,7 @@ def _queue_get_by_source_relpath(source_relpath: str):
     db = _get_db()
     row = db.execute(
         """
-        SELECT id, filename, target_relpath, source_relpath, added_at, position
+        SELECT id, filename, target_relpath, source_relpath, added_at, position, state, bytes_done, bytes_total, error
         FROM queue_items
         WHERE source_relpath = ?
         """,
@@ -174,7 +787,7 @@ def _queue_get_by_id(item_id: int):
     db = _get_db()
     row = db.execute(
         """
-        SELECT id, filename, target_relpath, added_at, position
+        SELECT id, filename, target_relpath, added_at, position, state, bytes_done, bytes_total, error
         FROM queue_items
         WHERE id = ?
         """,
@@ -213,50 +826,800 @@ def _queue_add_item(target_relpath: str, source_relpath: str | None = None):
     return item, True
 
 
+def _queue_add_many(
+    rows: list[tuple[str, str | None]], state: str = "ready", bytes_total: list[int] | None = None
+) -> list[tuple[dict | None, bool, str | None]]:
+    # Alle Zeilen in einer Transaktion; Ergebnis pro Zeile: (item, created, error_code).
+    db = _get_db()
+    results = []
+    added_at = _utc_now_iso()
+    with db:
+        db.execute("BEGIN IMMEDIATE")
+        pos = _queue_next_position()
+        for idx, (target_relpath, source_relpath) in enumerate(rows):
+            existing = _queue_get_by_target_relpath(target_relpath)
+            if existing:
+                results.append((existing, False, None))
+                continue
+            total = int(bytes_total[idx]) if bytes_total else 0
+            try:
+                db.execute(
+                    """
+                    INSERT INTO queue_items
+                        (target_relpath, source_relpath, filename, position, added_at, state, bytes_done, bytes_total,
+                         transfer_owner)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        target_relpath,
+                        source_relpath,
+                        os.path.basename(target_relpath),
+                        pos,
+                        added_at,
+                        state,
+                        total if state == "ready" else 0,
+                        total,
+                        _process_owner() if state == "copying" else None,
+                    ),
+                )
+            except sqlite3.IntegrityError:
+                results.append((None, False, "duplicate"))
+                continue
+            pos += _QUEUE_POSITION_GAP
+            results.append((_queue_get_by_target_relpath(target_relpath), True, None))
+    return results
+
+
+_COPY_POOL = None
+_COPY_POOL_LOCK = threading.Lock()
+_COPY_CHUNK_BYTES = 64 * 1024 * 1024
+_COPY_PROGRESS_INTERVAL = 1.0
+
+
+def _copy_pool() -> ThreadPoolExecutor:
+    global _COPY_POOL
+    with _COPY_POOL_LOCK:
+        if _COPY_POOL is None:
+            _COPY_POOL = ThreadPoolExecutor(
+                max_workers=max(1, int(app.config.get("TRANSFER_WORKERS", 4))), thread_name_prefix="copy"
+            )
+        return _COPY_POOL
+
+
+def _copy_file_kernel(src_abs: str, dst_abs: str, on_progress=None):
+    # Kopiert im Kernel (copy_file_range, sonst sendfile), fällt auf read/write zurück.
+    with open(src_abs, "rb") as fsrc, open(dst_abs, "wb") as fdst:
+        total = os.fstat(fsrc.fileno()).st_size
+        done = 0
+        _fadvise_range(fsrc.fileno(), 0, total)
+        methods = [m for m in ("copy_file_range", "sendfile") if hasattr(os, m)]
+        while done < total:
+            n = 0
+            while methods:
+                try:
+                    if methods[0] == "copy_file_range":
+                        n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), min(_COPY_CHUNK_BYTES, total - done))
+                    else:
+                        n = os.sendfile(fdst.fileno(), fsrc.fileno(), done, min(_COPY_CHUNK_BYTES, total - done))
+                    break
+                except OSError:
+                    methods.pop(0)
+                    fsrc.seek(done)
+                    fdst.seek(done)
+            if not methods:
+                chunk = fsrc.read(min(_RANGE_CHUNK_BYTES, total - done))
+                n = len(chunk)
+                fdst.write(chunk)
+            if n <= 0:
+                break
+            done += n
+            if on_progress is not None:
+                on_progress(done, total)
+        if done < total:
+            raise IOError(f"Kopie unvollständig: {done} von {total} Bytes")
+    shutil.copystat(src_abs, dst_abs)
+
+
+def _queue_part_path(target_abs: str) -> str:
+    d, base = os.path.split(target_abs)
+    return os.path.join(d, f".{base}.part")
+
+
+def _queue_submit_transfer(item_id: int, src_abs: str, target_abs: str, mode: str):
+    # Die .part-Datei markiert einen laufenden oder wartenden Transfer (siehe _queue_recover_transfers).
+    with open(_queue_part_path(target_abs), "wb"):
+        pass
+    _copy_pool().submit(_queue_transfer_worker, item_id, src_abs, target_abs, mode)
+
+
+def _queue_transfer_worker(item_id: int, src_abs: str, target_abs: str, mode: str):
+    with app.app_context():
+        db = _get_db()
+        tmp = _queue_part_path(target_abs)
+        last = [0.0]
+        placed = False
+
+        class _Cancelled(Exception):
+            pass
+
+        def _progress(done: int, total: int):
+            now = time.time()
+            if now - last[0] < _COPY_PROGRESS_INTERVAL and done < total:
+                return
+            last[0] = now
+            with db:
+                cur = db.execute("UPDATE queue_items SET bytes_done = ? WHERE id = ?", (done, item_id))
+            if cur.rowcount == 0:
+                raise _Cancelled()
+            _event_publish(
+                "transfer", item_id, "progress", {"id": item_id, "state": "copying", "bytes_done": done, "bytes_total": total}
+            )
+
+        # True, solange target_abs die einzige Kopie des Videos ist (Move ohne
+        # erfolgreiches Zurückschieben); dann darf target_abs nie gelöscht werden.
+        holds_source = False
+
+        def _drop_placeholder():
+            # Nur den leeren Platzhalter aus _queue_reserve_target entfernen.
+            if holds_source or placed:
+                return
+            try:
+                if os.path.getsize(target_abs) == 0:
+                    os.remove(target_abs)
+            except OSError:
+                pass
+
+        def _mark_error(message: str):
+            with db:
+                db.execute("UPDATE queue_items SET state = 'error', error = ? WHERE id = ?", (message, item_id))
+            _event_publish("transfer", item_id, "error", {"id": item_id, "state": "error", "error": message})
+
+        try:
+            if mode == "move":
+                try:
+                    os.replace(src_abs, target_abs)
+                except OSError:
+                    pass
+                else:
+                    holds_source = True
+                    try:
+                        size = os.path.getsize(target_abs)
+                        with db:
+                            cur = db.execute(
+                                "UPDATE queue_items SET state = 'ready', bytes_done = ?, bytes_total = ? WHERE id = ?",
+                                (size, size, item_id),
+                            )
+                        if cur.rowcount == 0:
+                            raise _Cancelled()
+                    except BaseException:
+                        # Ohne passenden Queue-Eintrag wäre die Datei im Ziel verwaist:
+                        # zurück an die Quelle. Scheitert das, bleibt sie im Ziel.
+                        try:
+                            os.replace(target_abs, src_abs)
+                            holds_source = False
+                        except OSError:
+                            pass
+                        raise
+                    holds_source = False
+                    placed = True
+                    _event_publish("transfer", item_id, "done", {"id": item_id, "state": "ready"})
+                    return
+            _copy_file_kernel(src_abs, tmp, _progress)
+            with db:
+                cur = db.execute(
+                    "UPDATE queue_items SET state = 'ready', bytes_done = bytes_total, error = NULL WHERE id = ?",
+                    (item_id,),
+                )
+                if cur.rowcount == 0:
+                    raise _Cancelled()
+                os.replace(tmp, target_abs)
+            placed = True
+        except _Cancelled:
+            if holds_source:
+                _mark_error(f"Verschieben abgebrochen, Datei liegt weiterhin unter {target_abs}.")
+            _drop_placeholder()
+            return
+        except Exception as e:
+            _drop_placeholder()
+            message = str(e)[-500:]
+            if holds_source:
+                message = f"{message} – Datei liegt unter {target_abs}."[-500:]
+            _mark_error(message)
+            return
+        finally:
+            try:
+                os.remove(tmp)
+            except FileNotFoundError:
+                pass
+
+        if mode == "move":
+            # Die Kopie ist fertig und der Eintrag "ready"; ein Fehler beim Löschen
+            # der Quelle macht den Transfer nicht rückgängig.
+            try:
+                os.remove(src_abs)
+            except OSError as e:
+                warning = f"Quelle konnte nicht gelöscht werden: {e}"[-500:]
+                with db:
+                    db.execute("UPDATE queue_items SET error = ? WHERE id = ?", (warning, item_id))
+                _event_publish("transfer", item_id, "done", {"id": item_id, "state": "ready", "warning": warning})
+                return
+        _event_publish("transfer", item_id, "done", {"id": item_id, "state": "ready"})
+
+
+def _queue_reserve_target(dir_abs: str, filename: str) -> str:
+    # Legt einen leeren Platzhalter an, damit parallele Transfers keinen Namen doppelt vergeben.
+    while True:
+        name = _unique_destination_filename(dir_abs, filename)
+        try:
+            fd = os.open(os.path.join(dir_abs, name), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        except FileExistsError:
+            continue
+        os.close(fd)
+        return name
+
+
+def _queue_recover_transfers():
+    # Nur Einträge, deren Prozess nicht mehr läuft, sind verwaist; Transfers anderer
+    # lebender Worker (auch wartende im Pool) bleiben unberührt.
+    db = _get_db()
+    rows = db.execute(
+        "SELECT id, target_relpath, transfer_owner FROM queue_items WHERE state = 'copying'"
+    ).fetchall()
+    stale = []
+    for r in rows:
+        try:
+            target_abs, _ = _safe_abs_path(app.config["TARGET_ROOT"], r["target_relpath"])
+        except ValueError:
+            continue
+        part = _queue_part_path(target_abs)
+        try:
+            part_mtime = os.path.getmtime(part)
+        except OSError:
+            part_mtime = None
+        if r["transfer_owner"]:
+            if _owner_alive(r["transfer_owner"], part_mtime or 0.0):
+                continue
+        elif part_mtime is not None and time.time() - part_mtime <= 3600:
+            # Einträge von vor der Owner-Spalte: wie bisher nach Alter der .part-Datei.
+            continue
+        stale.append((r["id"],))
+        try:
+            os.remove(part)
+        except OSError:
+            pass
+        try:
+            if os.path.getsize(target_abs) == 0:
+                os.remove(target_abs)
+        except OSError:
+            pass
+    if stale:
+        with db:
+            db.executemany(
+                "UPDATE queue_items SET state = 'error', error = 'Server wurde während des Kopierens neu gestartet.' "
+                "WHERE id = ? AND state = 'copying'",
+                stale,
+            )
+
+
+def _queue_not_ready(items: list[dict]):
+    pending = [it for it in items if (it.get("state") or "ready") != "ready"]
+    if not pending:
+        return None
+    return _json_error(
+        "Queue enthält noch nicht fertig kopierte Dateien.",
+        409,
+        code="items_not_ready",
+        details={"ids": [it["id"] for it in pending]},
+    )
+
+
 _TAG_INDEX_CACHE = {}
 _TAG_INDEX_LOCK = threading.Lock()
 _TAG_INDEX_BUILDING = False
-_TAG_INDEX_LAST_ERROR = None
+_TAG_INDEX_MAX_AGE_SECONDS = 30.0
 
 
 _MERGE_JOBS = {}
 
 _DEDUPE_SCANS = {}
 _DEDUPE_SCANS_LOCK = threading.Lock()
+
+_FASTSTART_JOBS = {}
+_FASTSTART_JOBS_LOCK = threading.Lock()
+
+_CLIP_JOBS = {}
+_CLIP_JOBS_LOCK = threading.Lock()
+_CLIP_RESERVATION_MAX_AGE_SECONDS = 6 * 3600
 _MERGE_JOBS_LOCK = threading.Lock()
+_MERGE_JOBS_SAVE_LOCK = threading.Lock()
+_MERGE_JOBS_DIRTY = set()
+_MERGE_JOBS_SAVED_AT = {}
+_JOB_FLUSHER_STARTED = False
+_MERGE_JOB_SAVE_INTERVAL = 1.0
+_MERGE_JOB_PERSIST_NOW_KEYS = {"status", "phase"}
 
+_SHARED_JOBS_LOCK = threading.Lock()
+_SHARED_JOBS_DIRTY = {}
+_SHARED_JOBS_SAVED_AT = {}
 
-def _merge_jobs_dir() -> str:
-    d = os.path.join(os.path.dirname(app.config["DB_PATH"]), "merge_jobs")
+
+def _process_owner() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _owner_alive(owner: str | None, updated_at: float) -> bool:
+    # Läuft der Prozess, der einen Job als "running" gespeichert hat, noch?
+    if not owner or not isinstance(owner, str):
+        return False
+    host, _, pid = owner.rpartition(":")
+    if host != socket.gethostname():
+        return time.time() - float(updated_at or 0) < 3600
+    try:
+        os.kill(int(pid), 0)
+    except (ProcessLookupError, ValueError):
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _locks_dir() -> str:
+    d = os.path.join(os.path.dirname(app.config["DB_PATH"]), "locks")
     os.makedirs(d, exist_ok=True)
     return d
 
 
-def _merge_job_state_path(job_id: str) -> str:
-    return os.path.join(_merge_jobs_dir(), f"job_{job_id}.json")
+def _leader_lock_acquire(name: str, blocking: bool = False) -> int | None:
+    # Dateisperre über alle Worker-Prozesse; wird beim Prozessende vom Kernel freigegeben.
+    if fcntl is None:
+        return -1
+    fd = os.open(os.path.join(_locks_dir(), f"{name}.lock"), os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        os.close(fd)
+        return None
+    return fd
 
 
-def _merge_job_save(job_id: str, job: dict):
+def _leader_lock_release(fd: int | None):
+    if fd is None or fd < 0:
+        return
     try:
-        p = _merge_job_state_path(job_id)
-        tmp = p + ".tmp"
-        with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(job, f)
-        os.replace(tmp, p)
-    except Exception:
-        pass
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+def _leader_lock_busy(name: str) -> bool:
+    fd = _leader_lock_acquire(name)
+    if fd is None:
+        return True
+    _leader_lock_release(fd)
+    return False
+
+
+@_phase("db")
+def _app_state_get(key: str, default=None):
+    with app.app_context():
+        row = _get_db().execute("SELECT value FROM app_state WHERE key = ?", (key,)).fetchone()
+    if not row or row["value"] is None:
+        return default
+    return json.loads(row["value"])
+
+
+def _app_state_set(key: str, value):
+    with app.app_context():
+        db = _get_db()
+        with db:
+            db.execute(
+                "INSERT OR REPLACE INTO app_state (key, value, updated_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value), time.time()),
+            )
 
 
-def _merge_job_load(job_id: str) -> dict | None:
+def _shared_job_write(kind: str, job_id: str, payload: str):
+    # Snapshots können außer der Reihe ankommen (Flusher vs. erzwungener
+    # Endstand, anderer Worker); ein älterer Stand überschreibt nie einen neueren.
+    rev = int(json.loads(payload).get("rev") or 0)
     try:
-        p = _merge_job_state_path(job_id)
-        if not os.path.isfile(p):
+        with app.app_context():
+            db = _get_db()
+            with db:
+                db.execute(
+                    """
+                    INSERT INTO jobs (job_id, kind, owner, data, updated_at, rev) VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(job_id) DO UPDATE SET
+                        kind = excluded.kind,
+                        owner = excluded.owner,
+                        data = excluded.data,
+                        updated_at = excluded.updated_at,
+                        rev = excluded.rev
+                    WHERE excluded.rev >= jobs.rev
+                    """,
+                    (job_id, kind, _process_owner(), payload, time.time(), rev),
+                )
+    except sqlite3.Error:
+        pass
+
+
+def _shared_job_mark(kind: str, job_id: str, job: dict, lock, force: bool = False) -> str | None:
+    # Aufruf mit gehaltenem `lock`. Liefert den sofort zu schreibenden Snapshot oder
+    # merkt den Job für den Flusher vor (max. ein Schreibvorgang pro Sekunde und Job).
+    now = time.time()
+    key = (kind, job_id)
+    job["rev"] = int(job.get("rev") or 0) + 1
+    with _SHARED_JOBS_LOCK:
+        if not force and now - _SHARED_JOBS_SAVED_AT.get(key, 0.0) < _MERGE_JOB_SAVE_INTERVAL:
+            _SHARED_JOBS_DIRTY[key] = (job, lock)
             return None
-        with open(p, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return data if isinstance(data, dict) else None
-    except Exception:
+        _SHARED_JOBS_DIRTY.pop(key, None)
+        if job.get("status") == "running":
+            _SHARED_JOBS_SAVED_AT[key] = now
+        else:
+            _SHARED_JOBS_SAVED_AT.pop(key, None)
+    return json.dumps(job)
+
+
+def _shared_job_flush():
+    now = time.time()
+    with _SHARED_JOBS_LOCK:
+        due = [
+            (key, entry)
+            for key, entry in _SHARED_JOBS_DIRTY.items()
+            if now - _SHARED_JOBS_SAVED_AT.get(key, 0.0) >= _MERGE_JOB_SAVE_INTERVAL
+        ]
+        for key, _entry in due:
+            _SHARED_JOBS_DIRTY.pop(key, None)
+            _SHARED_JOBS_SAVED_AT[key] = now
+    for (kind, job_id), (job, lock) in due:
+        with lock:
+            payload = json.dumps(job)
+        _shared_job_write(kind, job_id, payload)
+
+
+def _job_mark_owner_dead(job: dict):
+    # Gemeinsamer Endzustand für Jobs, deren Worker-Prozess nicht mehr lebt (Clip, Faststart, Scan, Merge).
+    msg = "Server wurde während des Jobs neu gestartet."
+    job.update(status="error", phase="Fehler", message=msg, error=msg)
+    job.setdefault("finished_at", time.time())
+
+
+def _shared_job_load(kind: str, job_id: str) -> dict | None:
+    with app.app_context():
+        row = _get_db().execute(
+            "SELECT owner, data, updated_at FROM jobs WHERE job_id = ? AND kind = ?", (job_id, kind)
+        ).fetchone()
+    if not row:
         return None
+    job = json.loads(row["data"])
+    if job.get("status") == "running" and not _owner_alive(row["owner"], row["updated_at"]):
+        _job_mark_owner_dead(job)
+        job["rev"] = int(job.get("rev") or 0) + 1
+        _shared_job_write(kind, job_id, json.dumps(job))
+    return job
+
+
+_EVENTS_COND = threading.Condition()
+_EVENTS_PENDING = {}
+_EVENTS_SENT_AT = {}
+_EVENT_PROGRESS_INTERVAL = 0.25
+_EVENT_FINAL_TYPES = ("done", "error")
+
+
+def _event_write(topic: str, job_id: str, type_: str, data: dict):
+    try:
+        with app.app_context():
+            db = _get_db()
+            with db:
+                db.execute(
+                    "INSERT INTO events (topic, job_id, type, data, created_at) VALUES (?, ?, ?, ?, ?)",
+                    (topic, str(job_id), type_, json.dumps(data), time.time()),
+                )
+    except sqlite3.Error:
+        return
+    with _EVENTS_COND:
+        _EVENTS_COND.notify_all()
+
+
+def _event_publish(topic: str, job_id, type_: str, data: dict, coalesce: bool = False):
+    # Fortschritt wird auf max. 4 Events/s je Job zusammengefasst; der letzte Stand
+    # geht spätestens mit dem nächsten Flusher-Durchlauf raus.
+    now = time.time()
+    key = (topic, str(job_id), type_)
+    with _EVENTS_COND:
+        if coalesce and now - _EVENTS_SENT_AT.get(key, 0.0) < _EVENT_PROGRESS_INTERVAL:
+            _EVENTS_PENDING[key] = data
+            pending = True
+        else:
+            pending = False
+            _EVENTS_PENDING.pop(key, None)
+            if type_ in _EVENT_FINAL_TYPES:
+                for k in [k for k in _EVENTS_PENDING if k[:2] == key[:2]]:
+                    _EVENTS_PENDING.pop(k, None)
+                for k in [k for k in _EVENTS_SENT_AT if k[:2] == key[:2]]:
+                    _EVENTS_SENT_AT.pop(k, None)
+            elif coalesce:
+                _EVENTS_SENT_AT[key] = now
+    if pending:
+        _start_job_flusher()
+        return
+    _event_write(topic, str(job_id), type_, data)
+
+
+def _events_flush():
+    now = time.time()
+    with _EVENTS_COND:
+        due = [
+            (key, data)
+            for key, data in _EVENTS_PENDING.items()
+            if now - _EVENTS_SENT_AT.get(key, 0.0) >= _EVENT_PROGRESS_INTERVAL
+        ]
+        for key, _data in due:
+            _EVENTS_PENDING.pop(key, None)
+            _EVENTS_SENT_AT[key] = now
+    for (topic, job_id, type_), data in due:
+        _event_write(topic, job_id, type_, data)
+
+
+def _events_prune():
+    max_age = float(app.config.get("EVENTS_RETENTION_SECONDS", 3600) or 0)
+    if max_age <= 0:
+        return
+    db = _get_db()
+    with db:
+        db.execute("DELETE FROM events WHERE created_at < ?", (time.time() - max_age,))
+
+
+def _shared_job_get(kind: str, job_id: str, jobs: dict, lock) -> dict | None:
+    # Eigene laufende Jobs aus dem Speicher (nur dieser Prozess schreibt sie);
+    # beendete Jobs aus der gemeinsamen Tabelle, weil andere Worker sie danach
+    # noch ändern können (z.B. Dubletten verschieben).
+    with lock:
+        st = jobs.get(job_id)
+        if st is not None and st.get("status") == "running":
+            return json.loads(json.dumps(st))
+        local = json.loads(json.dumps(st)) if st is not None else None
+    try:
+        shared = _shared_job_load(kind, job_id)
+    except sqlite3.Error:
+        shared = None
+    if shared is None or (local is not None and int(local.get("rev") or 0) > int(shared.get("rev") or 0)):
+        return local
+    if local is not None:
+        with lock:
+            if job_id in jobs and int(jobs[job_id].get("rev") or 0) <= int(shared.get("rev") or 0):
+                jobs[job_id] = json.loads(json.dumps(shared))
+    return shared
+
+
+def _merge_jobs_dir() -> str:
+    d = os.path.join(os.path.dirname(app.config["DB_PATH"]), "merge_jobs")
+    os.makedirs(d, exist_ok=True)
+    return d
+
+
+def _merge_job_state_path(job_id: str) -> str:
+    return os.path.join(_merge_jobs_dir(), f"job_{job_id}.json")
+
+
+def _merge_job_save(job_id: str, job: dict):
+    try:
+        p = _merge_job_state_path(job_id)
+        tmp = p + ".tmp"
+        with _MERGE_JOBS_SAVE_LOCK:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(job, f)
+            os.replace(tmp, p)
+    except Exception:
+        pass
+
+
+def _merge_job_load(job_id: str) -> dict | None:
+    try:
+        p = _merge_job_state_path(job_id)
+        if not os.path.isfile(p):
+            return None
+        with open(p, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else None
+    except Exception:
+        return None
+
+
+_MERGE_JANITOR_STARTED = False
+
+
+def _dir_size_bytes(dir_abs: str) -> int:
+    total = 0
+    for dirpath, _dirnames, filenames in os.walk(dir_abs):
+        for fn in filenames:
+            try:
+                total += os.path.getsize(os.path.join(dirpath, fn))
+            except OSError:
+                continue
+    return total
+
+
+def _merge_job_last_used(job: dict) -> float:
+    for k in ("downloaded_at", "finished_at", "created_at"):
+        v = job.get(k)
+        if isinstance(v, (int, float)) and v > 0:
+            return float(v)
+    return 0.0
+
+
+def _merge_job_expire(job_id: str, job: dict, reason: str):
+    out_abs = job.get("output_abs")
+    if out_abs and isinstance(out_abs, str):
+        try:
+            os.remove(out_abs)
+        except FileNotFoundError:
+            pass
+    out_dir = job.get("output_dir")
+    if out_dir and isinstance(out_dir, str):
+        shutil.rmtree(out_dir, ignore_errors=True)
+    fields = {
+        "output_abs": None,
+        "output_dir": None,
+        "expired": True,
+        "expired_at": time.time(),
+        "expired_reason": reason,
+    }
+    with _MERGE_JOBS_LOCK:
+        mem = _MERGE_JOBS.get(job_id)
+        if mem is not None:
+            mem.update(fields)
+        job.update(fields)
+        _merge_job_save(job_id, job)
+
+
+def _merge_janitor_run_once():
+    now = time.time()
+    max_age = float(app.config.get("MERGE_RETENTION_MAX_AGE_SECONDS", 0) or 0)
+    max_bytes = int(app.config.get("MERGE_RETENTION_MAX_BYTES", 0) or 0)
+    keep_last = int(app.config.get("MERGE_RETENTION_KEEP_LAST", 0) or 0)
+    state_max_age = float(app.config.get("MERGE_JOB_STATE_MAX_AGE_SECONDS", 0) or 0)
+    jobs_dir = _merge_jobs_dir()
+
+    jobs: dict[str, dict] = {}
+    try:
+        names = os.listdir(jobs_dir)
+    except Exception:
+        names = []
+    for fn in names:
+        if fn.startswith("job_") and fn.endswith(".json"):
+            job_id = fn[len("job_") : -len(".json")]
+            job = _merge_job_load(job_id)
+            if job:
+                jobs[job_id] = job
+    with _MERGE_JOBS_LOCK:
+        # Die Statusdatei ist maßgeblich; andere Worker schreiben z.B. downloaded_at hinein.
+        for job_id, job in _MERGE_JOBS.items():
+            if job_id in _MERGE_JOBS_DIRTY or job.get("status") == "running":
+                jobs[job_id] = dict(job)
+    running = set()
+    for job_id, job in jobs.items():
+        if job.get("status") != "running":
+            continue
+        try:
+            saved_at = os.path.getmtime(_merge_job_state_path(job_id))
+        except OSError:
+            saved_at = 0.0
+        if _owner_alive(job.get("owner"), saved_at):
+            running.add(job_id)
+
+    outputs = []
+    for job_id, job in jobs.items():
+        if job.get("status") != "done" or job.get("expired"):
+            continue
+        out_abs = job.get("output_abs")
+        out_dir = job.get("output_dir")
+        if out_abs and isinstance(out_abs, str) and os.path.isfile(out_abs):
+            try:
+                size = os.path.getsize(out_abs)
+            except OSError:
+                continue
+        elif out_dir and isinstance(out_dir, str) and os.path.isdir(out_dir):
+            size = _dir_size_bytes(out_dir)
+        else:
+            continue
+        outputs.append((_merge_job_last_used(job), size, job_id, job))
+
+    outputs.sort(key=lambda x: x[0], reverse=True)
+    used_bytes = 0
+    for rank, (last_used, size, job_id, job) in enumerate(outputs):
+        reason = None
+        if keep_last > 0 and rank >= keep_last:
+            reason = "keep_last"
+        elif max_age > 0 and now - last_used > max_age:
+            reason = "max_age"
+        elif max_bytes > 0 and used_bytes + size > max_bytes:
+            reason = "max_bytes"
+        if reason:
+            _merge_job_expire(job_id, job, reason)
+        else:
+            used_bytes += size
+
+    for job_id, job in jobs.items():
+        if job_id in running:
+            continue
+        finished_at = job.get("finished_at") or job.get("created_at") or 0
+        if state_max_age > 0 and now - float(finished_at) > state_max_age:
+            if (job.get("output_abs") or job.get("output_dir")) and not job.get("expired"):
+                _merge_job_expire(job_id, job, "max_age")
+            try:
+                os.remove(_merge_job_state_path(job_id))
+            except FileNotFoundError:
+                pass
+            with _MERGE_JOBS_LOCK:
+                _MERGE_JOBS.pop(job_id, None)
+                _MERGE_JOBS_SAVED_AT.pop(job_id, None)
+        elif now - float(finished_at) > 3600:
+            with _MERGE_JOBS_LOCK:
+                if job_id not in _MERGE_JOBS_DIRTY:
+                    _MERGE_JOBS.pop(job_id, None)
+                    _MERGE_JOBS_SAVED_AT.pop(job_id, None)
+
+    for fn in names:
+        p = os.path.join(jobs_dir, fn)
+        job_id = None
+        if fn.startswith("merged_") and fn.endswith(".mp4"):
+            job_id = fn[len("merged_") : -len(".mp4")]
+        elif fn.startswith("chunks_"):
+            job_id = fn[len("chunks_") :].rsplit("_", 1)[0]
+        elif fn.startswith("hls_"):
+            job_id = fn[len("hls_") :]
+        if job_id is None or job_id in running:
+            continue
+        job = jobs.get(job_id)
+        if job and p in (job.get("output_abs"), job.get("output_dir")):
+            continue
+        try:
+            if now - os.path.getmtime(p) < 3600:
+                continue
+            if os.path.isdir(p):
+                shutil.rmtree(p, ignore_errors=True)
+            else:
+                os.remove(p)
+        except FileNotFoundError:
+            pass
+
+
+def _shared_jobs_prune():
+    max_age = float(app.config.get("MERGE_JOB_STATE_MAX_AGE_SECONDS", 0) or 0)
+    if max_age <= 0:
+        return
+    db = _get_db()
+    with db:
+        db.execute("DELETE FROM jobs WHERE updated_at < ?", (time.time() - max_age,))
+
+
+def _start_merge_janitor():
+    global _MERGE_JANITOR_STARTED
+    with _MERGE_JOBS_LOCK:
+        if _MERGE_JANITOR_STARTED:
+            return
+        _MERGE_JANITOR_STARTED = True
+
+    def _worker():
+        # Nur ein Prozess räumt auf; stirbt er, übernimmt der nächste beim folgenden Versuch.
+        lock_fd = None
+        while True:
+            if lock_fd is None:
+                lock_fd = _leader_lock_acquire("janitor")
+            if lock_fd is not None:
+                try:
+                    with app.app_context():
+                        _merge_janitor_run_once()
+                        _shared_jobs_prune()
+                        _events_prune()
+                except Exception:
+                    pass
+            time.sleep(max(10.0, float(app.config.get("MERGE_JANITOR_INTERVAL_SECONDS", 300))))
+
+    t = threading.Thread(target=_worker, daemon=True)
+    t.start()
 
 
 def _ffprobe_duration_seconds(abs_path: str) -> float:
@@ -274,39 +1637,454 @@ def _ffprobe_duration_seconds(abs_path: str) -> float:
         abs_path,
     ]
     try:
-        out = subprocess.check_output(cmd, text=True).strip()
+        out = _tool_output(cmd, text=True).strip()
         return float(out)
     except Exception:
         return 0.0
 
 
 def _merge_job_update(job_id: str, **kwargs):
+    now = time.time()
     with _MERGE_JOBS_LOCK:
         job = _MERGE_JOBS.get(job_id)
-        if not job:
-            return
+    if not job:
+        # Job eines anderen Workers: nur abgeschlossene Jobs direkt in der Datei ändern
+        job = _merge_job_load(job_id)
+        if job and job.get("status") != "running":
+            job.update(kwargs)
+            _merge_job_save(job_id, job)
+        return
+    with _MERGE_JOBS_LOCK:
+        persist_now = any(
+            k not in ("progress_pct", "message") and (k not in _MERGE_JOB_PERSIST_NOW_KEYS or job.get(k) != v)
+            for k, v in kwargs.items()
+        )
+        phase_changed = "phase" in kwargs and job.get("phase") != kwargs["phase"]
         job.update(kwargs)
+        snapshot = dict(job)
+        if not persist_now and now - _MERGE_JOBS_SAVED_AT.get(job_id, 0.0) < _MERGE_JOB_SAVE_INTERVAL:
+            _MERGE_JOBS_DIRTY.add(job_id)
+            snapshot_due = False
+        else:
+            _MERGE_JOBS_DIRTY.discard(job_id)
+            _MERGE_JOBS_SAVED_AT[job_id] = now
+            snapshot_due = True
+    if snapshot_due:
+        _merge_job_save(job_id, snapshot)
+    if set(kwargs) - {"downloaded_at"}:
+        status = snapshot.get("status")
+        event_type = status if status in _EVENT_FINAL_TYPES else ("phase" if phase_changed else "progress")
+        _event_publish("merge", job_id, event_type, _merge_status_payload(job_id, snapshot), coalesce=event_type == "progress")
+
+
+def _merge_job_flush():
+    now = time.time()
+    with _MERGE_JOBS_LOCK:
+        pending = []
+        for job_id in list(_MERGE_JOBS_DIRTY):
+            job = _MERGE_JOBS.get(job_id)
+            if job is None:
+                _MERGE_JOBS_DIRTY.discard(job_id)
+                continue
+            if now - _MERGE_JOBS_SAVED_AT.get(job_id, 0.0) < _MERGE_JOB_SAVE_INTERVAL:
+                continue
+            _MERGE_JOBS_DIRTY.discard(job_id)
+            _MERGE_JOBS_SAVED_AT[job_id] = now
+            pending.append((job_id, dict(job)))
+    for job_id, snapshot in pending:
+        _merge_job_save(job_id, snapshot)
+
+
+def _start_job_flusher():
+    global _JOB_FLUSHER_STARTED
+    with _MERGE_JOBS_LOCK:
+        if _JOB_FLUSHER_STARTED:
+            return
+        _JOB_FLUSHER_STARTED = True
+
+    def _worker():
+        while True:
+            time.sleep(_MERGE_JOB_SAVE_INTERVAL / 2)
+            try:
+                _merge_job_flush()
+                _shared_job_flush()
+                _events_flush()
+            except Exception:
+                pass
+
+    t = threading.Thread(target=_worker, daemon=True)
+    t.start()
+
+
+def _merge_job_get(job_id: str) -> dict | None:
+    with _MERGE_JOBS_LOCK:
+        job = _MERGE_JOBS.get(job_id)
+        if job is not None:
+            return dict(job)
+
+    # Nicht im Speicher: Job eines anderen Workers oder aus einem früheren Prozess.
+    # Bewusst nicht cachen, die Statusdatei bleibt maßgeblich.
+    job = _merge_job_load(job_id)
+    if not job:
+        return None
+    if job.get("status") == "running":
+        try:
+            saved_at = os.path.getmtime(_merge_job_state_path(job_id))
+        except OSError:
+            saved_at = 0.0
+        if _owner_alive(job.get("owner"), saved_at):
+            return job
+        _job_mark_owner_dead(job)
         _merge_job_save(job_id, job)
+    return job
+
+
+def _run_ffmpeg_progress(cmd: list[str], on_progress=None, abort: threading.Event | None = None):
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        cmd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+    )
+
+    out_time_ms = 0
+    tail = []
+    tail_limit = 200
+    if proc.stdout:
+        for line in proc.stdout:
+            if abort is not None and abort.is_set():
+                proc.kill()
+                break
+            line = line.strip()
+            if not line:
+                continue
+            if "=" not in line:
+                tail.append(line)
+                if len(tail) > tail_limit:
+                    tail = tail[-tail_limit:]
+                continue
+            k, v = line.split("=", 1)
+            if k == "out_time_ms":
+                try:
+                    out_time_ms = int(v)
+                except Exception:
+                    out_time_ms = out_time_ms
+                if on_progress is not None:
+                    on_progress(out_time_ms / 1_000_000)
+            elif k == "progress" and v == "end":
+                break
+
+    rc = proc.wait()
+    _metric_tool(cmd, started, rc == 0)
+    if abort is not None and abort.is_set():
+        raise RuntimeError("ffmpeg abgebrochen")
+    if rc != 0:
+        stderr = "\n".join(tail).strip()
+        raise RuntimeError(stderr or f"ffmpeg exit {rc}")
+
+
+def _write_concat_list(list_path: str, abs_paths: list[str]):
+    with open(list_path, "w", encoding="utf-8") as f:
+        for p in abs_paths:
+            p_escaped = p.replace("'", "\\'")
+            f.write(f"file '{p_escaped}'\n")
+
+
+def _merge_encode_args(threads: int | None = None, audio: bool = True) -> list[str]:
+    args = [
+        "-c:v",
+        "libx264",
+        "-preset",
+        "medium",
+        "-crf",
+        "24",
+        "-pix_fmt",
+        "yuv420p",
+    ]
+    if threads:
+        args += ["-threads", str(threads)]
+    if audio:
+        args += _MERGE_AUDIO_ARGS
+    return args
+
+
+_MERGE_AUDIO_ARGS = ["-c:a", "aac", "-b:a", "128k"]
+_MERGE_AUDIO_RATE = 48000
+
+
+def _merge_plan_chunks(abs_paths: list[str], durations: list[float], chunk_seconds: float) -> list[dict]:
+    chunks = []
+    for abs_p, dur in zip(abs_paths, durations):
+        # Jeder Teil bekommt eine feste Länge, damit die Video-Teile einer Quelle
+        # zusammen genau so lang sind wie ihre separat kodierte Tonspur.
+        if dur <= 0 or chunk_seconds <= 0 or dur <= chunk_seconds * 1.5:
+            chunks.append({"src": abs_p, "start": 0.0, "duration": dur if dur > 0 else None, "seconds": max(0.0, dur)})
+            continue
+        n = int(math.ceil(dur / chunk_seconds))
+        step = dur / n
+        for k in range(n):
+            start = k * step
+            last = k == n - 1
+            chunks.append(
+                {
+                    "src": abs_p,
+                    "start": start,
+                    "duration": dur - start if last else step,
+                    "seconds": dur - start if last else step,
+                }
+            )
+    return chunks
+
+
+def _merge_chunk_video_filter(abs_paths: list[str]) -> list[str]:
+    # Alle Teile auf Auflösung und SAR der ersten Quelle bringen, sonst lässt
+    # sich die Video-Spur nicht verlustfrei per concat zusammenfügen.
+    params = _ffprobe_video_params(abs_paths[0])
+    w, h = params.get("width"), params.get("height")
+    if not (isinstance(w, int) and isinstance(h, int) and w > 0 and h > 0):
+        return []
+    w, h = w - w % 2, h - h % 2
+    return [
+        "-vf",
+        f"scale={w}:{h}:force_original_aspect_ratio=decrease,pad={w}:{h}:(ow-iw)/2:(oh-ih)/2,setsar=1",
+    ]
+
+
+def _merge_audio_cmd(ffmpeg_bin: str, abs_paths: list[str], durations: list[float], out: str) -> list[str] | None:
+    # Audio einmal über die ganze Zeitleiste kodieren: keine AAC-Priming- und
+    # Padding-Lücken an Teilgrenzen. Jede Quelle wird auf ihre Dauer aufgefüllt
+    # bzw. gekürzt, Quellen ohne Ton bekommen Stille.
+    has_audio = [_ffprobe_stream_codecs(p)[1] is not None for p in abs_paths]
+    if not any(has_audio):
+        return None
+    cmd = [ffmpeg_bin, "-y", "-nostdin", "-hide_banner", "-loglevel", "error"]
+    parts = []
+    labels = []
+    for i, (abs_p, dur, audio) in enumerate(zip(abs_paths, durations, has_audio)):
+        cmd += ["-i", abs_p]
+        if audio:
+            parts.append(
+                f"[{i}:a:0]aresample={_MERGE_AUDIO_RATE},aformat=channel_layouts=stereo,"
+                f"apad,atrim=0:{dur:.6f},asetpts=N/SR/TB[a{i}]"
+            )
+        else:
+            parts.append(f"anullsrc=r={_MERGE_AUDIO_RATE}:cl=stereo,atrim=0:{dur:.6f}[a{i}]")
+        labels.append(f"[a{i}]")
+    parts.append(f"{''.join(labels)}concat=n={len(abs_paths)}:v=0:a=1[aout]")
+    cmd += ["-filter_complex", ";".join(parts), "-map", "[aout]", *_MERGE_AUDIO_ARGS]
+    cmd += ["-progress", "pipe:1", "-nostats", out]
+    return cmd
+
+
+def _merge_encode_chunks(
+    job_id: str,
+    ffmpeg_bin: str,
+    chunks: list[dict],
+    total: float,
+    work_dir: str,
+    abs_paths: list[str],
+    durations: list[float],
+) -> tuple[list[str], str | None]:
+    # Nur das Video wird in Teilen kodiert; die Tonspur läuft parallel als ein
+    # Durchgang über alle Quellen. Ergebnis: (Video-Teile, Audiodatei oder None).
+    workers = max(1, min(len(chunks), int(app.config.get("MERGE_WORKERS", 1))))
+    threads = max(1, (os.cpu_count() or 1) // workers)
+
+    done_seconds = [0.0] * len(chunks)
+    progress_lock = threading.Lock()
+    abort = threading.Event()
+    last_pct = -1
+
+    def _report(idx: int, seconds: float):
+        nonlocal last_pct
+        with progress_lock:
+            cap = chunks[idx]["seconds"]
+            done_seconds[idx] = min(seconds, cap) if cap > 0 else seconds
+            pct = max(0, min(98, int(sum(done_seconds) / total * 100)))
+            if pct == last_pct:
+                return
+            last_pct = pct
+        _merge_job_update(job_id, progress_pct=pct, phase="Merge")
+
+    def _encode(idx: int) -> str:
+        c = chunks[idx]
+        out = os.path.join(work_dir, f"chunk_{idx:05d}.mp4")
+        cmd = [ffmpeg_bin, "-y", "-nostdin", "-hide_banner", "-loglevel", "error"]
+        if c["start"] > 0:
+            cmd += ["-ss", f"{c['start']:.6f}"]
+        cmd += ["-i", c["src"]]
+        if c["duration"] is not None:
+            cmd += ["-t", f"{c['duration']:.6f}"]
+        cmd += ["-map", "0:v:0", "-an", *video_filter, *_merge_encode_args(threads, audio=False)]
+        cmd += ["-video_track_timescale", "90000", "-progress", "pipe:1", "-nostats", out]
+        _run_ffmpeg_progress(cmd, lambda s: _report(idx, s), abort)
+        if not os.path.isfile(out):
+            raise RuntimeError(f"Chunk {idx} wurde nicht erstellt.")
+        _report(idx, c["seconds"])
+        return out
+
+    def _encode_audio() -> str | None:
+        out = os.path.join(work_dir, "audio.m4a")
+        cmd = _merge_audio_cmd(ffmpeg_bin, abs_paths, durations, out)
+        if cmd is None:
+            return None
+        _run_ffmpeg_progress(cmd, None, abort)
+        if not os.path.isfile(out):
+            raise RuntimeError("Tonspur wurde nicht erstellt.")
+        return out
+
+    video_filter = _merge_chunk_video_filter(abs_paths)
+    with ThreadPoolExecutor(max_workers=workers + 1, thread_name_prefix=f"merge_{job_id[:8]}") as ex:
+        audio_future = ex.submit(_encode_audio)
+        futures = [ex.submit(_encode, i) for i in range(len(chunks))]
+        try:
+            pieces = [f.result() for f in futures]
+            return pieces, audio_future.result()
+        except Exception:
+            abort.set()
+            for f in futures + [audio_future]:
+                f.cancel()
+            raise
+
+
+def _merge_metrics_done(profile: str, media_seconds: float, wall_seconds: float):
+    _metric_inc("merge_jobs_total", status="done", profile=profile)
+    if media_seconds <= 0 or wall_seconds <= 0:
+        return
+    _metric_inc("merge_media_seconds_total", media_seconds, profile=profile)
+    _metric_inc("merge_wall_seconds_total", wall_seconds, profile=profile)
+    _metric_observe("merge_encode_speed_ratio", media_seconds / wall_seconds, _METRICS_SPEED_BUCKETS, profile=profile)
+
+
+_MERGE_PROFILE_LABELS = {
+    "android_small": "Android (klein)",
+    "copy": "Original (Copy)",
+    "hls": "HLS (Streaming)",
+    "hls_abr": "HLS (2 Qualitäten)",
+}
 
 
-def _start_merge_job(target_relpaths: list[str], profile: str) -> str:
+def _merge_hls_cmd(
+    ffmpeg_bin: str, list_path: str, out_dir: str, abr: bool, has_audio: bool = True
+) -> tuple[list[str], str]:
+    seg = max(1.0, float(app.config.get("MERGE_HLS_SEGMENT_SECONDS", 4)))
+    cmd = [
+        ffmpeg_bin,
+        "-y",
+        "-nostdin",
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-f",
+        "concat",
+        "-safe",
+        "0",
+        "-i",
+        list_path,
+    ]
+    if abr:
+        for v in ("v0", "v1"):
+            os.makedirs(os.path.join(out_dir, v), exist_ok=True)
+        cmd += [
+            "-filter_complex",
+            "[0:v]split=2[v0in][v1in];[v0in]scale=-2:'min(720,ih)'[v0];[v1in]scale=-2:'min(360,ih)'[v1]",
+            "-map",
+            "[v0]",
+            *(["-map", "0:a:0?"] if has_audio else []),
+            "-map",
+            "[v1]",
+            *(["-map", "0:a:0?"] if has_audio else []),
+            "-c:v",
+            "libx264",
+            "-preset",
+            "medium",
+            "-pix_fmt",
+            "yuv420p",
+            "-b:v:0",
+            "2800k",
+            "-maxrate:v:0",
+            "3000k",
+            "-bufsize:v:0",
+            "5600k",
+            "-b:v:1",
+            "800k",
+            "-maxrate:v:1",
+            "900k",
+            "-bufsize:v:1",
+            "1600k",
+            "-c:a",
+            "aac",
+            "-b:a",
+            "128k",
+        ]
+    else:
+        cmd += _merge_encode_args()
+    cmd += [
+        "-force_key_frames",
+        f"expr:gte(t,n_forced*{seg:g})",
+        "-f",
+        "hls",
+        "-hls_time",
+        f"{seg:g}",
+        "-hls_playlist_type",
+        "event",
+        "-hls_flags",
+        "independent_segments+temp_file",
+        "-master_pl_name",
+        "master.m3u8",
+    ]
+    if abr:
+        cmd += [
+            "-var_stream_map",
+            # Ohne Tonspur darf die Zuordnung keine a:N enthalten, sonst bricht ffmpeg ab.
+            "v:0,a:0 v:1,a:1" if has_audio else "v:0 v:1",
+            "-hls_segment_filename",
+            os.path.join(out_dir, "v%v", "seg_%05d.ts"),
+            "-progress",
+            "pipe:1",
+            "-nostats",
+            os.path.join(out_dir, "v%v", "index.m3u8"),
+        ]
+    else:
+        cmd += [
+            "-hls_segment_filename",
+            os.path.join(out_dir, "seg_%05d.ts"),
+            "-progress",
+            "pipe:1",
+            "-nostats",
+            os.path.join(out_dir, "index.m3u8"),
+        ]
+    return cmd, "master.m3u8"
+
+
+def _start_merge_job(target_relpaths: list[str], profile: str, progressive: bool = False) -> str:
     job_id = str(uuid.uuid4())
 
     with _MERGE_JOBS_LOCK:
         _MERGE_JOBS[job_id] = {
             "job_id": job_id,
+            "owner": _process_owner(),
             "status": "running",
             "phase": "Vorbereitung",
             "message": "",
             "progress_pct": 0,
             "created_at": time.time(),
             "profile": profile,
+            "progressive": bool(progressive),
+            "stream_abs": None,
             "output_abs": None,
             "error": None,
         }
+        _MERGE_JOBS_SAVED_AT[job_id] = time.time()
         _merge_job_save(job_id, _MERGE_JOBS[job_id])
+    _start_job_flusher()
 
     def _worker():
+        started = time.perf_counter()
+        durations = []
         try:
             ffmpeg_bin = _resolve_tool_binary("ffmpeg")
             if not ffmpeg_bin:
@@ -320,23 +2098,127 @@ def _start_merge_job(target_relpaths: list[str], profile: str) -> str:
                 if not os.path.isfile(abs_p):
                     raise FileNotFoundError(f"missing: {rp}")
                 abs_paths.append(abs_p)
-                total += max(0.0, _ffprobe_duration_seconds(abs_p))
+                dur = max(0.0, _ffprobe_duration_seconds(abs_p))
+                durations.append(dur)
+                total += dur
 
             if total <= 0:
                 total = 1.0
 
-            profile_label = "Android (klein)" if profile == "android_small" else "Original (Copy)"
+            out_abs = os.path.join(_merge_jobs_dir(), f"merged_{job_id}.mp4")
+
+            chunks = []
+            if (
+                profile == "android_small"
+                and not progressive
+                and int(app.config.get("MERGE_WORKERS", 1)) > 1
+                and all(d > 0 for d in durations)
+            ):
+                chunks = _merge_plan_chunks(abs_paths, durations, float(app.config.get("MERGE_CHUNK_SECONDS", 0)))
+
+            if len(chunks) > 1:
+                workers = max(1, min(len(chunks), int(app.config.get("MERGE_WORKERS", 1))))
+                _merge_job_update(
+                    job_id,
+                    phase="Merge",
+                    message=f"ffmpeg läuft… (Android (klein), {len(chunks)} Teile, {workers} parallel)",
+                )
+                work_dir = tempfile.mkdtemp(prefix=f"chunks_{job_id}_", dir=_merge_jobs_dir())
+                try:
+                    chunk_paths, audio_path = _merge_encode_chunks(
+                        job_id, ffmpeg_bin, chunks, total, work_dir, abs_paths, durations
+                    )
+
+                    _merge_job_update(job_id, phase="Zusammenfügen", progress_pct=99, message="Teile werden verbunden…")
+                    list_path = os.path.join(work_dir, "concat.txt")
+                    _write_concat_list(list_path, chunk_paths)
+                    audio_in = ["-i", audio_path, "-map", "0:v:0", "-map", "1:a:0"] if audio_path else []
+                    cmd = [
+                        ffmpeg_bin,
+                        "-y",
+                        "-nostdin",
+                        "-hide_banner",
+                        "-loglevel",
+                        "error",
+                        "-f",
+                        "concat",
+                        "-safe",
+                        "0",
+                        "-i",
+                        list_path,
+                        *audio_in,
+                        "-c",
+                        "copy",
+                        "-movflags",
+                        "+faststart",
+                        "-progress",
+                        "pipe:1",
+                        "-nostats",
+                        out_abs,
+                    ]
+                    _run_ffmpeg_progress(cmd)
+                finally:
+                    shutil.rmtree(work_dir, ignore_errors=True)
+
+                if not os.path.isfile(out_abs):
+                    raise RuntimeError("ffmpeg hat keine Ausgabe erzeugt.")
+                _merge_metrics_done(profile, sum(durations), time.perf_counter() - started)
+                _merge_job_update(
+                    job_id,
+                    status="done",
+                    phase="Fertig",
+                    progress_pct=100,
+                    output_abs=out_abs,
+                    output_bytes=os.path.getsize(out_abs),
+                    finished_at=time.time(),
+                )
+                return
+
+            profile_label = _MERGE_PROFILE_LABELS.get(profile, profile)
             _merge_job_update(job_id, phase="Merge", message=f"ffmpeg läuft… ({profile_label})")
 
-            out_abs = os.path.join(_merge_jobs_dir(), f"merged_{job_id}.mp4")
+            if profile in ("hls", "hls_abr"):
+                out_dir = os.path.join(_merge_jobs_dir(), f"hls_{job_id}")
+                os.makedirs(out_dir, exist_ok=True)
+                list_path = os.path.join(out_dir, "concat.txt")
+                _write_concat_list(list_path, abs_paths)
+                # Der concat-Demuxer übernimmt die Spuren der ersten Datei.
+                vcodec, acodec = _ffprobe_stream_codecs(abs_paths[0])
+                has_audio = acodec is not None or vcodec is None
+                cmd, playlist = _merge_hls_cmd(
+                    ffmpeg_bin, list_path, out_dir, abr=profile == "hls_abr", has_audio=has_audio
+                )
+                _merge_job_update(job_id, output_dir=out_dir, playlist=playlist)
+
+                def _on_hls_progress(seconds: float):
+                    pct = max(0, min(99, int(seconds / total * 100)))
+                    _merge_job_update(job_id, progress_pct=pct, phase="Merge")
+
+                try:
+                    _run_ffmpeg_progress(cmd, _on_hls_progress)
+                finally:
+                    try:
+                        os.remove(list_path)
+                    except Exception:
+                        pass
+                if not os.path.isfile(os.path.join(out_dir, playlist)):
+                    raise RuntimeError("ffmpeg hat keine Playlist erzeugt.")
+                _merge_metrics_done(profile, sum(durations), time.perf_counter() - started)
+                _merge_job_update(
+                    job_id,
+                    status="done",
+                    phase="Fertig",
+                    progress_pct=100,
+                    output_bytes=_dir_size_bytes(out_dir),
+                    finished_at=time.time(),
+                )
+                return
+
             list_fd, list_path = tempfile.mkstemp(prefix=f"concat_{job_id}_", suffix=".txt")
             os.close(list_fd)
 
             try:
-                with open(list_path, "w", encoding="utf-8") as f:
-                    for p in abs_paths:
-                        p_escaped = p.replace("'", "\\'")
-                        f.write(f"file '{p_escaped}'\n")
+                _write_concat_list(list_path, abs_paths)
 
                 cmd = [
                     ffmpeg_bin,
@@ -357,83 +2239,586 @@ def _start_merge_job(target_relpaths: list[str], profile: str) -> str:
                     out_abs,
                 ]
 
+                if progressive:
+                    movflags = ["-movflags", "+frag_keyframe+empty_moov+default_base_moof", "-flush_packets", "1"]
+                else:
+                    movflags = ["-movflags", "+faststart"]
+
                 if profile == "copy":
-                    cmd[cmd.index("-progress") : cmd.index("-progress")] = [
-                        "-c",
-                        "copy",
-                        "-movflags",
-                        "+faststart",
-                    ]
+                    cmd[cmd.index("-progress") : cmd.index("-progress")] = ["-c", "copy"] + movflags
                 else:
-                    cmd[cmd.index("-progress") : cmd.index("-progress")] = [
-                        "-c:v",
-                        "libx264",
-                        "-preset",
-                        "medium",
-                        "-crf",
-                        "24",
-                        "-pix_fmt",
-                        "yuv420p",
-                        "-c:a",
-                        "aac",
-                        "-b:a",
-                        "128k",
-                        "-movflags",
-                        "+faststart",
-                    ]
+                    cmd[cmd.index("-progress") : cmd.index("-progress")] = _merge_encode_args() + movflags
 
-                proc = subprocess.Popen(
-                    cmd,
-                    stdin=subprocess.DEVNULL,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    text=True,
-                    bufsize=1,
-                )
+                if progressive:
+                    _merge_job_update(job_id, stream_abs=out_abs)
 
-                out_time_ms = 0
-                tail = []
-                tail_limit = 200
-                if proc.stdout:
-                    for line in proc.stdout:
-                        line = line.strip()
-                        if not line:
-                            continue
-                        if "=" not in line:
-                            tail.append(line)
-                            if len(tail) > tail_limit:
-                                tail = tail[-tail_limit:]
-                            continue
-                        k, v = line.split("=", 1)
-                        if k == "out_time_ms":
-                            try:
-                                out_time_ms = int(v)
-                            except Exception:
-                                out_time_ms = out_time_ms
-                            pct = max(0, min(99, int((out_time_ms / 1_000_000) / total * 100)))
-                            _merge_job_update(job_id, progress_pct=pct, phase="Merge")
-                        elif k == "progress" and v == "end":
-                            break
-
-                rc = proc.wait()
-                if rc != 0 or not os.path.isfile(out_abs):
-                    stderr = "\n".join(tail).strip()
-                    raise RuntimeError(stderr or f"ffmpeg exit {rc}")
-
-                _merge_job_update(job_id, status="done", phase="Fertig", progress_pct=100, output_abs=out_abs)
+                def _on_progress(seconds: float):
+                    pct = max(0, min(99, int(seconds / total * 100)))
+                    _merge_job_update(job_id, progress_pct=pct, phase="Merge")
+
+                _run_ffmpeg_progress(cmd, _on_progress)
+                if not os.path.isfile(out_abs):
+                    raise RuntimeError("ffmpeg hat keine Ausgabe erzeugt.")
+
+                _merge_metrics_done(profile, sum(durations), time.perf_counter() - started)
+                _merge_job_update(
+                    job_id,
+                    status="done",
+                    phase="Fertig",
+                    progress_pct=100,
+                    output_abs=out_abs,
+                    output_bytes=os.path.getsize(out_abs),
+                    finished_at=time.time(),
+                )
             finally:
                 try:
                     os.remove(list_path)
                 except Exception:
                     pass
         except Exception as e:
-            _merge_job_update(job_id, status="error", phase="Fehler", error=str(e))
+            _metric_inc("merge_jobs_total", status="error", profile=profile)
+            _merge_job_update(job_id, status="error", phase="Fehler", error=str(e), finished_at=time.time())
+        finally:
+            try:
+                _merge_janitor_run_once()
+            except Exception:
+                pass
 
     t = threading.Thread(target=_worker, daemon=True)
     t.start()
     return job_id
 
 
+_MEDIA_POOL = None
+_THUMB_POOL = None
+_MEDIA_TASKS = {}
+_MEDIA_TASKS_LOCK = threading.Lock()
+
+_PROXY_VARIANT = "proxy540v1"
+
+
+def _media_cache_dir(kind: str) -> str:
+    d = os.path.join(os.path.dirname(app.config["DB_PATH"]), "cache", kind)
+    os.makedirs(d, exist_ok=True)
+    return d
+
+
+def _media_content_key(abs_path: str, variant: str) -> str:
+    st = os.stat(abs_path)
+    ident = f"{st.st_dev}:{st.st_ino}:{st.st_size}:{st.st_mtime_ns}:{variant}"
+    return hashlib.sha1(ident.encode("utf-8")).hexdigest()
+
+
+def _media_pool() -> ThreadPoolExecutor:
+    global _MEDIA_POOL
+    with _MEDIA_TASKS_LOCK:
+        if _MEDIA_POOL is None:
+            workers = max(1, int(app.config.get("MEDIA_WORKERS", 1)))
+            _MEDIA_POOL = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="media")
+        return _MEDIA_POOL
+
+
+def _media_task_pending(task_key: str) -> bool:
+    with _MEDIA_TASKS_LOCK:
+        fut = _MEDIA_TASKS.get(task_key)
+        return fut is not None and not fut.done()
+
+
+def _thumb_pool() -> ThreadPoolExecutor:
+    # Eigener Pool, damit viele Vorschaubilder keine Proxy-/Remux-Builds aufhalten.
+    global _THUMB_POOL
+    with _MEDIA_TASKS_LOCK:
+        if _THUMB_POOL is None:
+            workers = max(1, int(app.config.get("THUMB_WORKERS", 1)))
+            _THUMB_POOL = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="thumbs")
+        return _THUMB_POOL
+
+
+def _media_task_submit(task_key: str, fn, *args, pool: ThreadPoolExecutor | None = None):
+    pool = pool or _media_pool()
+    with _MEDIA_TASKS_LOCK:
+        fut = _MEDIA_TASKS.get(task_key)
+        if fut is not None and not fut.done():
+            return fut
+        fut = pool.submit(fn, *args)
+        _MEDIA_TASKS[task_key] = fut
+
+    def _done(_f):
+        with _MEDIA_TASKS_LOCK:
+            if _MEDIA_TASKS.get(task_key) is _f:
+                _MEDIA_TASKS.pop(task_key, None)
+
+    fut.add_done_callback(_done)
+    return fut
+
+
+def _media_cache_touch(path: str):
+    try:
+        os.utime(path, None)
+    except OSError:
+        pass
+
+
+def _media_cache_enforce(kind: str, max_bytes: int):
+    if max_bytes <= 0:
+        return
+    d = _media_cache_dir(kind)
+    files = []
+    total = 0
+    with os.scandir(d) as it:
+        for entry in it:
+            if entry.name.startswith(".") or not entry.is_file(follow_symlinks=False):
+                continue
+            try:
+                st = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            files.append((st.st_mtime, st.st_size, entry.path))
+            total += st.st_size
+    files.sort()
+    for _mtime, size, path in files:
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            continue
+
+
+_KEYFRAME_VARIANT = "keyframes_v1"
+_KEYFRAME_CACHE = {}
+_KEYFRAME_CACHE_LOCK = threading.Lock()
+_KEYFRAME_CACHE_MAX = 64
+
+
+def _keyframes_extract(abs_path: str) -> array:
+    ffprobe_bin = _resolve_tool_binary("ffprobe")
+    if not ffprobe_bin:
+        raise FileNotFoundError("ffprobe nicht gefunden")
+    # Nur Paket-Flags lesen, nichts dekodieren.
+    cmd = [
+        ffprobe_bin,
+        "-v",
+        "error",
+        "-select_streams",
+        "v:0",
+        "-show_entries",
+        "packet=pts_time,flags",
+        "-of",
+        "csv=p=0",
+        abs_path,
+    ]
+    times = []
+    started = time.perf_counter()
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True) as proc:
+        for line in proc.stdout:
+            pts, _, flags = line.strip().partition(",")
+            if "K" not in flags:
+                continue
+            try:
+                times.append(float(pts))
+            except ValueError:
+                continue
+    _metric_tool(cmd, started, proc.returncode == 0)
+    if proc.returncode != 0:
+        raise RuntimeError(f"ffprobe exit {proc.returncode}")
+    times.sort()
+    return array("d", times)
+
+
+def _keyframes_cache_put(key: str, times: array):
+    with _KEYFRAME_CACHE_LOCK:
+        _KEYFRAME_CACHE.pop(key, None)
+        _KEYFRAME_CACHE[key] = times
+        while len(_KEYFRAME_CACHE) > _KEYFRAME_CACHE_MAX:
+            _KEYFRAME_CACHE.pop(next(iter(_KEYFRAME_CACHE)))
+
+
+def _keyframes_load(abs_path: str) -> array | None:
+    key = _media_content_key(abs_path, _KEYFRAME_VARIANT)
+    with _KEYFRAME_CACHE_LOCK:
+        times = _KEYFRAME_CACHE.get(key)
+    if times is not None:
+        return times
+    row = _get_db().execute("SELECT times FROM keyframe_index WHERE content_key = ?", (key,)).fetchone()
+    if not row:
+        return None
+    times = array("d")
+    times.frombytes(row["times"])
+    _keyframes_cache_put(key, times)
+    return times
+
+
+def _keyframes_build(abs_path: str, relpath: str | None = None) -> array:
+    with app.app_context():
+        times = _keyframes_load(abs_path)
+        if times is not None:
+            return times
+        key = _media_content_key(abs_path, _KEYFRAME_VARIANT)
+        times = _keyframes_extract(abs_path)
+        db = _get_db()
+        db.execute(
+            """
+            INSERT OR REPLACE INTO keyframe_index (content_key, relpath, count, times, created_at)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            (key, relpath, len(times), times.tobytes(), _utc_now_iso()),
+        )
+        db.commit()
+        _keyframes_cache_put(key, times)
+        return times
+
+
+def _keyframes_ensure(abs_path: str, relpath: str | None = None) -> array | None:
+    times = _keyframes_load(abs_path)
+    if times is None:
+        _media_task_submit(f"keyframes:{abs_path}", _keyframes_build, abs_path, relpath)
+    return times
+
+
+def _keyframes_around(times: array, t: float) -> tuple[float | None, float | None]:
+    i = bisect.bisect_right(times, t)
+    before = times[i - 1] if i > 0 else None
+    after = times[i] if i < len(times) else None
+    return before, after
+
+
+_PROXY_KEYFRAME_EXPR = "expr:gte(t,n_forced*1)"
+_PROXY_KEYFRAME_ARG_MAX_BYTES = 96 * 1024
+
+
+def _proxy_force_key_frames(src_abs: str) -> str:
+    # Proxy-Keyframes auf die Keyframes der Quelle legen, damit Vorschau und
+    # Copy-Schnitt an denselben Stellen landen; Lücken > 2 s im 1-s-Raster füllen.
+    try:
+        times = _keyframes_build(src_abs)
+    except Exception:
+        times = None
+    if not times:
+        return _PROXY_KEYFRAME_EXPR
+    points = []
+    prev = 0.0
+    for t in times:
+        while t - prev > 2.0:
+            prev += 1.0
+            points.append(prev)
+        points.append(t)
+        prev = t
+    value = ",".join(f"{p:.3f}" for p in points)
+    # Ein einzelnes argv-Element darf unter Linux höchstens 128 KiB lang sein
+    # (MAX_ARG_STRLEN); lange Quellen mit kurzer GOP bekommen ein Raster im
+    # mittleren GOP-Abstand der Quelle.
+    if len(value.encode()) > _PROXY_KEYFRAME_ARG_MAX_BYTES:
+        gop = (times[-1] - times[0]) / max(1, len(times) - 1)
+        return f"expr:gte(t,n_forced*{min(2.0, max(0.5, gop)):.3f})"
+    return value
+
+
+def _proxy_path_for(src_abs: str) -> str:
+    return os.path.join(_media_cache_dir("proxy"), _media_content_key(src_abs, _PROXY_VARIANT) + ".mp4")
+
+
+def _proxy_build(src_abs: str, out_abs: str):
+    if os.path.isfile(out_abs):
+        return out_abs
+    ffmpeg_bin = _resolve_tool_binary("ffmpeg")
+    if not ffmpeg_bin:
+        raise FileNotFoundError("ffmpeg nicht gefunden")
+    tmp = os.path.join(os.path.dirname(out_abs), f".{os.path.basename(out_abs)}.{uuid.uuid4().hex}.tmp.mp4")
+    cmd = [
+        ffmpeg_bin,
+        "-y",
+        "-nostdin",
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-i",
+        src_abs,
+        "-map",
+        "0:v:0",
+        "-map",
+        "0:a:0?",
+        "-vf",
+        "scale=-2:'min(540,ih)'",
+        "-c:v",
+        "libx264",
+        "-preset",
+        "veryfast",
+        "-crf",
+        "28",
+        "-maxrate",
+        "1500k",
+        "-bufsize",
+        "3000k",
+        "-force_key_frames",
+        _proxy_force_key_frames(src_abs),
+        "-sc_threshold",
+        "0",
+        "-pix_fmt",
+        "yuv420p",
+        "-c:a",
+        "aac",
+        "-b:a",
+        "96k",
+        "-ac",
+        "2",
+        "-movflags",
+        "+faststart",
+        "-progress",
+        "pipe:1",
+        "-nostats",
+        tmp,
+    ]
+    try:
+        _run_ffmpeg_progress(cmd)
+        os.replace(tmp, out_abs)
+    finally:
+        try:
+            os.remove(tmp)
+        except FileNotFoundError:
+            pass
+    _media_cache_enforce("proxy", int(app.config.get("PROXY_CACHE_MAX_BYTES", 0)))
+    return out_abs
+
+
+def _proxy_ensure(src_abs: str) -> tuple[str, bool]:
+    out_abs = _proxy_path_for(src_abs)
+    if os.path.isfile(out_abs):
+        return out_abs, True
+    _media_task_submit(f"proxy:{out_abs}", _proxy_build, src_abs, out_abs)
+    return out_abs, False
+
+
+_REMUX_VARIANT = "remux_mp4_v2"
+_REMUX_EXTENSIONS = {".mkv", ".avi"}
+_REMUX_VIDEO_CODECS = {"h264", "hevc", "av1", "vp9"}
+_REMUX_AUDIO_COPY_CODECS = {"aac", "mp3", "opus"}
+_REMUX_UNSUPPORTED: dict[str, str] = {}
+
+
+def _ffprobe_stream_codecs(abs_path: str) -> tuple[str | None, str | None]:
+    ffprobe_bin = _resolve_tool_binary("ffprobe")
+    if not ffprobe_bin:
+        return None, None
+    cmd = [
+        ffprobe_bin,
+        "-v",
+        "error",
+        "-show_entries",
+        "stream=codec_type,codec_name",
+        "-of",
+        "json",
+        abs_path,
+    ]
+    try:
+        data = json.loads(_tool_output(cmd, text=True) or "{}")
+    except Exception:
+        return None, None
+    vcodec = acodec = None
+    for s in data.get("streams") or []:
+        if s.get("codec_type") == "video" and vcodec is None:
+            vcodec = s.get("codec_name")
+        elif s.get("codec_type") == "audio" and acodec is None:
+            acodec = s.get("codec_name")
+    return vcodec, acodec
+
+
+def _remux_build(src_abs: str, out_abs: str):
+    if os.path.isfile(out_abs):
+        return out_abs
+    ffmpeg_bin = _resolve_tool_binary("ffmpeg")
+    if not ffmpeg_bin:
+        raise FileNotFoundError("ffmpeg nicht gefunden")
+    vcodec, acodec = _ffprobe_stream_codecs(src_abs)
+    if vcodec is None:
+        # ffprobe fehlgeschlagen oder kein Videostream: nicht merken, beim
+        # nächsten Abruf erneut versuchen.
+        raise RuntimeError("ffprobe lieferte keinen Videostream")
+    if vcodec not in _REMUX_VIDEO_CODECS:
+        _REMUX_UNSUPPORTED[out_abs] = vcodec or "unknown"
+        return None
+
+    # Nur der Container wird getauscht; Audio wird nur angefasst, wenn der
+    # Codec in MP4 nicht abspielbar ist (AC3, DTS, PCM, ...).
+    audio_args = ["-c:a", "copy"] if acodec in _REMUX_AUDIO_COPY_CODECS else ["-c:a", "aac", "-b:a", "160k"]
+    tmp = os.path.join(os.path.dirname(out_abs), f".{os.path.basename(out_abs)}.{uuid.uuid4().hex}.tmp.mp4")
+    cmd = [
+        ffmpeg_bin,
+        "-y",
+        "-nostdin",
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-fflags",
+        "+genpts",
+        "-i",
+        src_abs,
+        "-map",
+        "0:v:0",
+        "-map",
+        "0:a:0?",
+        "-c:v",
+        "copy",
+        *audio_args,
+        *(["-tag:v", "hvc1"] if vcodec == "hevc" else []),
+        # Die Datei wird erst ausgeliefert, wenn sie fertig ist: normales MP4
+        # mit moov vorne, damit Browser Dauer und Index sofort kennen.
+        "-movflags",
+        "+faststart",
+        "-progress",
+        "pipe:1",
+        "-nostats",
+        tmp,
+    ]
+    try:
+        _run_ffmpeg_progress(cmd)
+        os.replace(tmp, out_abs)
+    finally:
+        try:
+            os.remove(tmp)
+        except FileNotFoundError:
+            pass
+    _media_cache_enforce("remux", int(app.config.get("REMUX_CACHE_MAX_BYTES", 0)))
+    return out_abs
+
+
+def _remux_path_for(src_abs: str) -> str:
+    return os.path.join(_media_cache_dir("remux"), _media_content_key(src_abs, _REMUX_VARIANT) + ".mp4")
+
+
+def _remux_ensure(src_abs: str) -> tuple[str | None, bool]:
+    out_abs = _remux_path_for(src_abs)
+    if os.path.isfile(out_abs):
+        return out_abs, True
+    if out_abs in _REMUX_UNSUPPORTED:
+        return None, False
+    _media_task_submit(f"remux:{out_abs}", _remux_build, src_abs, out_abs)
+    return out_abs, False
+
+
+_THUMB_VARIANT = "thumbs_v1"
+_THUMB_SPRITE_COLS = 10
+_THUMB_SPRITE_ROWS = 10
+_THUMB_TILE_W = 160
+_THUMB_TILE_H = 90
+_THUMB_ENQUEUE_LIMIT = 200
+
+
+def _thumb_failed_path(key: str) -> str:
+    return os.path.join(_media_cache_dir("thumbs"), f"{key}.failed")
+
+
+def _thumbs_build(src_abs: str, key: str):
+    d = _media_cache_dir("thumbs")
+    poster = os.path.join(d, f"{key}_poster.jpg")
+    sprite = os.path.join(d, f"{key}_sprite.jpg")
+    if os.path.isfile(poster) and os.path.isfile(sprite):
+        return
+    ffmpeg_bin = _resolve_tool_binary("ffmpeg")
+    if not ffmpeg_bin:
+        raise FileNotFoundError("ffmpeg nicht gefunden")
+    try:
+        _thumbs_render(ffmpeg_bin, src_abs, key, d, poster, sprite)
+    except subprocess.CalledProcessError as e:
+        # Datei, an der ffmpeg scheitert, nicht bei jedem Listing erneut versuchen;
+        # der Schlüssel hängt am Inhalt, eine geänderte Datei wird wieder versucht.
+        try:
+            with open(_thumb_failed_path(key), "wb") as f:
+                f.write((e.stderr or b"")[-500:])
+        except OSError:
+            pass
+        raise
+    _media_cache_enforce("thumbs", int(app.config.get("THUMB_CACHE_MAX_BYTES", 0)))
+
+
+def _thumbs_render(ffmpeg_bin: str, src_abs: str, key: str, d: str, poster: str, sprite: str):
+    dur = _ffprobe_duration_seconds(src_abs)
+    tiles = _THUMB_SPRITE_COLS * _THUMB_SPRITE_ROWS
+    interval = max(0.04, dur / tiles) if dur > 0 else 1.0
+    tile = (
+        f"scale={_THUMB_TILE_W}:{_THUMB_TILE_H}:force_original_aspect_ratio=decrease,"
+        f"pad={_THUMB_TILE_W}:{_THUMB_TILE_H}:(ow-iw)/2:(oh-ih)/2"
+    )
+    tmp_poster = os.path.join(d, f".{key}_{uuid.uuid4().hex}_poster.jpg")
+    tmp_sprite = os.path.join(d, f".{key}_{uuid.uuid4().hex}_sprite.jpg")
+    base = [ffmpeg_bin, "-y", "-nostdin", "-hide_banner", "-loglevel", "error"]
+    try:
+        _tool_run(
+            base
+            + [
+                "-ss",
+                f"{min(dur * 0.1, 10.0):.3f}",
+                "-i",
+                src_abs,
+                "-frames:v",
+                "1",
+                "-vf",
+                "scale=320:-2",
+                "-q:v",
+                "4",
+                tmp_poster,
+            ],
+            check=True,
+            capture_output=True,
+        )
+        _tool_run(
+            base
+            + [
+                "-skip_frame",
+                "nokey",
+                "-i",
+                src_abs,
+                "-an",
+                "-vf",
+                f"fps=1/{interval:.4f},{tile},tile={_THUMB_SPRITE_COLS}x{_THUMB_SPRITE_ROWS}",
+                "-frames:v",
+                "1",
+                "-q:v",
+                "5",
+                tmp_sprite,
+            ],
+            check=True,
+            capture_output=True,
+        )
+        os.replace(tmp_sprite, sprite)
+        os.replace(tmp_poster, poster)
+    finally:
+        for p in (tmp_poster, tmp_sprite):
+            try:
+                os.remove(p)
+            except FileNotFoundError:
+                pass
+
+
+def _thumb_fields(abs_path: str, enqueue: bool = True) -> dict:
+    try:
+        key = _media_content_key(abs_path, _THUMB_VARIANT)
+    except OSError:
+        return {}
+    ready = os.path.isfile(os.path.join(_media_cache_dir("thumbs"), f"{key}_poster.jpg"))
+    failed = not ready and os.path.isfile(_thumb_failed_path(key))
+    if not ready and not failed and enqueue:
+        _media_task_submit(f"thumbs:{key}", _thumbs_build, abs_path, key, pool=_thumb_pool())
+    return {
+        "thumb_url": f"/media/thumb/{key}/poster.jpg",
+        "sprite_url": f"/media/thumb/{key}/sprite.jpg",
+        "thumb_ready": ready,
+        "thumb_failed": failed,
+    }
+
+
+@_phase("fs")
+def _with_thumb_fields(results: list[dict]) -> list[dict]:
+    for idx, r in enumerate(results):
+        try:
+            abs_path, _ = _safe_abs_path(app.config["VIDEO_ROOT"], r.get("relpath"))
+        except ValueError:
+            continue
+        r.update(_thumb_fields(abs_path, enqueue=idx < _THUMB_ENQUEUE_LIMIT))
+    return results
+
+
 def _extract_tags_from_filename(filename: str) -> list[str]:
     matches = re.findall(r"\[(.*?)\]", filename)
     out = []
@@ -516,6 +2901,7 @@ def _build_tag_index(tag_root_abs: str, video_root_abs: str):
     return entries
 
 
+@_phase("index")
 def _get_tag_index(refresh: bool = False):
     tag_root_abs = os.path.abspath(app.config["TAG_SCAN_ROOT"])
     video_root_abs = os.path.abspath(app.config["VIDEO_ROOT"])
@@ -527,35 +2913,112 @@ def _get_tag_index(refresh: bool = False):
     if not os.path.isdir(tag_root_abs):
         raise FileNotFoundError("tag_root_missing")
 
-    cache_key = tag_root_abs
-    now = time.time()
-    with _TAG_INDEX_LOCK:
-        cached = _TAG_INDEX_CACHE.get(cache_key)
+    if not refresh:
+        cached = _tag_index_shared(tag_root_abs)
+        if cached:
+            return cached
+
+    lock_fd = _leader_lock_acquire("tag_index")
+    if lock_fd is None:
+        # Ein anderer Prozess baut gerade: vorhandenen Stand nehmen oder auf dessen Ergebnis warten
+        cached = _tag_index_shared(tag_root_abs, max_age=None)
         if cached and not refresh:
-            if now - cached.get("built_at", 0) < 30:
+            return cached
+        lock_fd = _leader_lock_acquire("tag_index", blocking=True)
+        if not refresh:
+            cached = _tag_index_shared(tag_root_abs)
+            if cached:
+                _leader_lock_release(lock_fd)
                 return cached
+    try:
+        return _tag_index_rebuild(tag_root_abs, video_root_abs)
+    finally:
+        _leader_lock_release(lock_fd)
 
+
+def _tag_index_rebuild(tag_root_abs: str, video_root_abs: str) -> dict:
+    # Nur mit gehaltener "tag_index"-Sperre aufrufen.
+    built_at = time.time()
+    started = time.perf_counter()
     entries = _build_tag_index(tag_root_abs, video_root_abs)
-    cached = {"root_abs": tag_root_abs, "built_at": now, "entries": entries}
+    with _phase("db"), app.app_context():
+        db = _get_db()
+        with db:
+            db.execute("DELETE FROM tag_index_entries WHERE root = ?", (tag_root_abs,))
+            db.executemany(
+                "INSERT INTO tag_index_entries (root, relpath, name, tags) VALUES (?, ?, ?, ?)",
+                [(tag_root_abs, e["relpath"], e["name"], json.dumps(e["tags"])) for e in entries],
+            )
+            db.execute(
+                "INSERT OR REPLACE INTO app_state (key, value, updated_at) VALUES (?, ?, ?)",
+                (f"tag_index:{tag_root_abs}", json.dumps({"built_at": built_at, "count": len(entries)}), built_at),
+            )
+    cached = {"root_abs": tag_root_abs, "built_at": built_at, "entries": entries}
+    with _TAG_INDEX_LOCK:
+        _TAG_INDEX_CACHE[tag_root_abs] = cached
+    _metric_observe("tag_index_build_seconds", time.perf_counter() - started, _METRICS_BUILD_BUCKETS)
+    _metric_set("tag_index_entries", len(entries))
+    return cached
+
+
+def _tag_index_shared(tag_root_abs: str, max_age: float | None = _TAG_INDEX_MAX_AGE_SECONDS) -> dict | None:
+    # Gemeinsamen Index aus SQLite; die Kopie im Speicher gilt, solange niemand neuer gebaut hat.
+    meta = _app_state_get(f"tag_index:{tag_root_abs}") or {}
+    built_at = float(meta.get("built_at") or 0)
+    if built_at <= 0:
+        return None
+    if max_age is not None and time.time() - built_at >= max_age:
+        return None
     with _TAG_INDEX_LOCK:
-        _TAG_INDEX_CACHE[cache_key] = cached
+        cached = _TAG_INDEX_CACHE.get(tag_root_abs)
+    if cached and cached["built_at"] >= built_at:
+        return cached
+
+    with _phase("db"), app.app_context():
+        rows = _get_db().execute(
+            "SELECT relpath, name, tags FROM tag_index_entries WHERE root = ?", (tag_root_abs,)
+        ).fetchall()
+    entries = []
+    for r in rows:
+        tags = json.loads(r["tags"])
+        entries.append(
+            {
+                "relpath": r["relpath"],
+                "name": r["name"],
+                "name_lower": r["name"].lower(),
+                "tags": tags,
+                "tags_lower": {t.lower() for t in tags},
+            }
+        )
+    entries.sort(key=lambda x: x["relpath"].lower())
+    cached = {"root_abs": tag_root_abs, "built_at": built_at, "entries": entries}
+    with _TAG_INDEX_LOCK:
+        _TAG_INDEX_CACHE[tag_root_abs] = cached
     return cached
 
 
 def _start_tag_index_build():
     def _worker():
-        global _TAG_INDEX_BUILDING, _TAG_INDEX_LAST_ERROR
+        global _TAG_INDEX_BUILDING
         with app.app_context():
             with _TAG_INDEX_LOCK:
                 if _TAG_INDEX_BUILDING:
                     return
                 _TAG_INDEX_BUILDING = True
-                _TAG_INDEX_LAST_ERROR = None
             try:
-                _get_tag_index(refresh=True)
+                _app_state_set("tag_index_error", None)
+                _event_publish("tags", "", "building", {"building": True})
+                t0 = time.time()
+                idx = _get_tag_index(refresh=True)
+                _event_publish(
+                    "tags", "", "done", {"building": False, "count": len(idx["entries"]), "seconds": round(time.time() - t0, 3)}
+                )
             except Exception as e:
-                with _TAG_INDEX_LOCK:
-                    _TAG_INDEX_LAST_ERROR = str(e)
+                try:
+                    _app_state_set("tag_index_error", str(e))
+                except sqlite3.Error:
+                    pass
+                _event_publish("tags", "", "error", {"building": False, "error": str(e)})
             finally:
                 with _TAG_INDEX_LOCK:
                     _TAG_INDEX_BUILDING = False
@@ -573,84 +3036,412 @@ def _json_error(message: str, status: int = 400, code: str | None = None, detail
     return jsonify(payload), status
 
 
-def _send_file_with_range(abs_path: str, mimetype: str):
-    def _resp_range_not_satisfiable(size: int):
-        resp = Response(status=416, mimetype=mimetype or "application/octet-stream")
-        resp.headers["Content-Range"] = f"bytes */{size}"
-        resp.headers["Accept-Ranges"] = "bytes"
-        resp.headers["Cache-Control"] = "no-store"
-        resp.headers["Pragma"] = "no-cache"
-        resp.headers["Expires"] = "0"
-        return resp
-
-    range_header = request.headers.get("Range")
-    if not range_header:
-        resp = send_file(abs_path, conditional=False, mimetype=mimetype or "application/octet-stream")
-        try:
-            resp.headers.setdefault("Accept-Ranges", "bytes")
-            resp.headers.setdefault("Cache-Control", "no-store")
-            resp.headers.setdefault("Pragma", "no-cache")
-            resp.headers.setdefault("Expires", "0")
-        except Exception:
-            pass
-        return resp
+_RANGE_CHUNK_BYTES = 1024 * 1024
+_RANGE_READAHEAD_BYTES = 8 * 1024 * 1024
 
-    m = re.match(r"^bytes=(\d*)-(\d*)$", range_header.strip())
-    if not m:
-        resp = send_file(abs_path, conditional=False, mimetype=mimetype or "application/octet-stream")
-        try:
-            resp.headers.setdefault("Accept-Ranges", "bytes")
-            resp.headers.setdefault("Cache-Control", "no-store")
-            resp.headers.setdefault("Pragma", "no-cache")
-            resp.headers.setdefault("Expires", "0")
-        except Exception:
-            pass
-        return resp
 
-    size = os.path.getsize(abs_path)
-    start_s, end_s = m.groups()
+def _fadvise_range(fd: int, start: int, length: int):
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        os.posix_fadvise(fd, start, length, os.POSIX_FADV_SEQUENTIAL)
+        os.posix_fadvise(fd, start, min(length, _RANGE_READAHEAD_BYTES), os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
 
-    if start_s == "" and end_s == "":
-        return _resp_range_not_satisfiable(size)
 
+def _iter_file_range(f, length: int):
     try:
+        remaining = length
+        while remaining > 0:
+            chunk = f.read(min(_RANGE_CHUNK_BYTES, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+    finally:
+        f.close()
+
+
+_MAX_RANGES_PER_REQUEST = 32
+
+
+def _file_etag(st: os.stat_result) -> str:
+    return f'"{st.st_ino:x}-{st.st_size:x}-{st.st_mtime_ns:x}"'
+
+
+def _etag_matches(header_value: str | None, etag: str, weak: bool = True) -> bool:
+    if not header_value:
+        return False
+    value = header_value.strip()
+    if value == "*":
+        return True
+    for cand in value.split(","):
+        cand = cand.strip()
+        if cand.startswith("W/"):
+            if not weak:
+                continue
+            cand = cand[2:]
+        if cand == etag:
+            return True
+    return False
+
+
+def _parse_range_header(range_header: str, size: int) -> list[tuple[int, int]] | None:
+    value = range_header.strip()
+    if not value.lower().startswith("bytes="):
+        return None
+    specs = [s.strip() for s in value[len("bytes="):].split(",") if s.strip()]
+    if not specs or len(specs) > _MAX_RANGES_PER_REQUEST:
+        return None
+
+    ranges = []
+    for spec in specs:
+        m = re.match(r"^(\d*)-(\d*)$", spec)
+        if not m:
+            return None
+        start_s, end_s = m.groups()
+        if start_s == "" and end_s == "":
+            return None
         if start_s == "":
             length = int(end_s)
             if length <= 0:
-                return _resp_range_not_satisfiable(size)
+                continue
             start = max(0, size - length)
             end = size - 1
         else:
             start = int(start_s)
             end = int(end_s) if end_s != "" else size - 1
-    except Exception:
-        return _resp_range_not_satisfiable(size)
+            if end_s != "" and end < start:
+                return None
+        if start >= size:
+            continue
+        ranges.append((start, min(end, size - 1)))
 
-    if start < 0 or end < 0 or start >= size or start > end:
-        return _resp_range_not_satisfiable(size)
-    end = min(end, size - 1)
+    ranges.sort()
+    merged: list[tuple[int, int]] = []
+    for start, end in ranges:
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
 
-    length = end - start + 1
 
-    def _gen():
-        with open(abs_path, "rb") as f:
+def _iter_file_multirange(abs_path: str, parts: list[tuple[bytes, int, int]], closing: bytes):
+    with open(abs_path, "rb") as f:
+        for header, start, end in parts:
+            yield header
             f.seek(start)
-            remaining = length
+            remaining = end - start + 1
             while remaining > 0:
-                chunk = f.read(min(1024 * 1024, remaining))
+                chunk = f.read(min(_RANGE_CHUNK_BYTES, remaining))
                 if not chunk:
                     break
                 remaining -= len(chunk)
                 yield chunk
+        yield closing
+
+
+def _send_file_with_range(
+    abs_path: str,
+    mimetype: str,
+    cache_control: str = "no-cache",
+    download_name: str | None = None,
+    etag: str | None = None,
+    last_modified: float | None = None,
+):
+    mimetype = mimetype or "application/octet-stream"
+    st = os.stat(abs_path)
+    size = st.st_size
+    etag = etag or _file_etag(st)
+    mtime = st.st_mtime if last_modified is None else last_modified
+
+    def _common_headers(resp):
+        resp.headers["Accept-Ranges"] = "bytes"
+        resp.headers["ETag"] = etag
+        resp.headers["Last-Modified"] = http_date(mtime)
+        resp.headers["Cache-Control"] = cache_control
+        if download_name:
+            resp.headers["Content-Disposition"] = f'attachment; filename="{download_name}"'
+        return resp
+
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match is not None:
+        not_modified = _etag_matches(if_none_match, etag)
+    else:
+        ims = parse_date(request.headers.get("If-Modified-Since"))
+        not_modified = ims is not None and int(mtime) <= int(ims.timestamp())
+    if not_modified:
+        return _common_headers(Response(status=304))
+
+    range_header = request.headers.get("Range")
+    if_range = request.headers.get("If-Range")
+    if range_header and if_range:
+        if_range = if_range.strip()
+        if if_range.startswith('"') or if_range.startswith("W/"):
+            range_ok = _etag_matches(if_range, etag, weak=False)
+        else:
+            ir_date = parse_date(if_range)
+            range_ok = ir_date is not None and int(ir_date.timestamp()) == int(mtime)
+        if not range_ok:
+            range_header = None
+
+    ranges = _parse_range_header(range_header, size) if range_header else None
+    if ranges is None:
+        resp = send_file(abs_path, conditional=False, mimetype=mimetype)
+        resp.headers["Content-Length"] = str(size)
+        return _common_headers(resp)
+
+    if not ranges:
+        resp = Response(status=416, mimetype=mimetype)
+        resp.headers["Content-Range"] = f"bytes */{size}"
+        return _common_headers(resp)
+
+    if len(ranges) > 1:
+        boundary = uuid.uuid4().hex
+        parts = []
+        total = 0
+        for start, end in ranges:
+            header = (
+                f"\r\n--{boundary}\r\nContent-Type: {mimetype}\r\nContent-Range: bytes {start}-{end}/{size}\r\n\r\n"
+            ).encode("ascii")
+            parts.append((header, start, end))
+            total += len(header) + (end - start + 1)
+        closing = f"\r\n--{boundary}--\r\n".encode("ascii")
+        total += len(closing)
+        resp = Response(
+            _iter_file_multirange(abs_path, parts, closing),
+            status=206,
+            mimetype=f"multipart/byteranges; boundary={boundary}",
+            direct_passthrough=True,
+        )
+        resp.headers["Content-Length"] = str(total)
+        return _common_headers(resp)
+
+    start, end = ranges[0]
+    length = end - start + 1
+
+    f = open(abs_path, "rb")
+    _fadvise_range(f.fileno(), start, length)
+    f.seek(start)
+    file_wrapper = request.environ.get("wsgi.file_wrapper")
+    if file_wrapper is not None and app.config.get("RANGE_USE_FILE_WRAPPER", True):
+        body = file_wrapper(f, _RANGE_CHUNK_BYTES)
+    else:
+        body = _iter_file_range(f, length)
 
-    resp = Response(_gen(), status=206, mimetype=mimetype or "application/octet-stream")
+    resp = Response(body, status=206, mimetype=mimetype, direct_passthrough=True)
     resp.headers["Content-Range"] = f"bytes {start}-{end}/{size}"
-    resp.headers["Accept-Ranges"] = "bytes"
     resp.headers["Content-Length"] = str(length)
-    resp.headers["Cache-Control"] = "no-store"
-    resp.headers["Pragma"] = "no-cache"
-    resp.headers["Expires"] = "0"
-    return resp
+    return _common_headers(resp)
+
+
+_ZIP_CRC_CACHE = {}
+_ZIP_CRC_CACHE_LOCK = threading.Lock()
+_ZIP_CRC_CACHE_MAX = 4096
+_ZIP_FLAGS = 0x0808  # Data Descriptor + UTF-8-Dateinamen
+
+
+def _zip_crc_key(st: os.stat_result) -> str:
+    ident = f"{st.st_dev}:{st.st_ino}:{st.st_size}:{st.st_mtime_ns}:crc32"
+    return hashlib.sha1(ident.encode("utf-8")).hexdigest()
+
+
+def _zip_crc_put(st: os.stat_result, crc: int):
+    key = _zip_crc_key(st)
+    with _ZIP_CRC_CACHE_LOCK:
+        _ZIP_CRC_CACHE[key] = crc
+        while len(_ZIP_CRC_CACHE) > _ZIP_CRC_CACHE_MAX:
+            _ZIP_CRC_CACHE.pop(next(iter(_ZIP_CRC_CACHE)))
+    try:
+        with app.app_context():
+            db = _get_db()
+            with db:
+                db.execute(
+                    "INSERT OR REPLACE INTO file_crc (content_key, crc, created_at) VALUES (?, ?, ?)",
+                    (key, crc, _utc_now_iso()),
+                )
+    except sqlite3.Error:
+        pass
+
+
+def _zip_file_crc(abs_path: str, st: os.stat_result) -> int:
+    key = _zip_crc_key(st)
+    with _ZIP_CRC_CACHE_LOCK:
+        crc = _ZIP_CRC_CACHE.get(key)
+    if crc is not None:
+        return crc
+    with app.app_context():
+        row = _get_db().execute("SELECT crc FROM file_crc WHERE content_key = ?", (key,)).fetchone()
+    if row:
+        with _ZIP_CRC_CACHE_LOCK:
+            _ZIP_CRC_CACHE[key] = int(row["crc"])
+        return int(row["crc"])
+    crc = 0
+    with open(abs_path, "rb") as f:
+        _fadvise_range(f.fileno(), 0, st.st_size)
+        while True:
+            chunk = f.read(_RANGE_CHUNK_BYTES)
+            if not chunk:
+                break
+            crc = zlib.crc32(chunk, crc)
+    _zip_crc_put(st, crc)
+    return crc
+
+
+def _zip_dos_datetime(ts: float) -> tuple[int, int]:
+    t = time.localtime(max(ts, 315532800))
+    dos_time = (t.tm_hour << 11) | (t.tm_min << 5) | (t.tm_sec // 2)
+    dos_date = ((t.tm_year - 1980) << 9) | (t.tm_mon << 5) | t.tm_mday
+    return dos_time, dos_date
+
+
+def _zip_plan(entries: list[tuple[str, str, os.stat_result]]) -> dict:
+    # Layout eines ZIP_STORED-Archivs; alles außer CRC ist vorab bekannt, daher steht die
+    # Gesamtgröße fest und beliebige Byte-Bereiche lassen sich erzeugen.
+    zip64 = len(entries) >= 0xFFFF or sum(st.st_size + 256 for _n, _p, st in entries) >= 0xFFFFFFFF
+    version = 45 if zip64 else 20
+    parts = []
+    central = []
+    offset = 0
+    for arcname, abs_path, st in entries:
+        name = arcname.encode("utf-8")
+        dos_time, dos_date = _zip_dos_datetime(st.st_mtime)
+        if zip64:
+            extra = struct.pack("<HHQQ", 0x0001, 16, st.st_size, st.st_size)
+            size32 = 0xFFFFFFFF
+        else:
+            extra = b""
+            size32 = st.st_size
+        header = (
+            struct.pack(
+                "<IHHHHHIIIHH",
+                0x04034B50,
+                version,
+                _ZIP_FLAGS,
+                0,
+                dos_time,
+                dos_date,
+                0,
+                size32,
+                size32,
+                len(name),
+                len(extra),
+            )
+            + name
+            + extra
+        )
+        central.append((name, dos_time, dos_date, offset, abs_path, st))
+        parts.append((offset, len(header), "static", header))
+        offset += len(header)
+        parts.append((offset, st.st_size, "file", (abs_path, st)))
+        offset += st.st_size
+        desc_len = 24 if zip64 else 16
+        parts.append((offset, desc_len, "descriptor", (abs_path, st)))
+        offset += desc_len
+
+    cd_len = sum(46 + len(c[0]) + (28 if zip64 else 0) for c in central)
+    end_len = 22 + (76 if zip64 else 0)
+    parts.append((offset, cd_len + end_len, "central", None))
+    return {
+        "parts": parts,
+        "central": central,
+        "zip64": zip64,
+        "version": version,
+        "cd_offset": offset,
+        "cd_len": cd_len,
+        "size": offset + cd_len + end_len,
+    }
+
+
+def _zip_descriptor(plan: dict, abs_path: str, st: os.stat_result) -> bytes:
+    crc = _zip_file_crc(abs_path, st)
+    if plan["zip64"]:
+        return struct.pack("<IIQQ", 0x08074B50, crc, st.st_size, st.st_size)
+    return struct.pack("<IIII", 0x08074B50, crc, st.st_size, st.st_size)
+
+
+def _zip_central(plan: dict) -> bytes:
+    zip64 = plan["zip64"]
+    version = plan["version"]
+    out = []
+    for name, dos_time, dos_date, local_offset, abs_path, st in plan["central"]:
+        crc = _zip_file_crc(abs_path, st)
+        if zip64:
+            extra = struct.pack("<HHQQQ", 0x0001, 24, st.st_size, st.st_size, local_offset)
+            size32 = offset32 = 0xFFFFFFFF
+        else:
+            extra = b""
+            size32, offset32 = st.st_size, local_offset
+        out.append(
+            struct.pack(
+                "<IHHHHHHIIIHHHHHII",
+                0x02014B50,
+                (3 << 8) | version,
+                version,
+                _ZIP_FLAGS,
+                0,
+                dos_time,
+                dos_date,
+                crc,
+                size32,
+                size32,
+                len(name),
+                len(extra),
+                0,
+                0,
+                0,
+                (0o100644 << 16),
+                offset32,
+            )
+            + name
+            + extra
+        )
+    count = len(plan["central"])
+    cd_offset, cd_len = plan["cd_offset"], plan["cd_len"]
+    if zip64:
+        eocd64_offset = cd_offset + cd_len
+        out.append(struct.pack("<IQHHIIQQQQ", 0x06064B50, 44, 45, 45, 0, 0, count, count, cd_len, cd_offset))
+        out.append(struct.pack("<IIQI", 0x07064B50, 0, eocd64_offset, 1))
+        out.append(struct.pack("<IHHHHIIH", 0x06054B50, 0, 0, 0xFFFF, 0xFFFF, 0xFFFFFFFF, 0xFFFFFFFF, 0))
+    else:
+        out.append(struct.pack("<IHHHHIIH", 0x06054B50, 0, 0, count, count, cd_len, cd_offset, 0))
+    return b"".join(out)
+
+
+def _zip_iter(plan: dict, start: int, end: int):
+    for offset, length, kind, data in plan["parts"]:
+        if offset + length <= start or offset > end:
+            continue
+        a = max(start, offset) - offset
+        b = min(end + 1, offset + length) - offset
+        if kind == "static":
+            yield data[a:b]
+        elif kind == "descriptor":
+            yield _zip_descriptor(plan, *data)[a:b]
+        elif kind == "central":
+            yield _zip_central(plan)[a:b]
+        else:
+            abs_path, st = data
+            whole = a == 0 and b == length
+            crc = 0
+            with open(abs_path, "rb") as f:
+                if os.fstat(f.fileno()).st_size != st.st_size:
+                    raise IOError(f"Datei hat sich geändert: {abs_path}")
+                _fadvise_range(f.fileno(), a, b - a)
+                f.seek(a)
+                remaining = b - a
+                while remaining > 0:
+                    chunk = f.read(min(_RANGE_CHUNK_BYTES, remaining))
+                    if not chunk:
+                        raise IOError(f"Datei zu kurz: {abs_path}")
+                    remaining -= len(chunk)
+                    if whole:
+                        crc = zlib.crc32(chunk, crc)
+                    yield chunk
+            if whole:
+                _zip_crc_put(st, crc)
 
 
 def _guess_video_mimetype(path: str) -> str:
@@ -668,28 +3459,277 @@ def _guess_video_mimetype(path: str) -> str:
     return mime or "application/octet-stream"
 
 
-def _list_dir(root: str, relpath: str | None):
-    abs_dir, norm = _safe_abs_path(root, relpath)
-    if not os.path.isdir(abs_dir):
-        raise FileNotFoundError("not_a_directory")
+_LIST_CACHE = {}
+_LIST_CACHE_LOCK = threading.Lock()
+_LIST_CACHE_MAX_DIRS = 256
+_LIST_CACHE_MAX_AGE_SECONDS = 60.0
+_LIST_SORTS = ("name", "size", "mtime", "duration")
+_LIST_PROBE_LIMIT = 200
+
+_CATALOG_POOL = None
+_CATALOG_PENDING = set()
+_CATALOG_LOCK = threading.Lock()
+
+
+def _ffprobe_catalog_info(abs_path: str) -> dict:
+    ffprobe_bin = _resolve_tool_binary("ffprobe")
+    if not ffprobe_bin:
+        return {}
+    cmd = [
+        ffprobe_bin,
+        "-v",
+        "error",
+        "-show_entries",
+        "format=duration:stream=codec_type,codec_name,width,height",
+        "-of",
+        "json",
+        abs_path,
+    ]
+    try:
+        data = json.loads(_tool_output(cmd, text=True, timeout=60) or "{}")
+    except Exception:
+        return {}
+    info = {}
+    try:
+        info["duration"] = float((data.get("format") or {}).get("duration"))
+    except (TypeError, ValueError):
+        pass
+    for s in data.get("streams") or []:
+        if s.get("codec_type") == "video" and "vcodec" not in info:
+            info["vcodec"] = s.get("codec_name")
+            info["width"] = s.get("width")
+            info["height"] = s.get("height")
+        elif s.get("codec_type") == "audio" and "acodec" not in info:
+            info["acodec"] = s.get("codec_name")
+    return info
+
+
+def _catalog_probe(relpath: str, abs_path: str):
+    try:
+        st = os.stat(abs_path)
+        info = _ffprobe_catalog_info(abs_path)
+        with app.app_context():
+            db = _get_db()
+            with db:
+                db.execute(
+                    """
+                    INSERT OR REPLACE INTO media_catalog
+                        (relpath, size, mtime_ns, duration, vcodec, acodec, width, height, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        relpath,
+                        st.st_size,
+                        st.st_mtime_ns,
+                        info.get("duration"),
+                        info.get("vcodec"),
+                        info.get("acodec"),
+                        info.get("width"),
+                        info.get("height"),
+                        _utc_now_iso(),
+                    ),
+                )
+    except (OSError, sqlite3.Error):
+        pass
+    finally:
+        with _CATALOG_LOCK:
+            _CATALOG_PENDING.discard(relpath)
+
+
+def _catalog_enqueue(relpath: str, abs_path: str):
+    global _CATALOG_POOL
+    with _CATALOG_LOCK:
+        if relpath in _CATALOG_PENDING:
+            return
+        _CATALOG_PENDING.add(relpath)
+        if _CATALOG_POOL is None:
+            _CATALOG_POOL = ThreadPoolExecutor(
+                max_workers=max(1, int(app.config.get("CATALOG_WORKERS", 2))), thread_name_prefix="catalog"
+            )
+        pool = _CATALOG_POOL
+    pool.submit(_catalog_probe, relpath, abs_path)
+
+
+@_phase("db")
+def _catalog_lookup(videos: list[dict]) -> dict[str, sqlite3.Row]:
+    # Nur Einträge, deren Größe/mtime noch zur Datei passen.
+    out = {}
+    if not videos:
+        return out
+    by_rel = {v["relpath"]: v for v in videos}
+    rels = list(by_rel)
+    db = _get_db()
+    for i in range(0, len(rels), 500):
+        chunk = rels[i : i + 500]
+        rows = db.execute(
+            f"""
+            SELECT relpath, size, mtime_ns, duration, vcodec, acodec, width, height
+            FROM media_catalog WHERE relpath IN ({",".join("?" * len(chunk))})
+            """,
+            chunk,
+        ).fetchall()
+        for r in rows:
+            v = by_rel[r["relpath"]]
+            if int(r["size"]) == v["size"] and int(r["mtime_ns"]) == v["mtime_ns"]:
+                out[r["relpath"]] = r
+    return out
+
+
+@_phase("fs")
+def _list_dir_scan(abs_dir: str, norm: str) -> dict:
+    # Verzeichnisinhalt je Ordner cachen; gültig solange die mtime des Ordners gleich bleibt.
+    st = os.stat(abs_dir)
+    now = time.time()
+    with _LIST_CACHE_LOCK:
+        cached = _LIST_CACHE.get(abs_dir)
+        if cached and cached["mtime_ns"] == st.st_mtime_ns and now - cached["scanned_at"] < _LIST_CACHE_MAX_AGE_SECONDS:
+            return cached
 
     folders = []
     videos = []
-
     with os.scandir(abs_dir) as it:
         for entry in it:
             if entry.name.startswith("."):
                 continue
+            child_rel = entry.name if norm == "" else f"{norm}/{entry.name}"
             if entry.is_dir(follow_symlinks=False):
-                child_rel = entry.name if norm == "" else f"{norm}/{entry.name}"
                 folders.append({"name": entry.name, "relpath": child_rel})
-            elif entry.is_file(follow_symlinks=False):
-                if _is_allowed_video_filename(entry.name):
-                    child_rel = entry.name if norm == "" else f"{norm}/{entry.name}"
-                    videos.append({"name": entry.name, "relpath": child_rel})
-
+            elif entry.is_file(follow_symlinks=False) and _is_allowed_video_filename(entry.name):
+                try:
+                    est = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                videos.append(
+                    {
+                        "name": entry.name,
+                        "relpath": child_rel,
+                        "abs_path": entry.path,
+                        "size": est.st_size,
+                        "mtime_ns": est.st_mtime_ns,
+                        "tags": _extract_tags_from_filename(entry.name),
+                    }
+                )
     folders.sort(key=lambda x: x["name"].lower())
-    videos.sort(key=lambda x: x["name"].lower())
+
+    cached = {"mtime_ns": st.st_mtime_ns, "scanned_at": now, "folders": folders, "videos": videos, "orders": {}}
+    with _LIST_CACHE_LOCK:
+        _LIST_CACHE.pop(abs_dir, None)
+        _LIST_CACHE[abs_dir] = cached
+        while len(_LIST_CACHE) > _LIST_CACHE_MAX_DIRS:
+            _LIST_CACHE.pop(next(iter(_LIST_CACHE)))
+    return cached
+
+
+def _list_sort_key(sort: str, order: str, v: dict, durations: dict | None = None) -> tuple:
+    name = v["name"]
+    if sort == "size":
+        return (v["size"], name.lower(), name)
+    if sort == "mtime":
+        return (v["mtime_ns"], name.lower(), name)
+    if sort == "duration":
+        d = (durations or {}).get(v["relpath"])
+        # Unbekannte Dauer in beiden Richtungen ans Ende
+        missing = d is None if order == "asc" else d is not None
+        return (missing, d or 0.0, name.lower(), name)
+    return (name.lower(), name)
+
+
+def _list_encode_cursor(key: tuple) -> str:
+    raw = json.dumps(list(key), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _list_decode_cursor(cursor: str) -> tuple:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        key = json.loads(raw.decode("utf-8"))
+    except Exception:
+        raise ValueError("bad_cursor")
+    if not isinstance(key, list):
+        raise ValueError("bad_cursor")
+    return tuple(key)
+
+
+@_phase("index")
+def _list_dir(
+    root: str,
+    relpath: str | None,
+    sort: str = "name",
+    order: str = "asc",
+    offset: int = 0,
+    limit: int | None = None,
+    cursor: str | None = None,
+):
+    abs_dir, norm = _safe_abs_path(root, relpath)
+    if not os.path.isdir(abs_dir):
+        raise FileNotFoundError("not_a_directory")
+    if sort not in _LIST_SORTS:
+        raise ValueError("bad_sort")
+    if order not in ("asc", "desc"):
+        raise ValueError("bad_order")
+
+    cached = _list_dir_scan(abs_dir, norm)
+    all_videos = cached["videos"]
+
+    catalog = None
+    if sort == "duration":
+        catalog = _catalog_lookup(all_videos)
+        durations = {rp: r["duration"] for rp, r in catalog.items() if r["duration"] is not None}
+        for v in all_videos:
+            if v["relpath"] not in catalog:
+                _catalog_enqueue(v["relpath"], v["abs_path"])
+        pairs = sorted(((_list_sort_key(sort, order, v, durations), v) for v in all_videos), key=lambda p: p[0])
+        keys = [p[0] for p in pairs]
+        ordered = [p[1] for p in pairs]
+    else:
+        with _LIST_CACHE_LOCK:
+            pre = cached["orders"].get(sort)
+        if pre is None:
+            pairs = sorted(((_list_sort_key(sort, order, v), v) for v in all_videos), key=lambda p: p[0])
+            pre = ([p[0] for p in pairs], [p[1] for p in pairs])
+            with _LIST_CACHE_LOCK:
+                cached["orders"][sort] = pre
+        keys, ordered = pre
+
+    total = len(ordered)
+    desc = order == "desc"
+    if cursor:
+        # Keyset-Paginierung: stabil auch wenn zwischen zwei Seiten Dateien dazukommen
+        key = _list_decode_cursor(cursor)
+        try:
+            start = total - bisect.bisect_left(keys, key) if desc else bisect.bisect_right(keys, key)
+        except TypeError:
+            raise ValueError("bad_cursor")
+    else:
+        start = max(0, int(offset))
+    stop = total if limit is None else min(total, start + max(1, int(limit)))
+
+    if desc:
+        page_src = [ordered[total - 1 - i] for i in range(start, stop)]
+        page_keys = [keys[total - 1 - i] for i in range(start, stop)]
+    else:
+        page_src = ordered[start:stop]
+        page_keys = keys[start:stop]
+
+    if catalog is None:
+        catalog = _catalog_lookup(page_src)
+    videos = []
+    with _phase("fs"):
+        for idx, src_v in enumerate(page_src):
+            v = {k: val for k, val in src_v.items() if k != "abs_path"}
+            v["mtime"] = src_v["mtime_ns"] / 1e9
+            row = catalog.get(src_v["relpath"])
+            if row is not None:
+                v["duration"] = row["duration"]
+                v["vcodec"] = row["vcodec"]
+                v["width"] = row["width"]
+                v["height"] = row["height"]
+            else:
+                v["duration"] = None
+                if idx < _LIST_PROBE_LIMIT:
+                    _catalog_enqueue(src_v["relpath"], src_v["abs_path"])
+            v.update(_thumb_fields(src_v["abs_path"], enqueue=idx < _THUMB_ENQUEUE_LIMIT))
+            videos.append(v)
 
     if norm == "":
         parent_path = None
@@ -700,15 +3740,22 @@ def _list_dir(root: str, relpath: str | None):
     return {
         "current_path": norm,
         "parent_path": parent_path,
-        "folders": folders,
+        "folders": cached["folders"] if start == 0 else [],
         "videos": videos,
+        "sort": sort,
+        "order": order,
+        "offset": start,
+        "total_videos": total,
+        "next_offset": stop if stop < total else None,
+        "next_cursor": _list_encode_cursor(page_keys[-1]) if stop < total and page_keys else None,
     }
 
-def _unique_destination_filename(dest_dir_abs: str, filename: str):
+
+def _unique_destination_filename(dest_dir_abs: str, filename: str, reserved: set | None = None):
     base, ext = os.path.splitext(filename)
     candidate = filename
     i = 1
-    while os.path.exists(os.path.join(dest_dir_abs, candidate)):
+    while os.path.exists(os.path.join(dest_dir_abs, candidate)) or (reserved is not None and candidate in reserved):
         candidate = f"{base}_{i}{ext}"
         i += 1
     return candidate
@@ -716,12 +3763,19 @@ def _unique_destination_filename(dest_dir_abs: str, filename: str):
 
 def _sha256_file(abs_path: str) -> str:
     h = hashlib.sha256()
-    with open(abs_path, "rb") as f:
-        while True:
-            chunk = f.read(1024 * 1024)
-            if not chunk:
-                break
-            h.update(chunk)
+    started = time.perf_counter()
+    hashed = 0
+    try:
+        with open(abs_path, "rb") as f:
+            while True:
+                chunk = f.read(1024 * 1024)
+                if not chunk:
+                    break
+                h.update(chunk)
+                hashed += len(chunk)
+    finally:
+        _metric_inc("dedupe_hashed_bytes_total", hashed)
+        _metric_inc("dedupe_hash_seconds_total", time.perf_counter() - started)
     return h.hexdigest()
 
 
@@ -840,6 +3894,13 @@ def _dedupe_scan_update(scan_id: str, **fields):
             st[k] = v
         st["updated_at"] = _utc_now_iso()
         _DEDUPE_SCANS[scan_id] = st
+        payload = _shared_job_mark("dedupe", scan_id, st, _DEDUPE_SCANS_LOCK, force="status" in fields)
+        status = st.get("status")
+        event = _dedupe_status_payload(scan_id, st, with_log=status in _EVENT_FINAL_TYPES)
+    if payload:
+        _shared_job_write("dedupe", scan_id, payload)
+    event_type = status if status in _EVENT_FINAL_TYPES else ("phase" if "phase" in fields else "progress")
+    _event_publish("dedupe", scan_id, event_type, event, coalesce=event_type == "progress")
 
 
 def _dedupe_scan_log(scan_id: str, message: str):
@@ -858,6 +3919,10 @@ def _dedupe_scan_log(scan_id: str, message: str):
         st["log"] = logs
         st["updated_at"] = _utc_now_iso()
         _DEDUPE_SCANS[scan_id] = st
+        payload = _shared_job_mark("dedupe", scan_id, st, _DEDUPE_SCANS_LOCK)
+    if payload:
+        _shared_job_write("dedupe", scan_id, payload)
+    _event_publish("dedupe", scan_id, "log", {"line": line})
 
 
 def _start_dedupe_scan_job(dir_abs: str, dir_norm: str) -> str:
@@ -885,6 +3950,9 @@ def _start_dedupe_scan_job(dir_abs: str, dir_norm: str) -> str:
     }
     with _DEDUPE_SCANS_LOCK:
         _DEDUPE_SCANS[scan_id] = scan_state
+        payload = _shared_job_mark("dedupe", scan_id, scan_state, _DEDUPE_SCANS_LOCK, force=True)
+    _shared_job_write("dedupe", scan_id, payload)
+    _start_job_flusher()
 
     def _worker():
         with app.app_context():
@@ -1048,6 +4116,196 @@ def _start_dedupe_scan_job(dir_abs: str, dir_norm: str) -> str:
     return scan_id
 
 
+_FASTSTART_EXTENSIONS = {".mp4", ".mov"}
+
+
+def _mp4_moov_position(abs_path: str) -> str | None:
+    # Liest nur die Top-Level-Atom-Header: "front", "end" oder None.
+    with open(abs_path, "rb") as f:
+        total = os.fstat(f.fileno()).st_size
+        pos = 0
+        seen_mdat = False
+        while pos + 8 <= total:
+            f.seek(pos)
+            hdr = f.read(8)
+            if len(hdr) < 8:
+                break
+            size, typ = struct.unpack(">I4s", hdr)
+            if size == 1:
+                ext = f.read(8)
+                if len(ext) < 8:
+                    return None
+                size = struct.unpack(">Q", ext)[0]
+            elif size == 0:
+                size = total - pos
+            if size < 8:
+                return None
+            if typ == b"moov":
+                return "end" if seen_mdat else "front"
+            if typ == b"mdat":
+                seen_mdat = True
+            pos += size
+    return None
+
+
+def _faststart_fix_file(ffmpeg_bin: str, abs_path: str):
+    st = os.stat(abs_path)
+    d, base = os.path.split(abs_path)
+    stem, ext = os.path.splitext(base)
+    tmp = os.path.join(d, f".{stem}.{uuid.uuid4().hex}.faststart{ext}")
+    cmd = [
+        ffmpeg_bin,
+        "-y",
+        "-nostdin",
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-i",
+        abs_path,
+        "-map",
+        "0",
+        "-c",
+        "copy",
+        "-map_metadata",
+        "0",
+        "-movflags",
+        "+faststart",
+        tmp,
+    ]
+    try:
+        _tool_run(cmd, check=True, capture_output=True, text=True)
+        if _mp4_moov_position(tmp) != "front":
+            raise RuntimeError("Remux ohne moov am Anfang.")
+        cur = os.stat(abs_path)
+        if (cur.st_size, cur.st_mtime_ns) != (st.st_size, st.st_mtime_ns):
+            raise RuntimeError("Datei wurde während des Remux verändert.")
+        shutil.copymode(abs_path, tmp)
+        os.utime(tmp, ns=(st.st_atime_ns, st.st_mtime_ns))
+        os.replace(tmp, abs_path)
+    finally:
+        try:
+            os.remove(tmp)
+        except FileNotFoundError:
+            pass
+
+
+def _faststart_job_update(job_id: str, **fields):
+    with _FASTSTART_JOBS_LOCK:
+        st = _FASTSTART_JOBS.get(job_id)
+        if not st:
+            return
+        st.update(fields)
+        st["updated_at"] = _utc_now_iso()
+        payload = _shared_job_mark("faststart", job_id, st, _FASTSTART_JOBS_LOCK, force="status" in fields)
+        event = json.loads(payload) if payload else json.loads(json.dumps(st))
+    if payload:
+        _shared_job_write("faststart", job_id, payload)
+    status = event.get("status")
+    event_type = status if status in _EVENT_FINAL_TYPES else "progress"
+    _event_publish("faststart", job_id, event_type, {"ok": True, **event}, coalesce=event_type == "progress")
+
+
+def _start_faststart_job(dir_abs: str, dir_norm: str, dry_run: bool = False) -> str:
+    job_id = str(uuid.uuid4())
+    with _FASTSTART_JOBS_LOCK:
+        _FASTSTART_JOBS[job_id] = {
+            "job_id": job_id,
+            "root": dir_norm,
+            "dry_run": dry_run,
+            "created_at": _utc_now_iso(),
+            "updated_at": _utc_now_iso(),
+            "status": "running",
+            "phase": "Scan",
+            "message": "Dateien prüfen…",
+            "progress": {"scanned": 0, "needs_fix": 0, "fixed": 0, "failed": 0},
+            "files": [],
+            "errors": [],
+            "error": None,
+        }
+        payload = _shared_job_mark("faststart", job_id, _FASTSTART_JOBS[job_id], _FASTSTART_JOBS_LOCK, force=True)
+    _shared_job_write("faststart", job_id, payload)
+    _start_job_flusher()
+
+    def _worker():
+        with app.app_context():
+            try:
+                video_root_abs = os.path.abspath(app.config["VIDEO_ROOT"])
+                ffmpeg_bin = None if dry_run else _resolve_tool_binary("ffmpeg")
+                if not dry_run and not ffmpeg_bin:
+                    raise FileNotFoundError("ffmpeg nicht gefunden")
+
+                candidates = []
+                scanned = 0
+                for walk_dirpath, dirnames, filenames in os.walk(dir_abs):
+                    dirnames[:] = [dn for dn in dirnames if not dn.startswith(".")]
+                    for fn in filenames:
+                        if fn.startswith(".") or os.path.splitext(fn)[1].lower() not in _FASTSTART_EXTENSIONS:
+                            continue
+                        abs_path = os.path.join(walk_dirpath, fn)
+                        scanned += 1
+                        try:
+                            if _mp4_moov_position(abs_path) == "end":
+                                candidates.append(abs_path)
+                        except OSError:
+                            continue
+                        if scanned % 200 == 0:
+                            _faststart_job_update(
+                                job_id,
+                                progress={"scanned": scanned, "needs_fix": len(candidates), "fixed": 0, "failed": 0},
+                            )
+
+                files = [_normalize_relpath(os.path.relpath(p, video_root_abs)) for p in candidates]
+                _faststart_job_update(
+                    job_id,
+                    phase="Fix" if not dry_run else "Done",
+                    message=f"{len(candidates)} Dateien ohne Faststart.",
+                    progress={"scanned": scanned, "needs_fix": len(candidates), "fixed": 0, "failed": 0},
+                    files=files,
+                )
+
+                fixed = 0
+                failed = 0
+                errors = []
+                if not dry_run:
+                    for i, (abs_path, rel) in enumerate(zip(candidates, files), start=1):
+                        _faststart_job_update(job_id, message=f"Remux {i}/{len(candidates)}: {rel}")
+                        try:
+                            _faststart_fix_file(ffmpeg_bin, abs_path)
+                            fixed += 1
+                        except Exception as e:
+                            failed += 1
+                            errors.append({"relpath": rel, "error": str(getattr(e, "stderr", None) or e)[-500:]})
+                        _faststart_job_update(
+                            job_id,
+                            progress={
+                                "scanned": scanned,
+                                "needs_fix": len(candidates),
+                                "fixed": fixed,
+                                "failed": failed,
+                            },
+                            errors=errors[-50:],
+                        )
+                    if fixed:
+                        _start_tag_index_build()
+
+                _faststart_job_update(
+                    job_id,
+                    status="done",
+                    phase="Done",
+                    message=(
+                        f"{len(candidates)} von {scanned} Dateien ohne Faststart."
+                        if dry_run
+                        else f"{fixed} Dateien korrigiert, {failed} fehlgeschlagen."
+                    ),
+                )
+            except Exception as e:
+                _faststart_job_update(job_id, status="error", phase="Error", message="Faststart-Lauf fehlgeschlagen.", error=str(e))
+
+    t = threading.Thread(target=_worker, daemon=True)
+    t.start()
+    return job_id
+
+
 @app.route("/", methods=["GET"])
 def index():
     return render_template("index.html")
@@ -1069,13 +4327,79 @@ def api_config():
         return _json_error("Config konnte nicht geladen werden.", 500, code="server_error")
 
 
+def _metrics_dir_size(name: str, dir_abs: str) -> int:
+    # Verzeichnisgrößen nur gelegentlich neu summieren, damit Scrapes billig bleiben.
+    now = time.time()
+    with _METRICS_LOCK:
+        cached = _METRICS_DIR_SIZES.get(name)
+    if cached and now - cached[0] < _METRICS_DIR_SIZE_MAX_AGE_SECONDS:
+        return cached[1]
+    size = _dir_size_bytes(dir_abs)
+    with _METRICS_LOCK:
+        _METRICS_DIR_SIZES[name] = (now, size)
+    return size
+
+
+def _metrics_collect_gauges():
+    for kind, jobs, lock in (
+        ("merge", _MERGE_JOBS, _MERGE_JOBS_LOCK),
+        ("dedupe", _DEDUPE_SCANS, _DEDUPE_SCANS_LOCK),
+        ("faststart", _FASTSTART_JOBS, _FASTSTART_JOBS_LOCK),
+        ("clip", _CLIP_JOBS, _CLIP_JOBS_LOCK),
+    ):
+        with lock:
+            running = sum(1 for j in jobs.values() if j.get("status") == "running")
+        _metric_set("jobs_running", running, kind=kind)
+    _metric_set("jobs_running", 1 if _TAG_INDEX_BUILDING else 0, kind="tag_index")
+    try:
+        row = _get_db().execute("SELECT COUNT(*) FROM queue_items WHERE state = 'copying'").fetchone()
+        _metric_set("jobs_running", row[0], kind="transfer")
+    except sqlite3.Error:
+        pass
+    with _MEDIA_TASKS_LOCK:
+        _metric_set("jobs_running", sum(1 for f in _MEDIA_TASKS.values() if not f.done()), kind="media")
+
+    for name, cache, lock in (
+        ("list", _LIST_CACHE, _LIST_CACHE_LOCK),
+        ("keyframes", _KEYFRAME_CACHE, _KEYFRAME_CACHE_LOCK),
+        ("zip_crc", _ZIP_CRC_CACHE, _ZIP_CRC_CACHE_LOCK),
+        ("catalog_pending", _CATALOG_PENDING, _CATALOG_LOCK),
+    ):
+        with lock:
+            _metric_set("cache_entries", len(cache), cache=name)
+
+    for kind in ("proxy", "thumbs", "remux"):
+        _metric_set("cache_bytes", _metrics_dir_size(kind, _media_cache_dir(kind)), cache=kind)
+    _metric_set("cache_bytes", _metrics_dir_size("merge_jobs", _merge_jobs_dir()), cache="merge_jobs")
+
+
+@app.route("/metrics", methods=["GET"])
+def metrics():
+    _metrics_collect_gauges()
+    return Response(_metrics_render(), content_type="text/plain; version=0.0.4; charset=utf-8")
+
+
 @app.route("/api/list", methods=["GET"])
 def api_list():
     rel = request.args.get("path", "")
+    sort = request.args.get("sort", "name")
+    order = request.args.get("order", "asc")
+    cursor = request.args.get("cursor") or None
     try:
-        data = _list_dir(app.config["VIDEO_ROOT"], rel)
-        return jsonify(data)
+        offset = max(0, int(request.args.get("offset", 0)))
+        limit = int(request.args.get("limit", app.config.get("LIST_PAGE_SIZE", 200)))
     except ValueError:
+        return _json_error("offset/limit müssen Zahlen sein.", 400, code="bad_request")
+    max_limit = int(app.config.get("LIST_PAGE_MAX", 2000))
+    limit = max_limit if limit <= 0 else min(limit, max_limit)
+    if sort not in _LIST_SORTS or order not in ("asc", "desc"):
+        return _json_error("Ungültige Sortierung.", 400, code="bad_request", details={"sorts": list(_LIST_SORTS)})
+    try:
+        data = _list_dir(app.config["VIDEO_ROOT"], rel, sort=sort, order=order, offset=offset, limit=limit, cursor=cursor)
+        return jsonify(data)
+    except ValueError as e:
+        if str(e) == "bad_cursor":
+            return _json_error("Ungültiger Cursor.", 400, code="bad_cursor")
         return _json_error("Ungültiger Pfad.", 400, code="invalid_path")
     except FileNotFoundError:
         return _json_error("Ordner nicht gefunden.", 404, code="not_found")
@@ -1114,30 +4438,59 @@ def api_dedupe_scan():
 
 @app.route("/api/dedupe/scan/status/<scan_id>", methods=["GET"])
 def api_dedupe_scan_status(scan_id: str):
-    with _DEDUPE_SCANS_LOCK:
-        st = _DEDUPE_SCANS.get(scan_id)
+    st = _shared_job_get("dedupe", scan_id, _DEDUPE_SCANS, _DEDUPE_SCANS_LOCK)
     if not st:
         return _json_error("Scan nicht gefunden.", 404, code="not_found")
 
+    return jsonify(_dedupe_status_payload(scan_id, st))
+
+
+def _dedupe_status_payload(scan_id: str, st: dict, with_log: bool = True) -> dict:
     logs = st.get("log")
     if not isinstance(logs, list):
         logs = []
 
-    return jsonify(
-        {
-            "ok": True,
-            "scan_id": scan_id,
-            "root": st.get("root"),
-            "status": st.get("status"),
-            "phase": st.get("phase"),
-            "message": st.get("message"),
-            "progress": st.get("progress", {}),
-            "error": st.get("error"),
-            "updated_at": st.get("updated_at"),
-            "log_tail": logs[-60:],
-            "groups": st.get("groups", []) if st.get("status") == "done" else [],
-        }
-    )
+    out = {
+        "ok": True,
+        "scan_id": scan_id,
+        "root": st.get("root"),
+        "status": st.get("status"),
+        "phase": st.get("phase"),
+        "message": st.get("message"),
+        "progress": dict(st.get("progress") or {}),
+        "error": st.get("error"),
+        "updated_at": st.get("updated_at"),
+        "groups": list(st.get("groups") or []) if st.get("status") == "done" else [],
+    }
+    if with_log:
+        out["log_tail"] = logs[-60:]
+    return out
+
+
+@app.route("/api/faststart/scan", methods=["POST"])
+def api_faststart_scan():
+    body = request.get_json(silent=True) or {}
+    dir_relpath = body.get("dir_relpath", "") or ""
+    if not isinstance(dir_relpath, str):
+        return _json_error("dir_relpath muss string sein.", 400, code="bad_request")
+    dry_run = bool(body.get("dry_run", False))
+
+    try:
+        abs_dir, norm = _safe_abs_path(app.config["VIDEO_ROOT"], dir_relpath)
+        if not os.path.isdir(abs_dir):
+            return _json_error("Ordner nicht gefunden.", 404, code="not_found")
+        job_id = _start_faststart_job(abs_dir, norm, dry_run=dry_run)
+        return jsonify({"ok": True, "job_id": job_id, "root": norm, "dry_run": dry_run})
+    except ValueError:
+        return _json_error("Ungültiger Pfad.", 400, code="invalid_path")
+
+
+@app.route("/api/faststart/status/<job_id>", methods=["GET"])
+def api_faststart_status(job_id: str):
+    st = _shared_job_get("faststart", job_id, _FASTSTART_JOBS, _FASTSTART_JOBS_LOCK)
+    if not st:
+        return _json_error("Job nicht gefunden.", 404, code="not_found")
+    return jsonify({"ok": True, **st})
 
 
 @app.route("/api/dedupe/move", methods=["POST"])
@@ -1151,8 +4504,7 @@ def api_dedupe_move():
     if group_id is not None and not isinstance(group_id, str):
         return _json_error("group_id muss string sein.", 400, code="bad_request")
 
-    with _DEDUPE_SCANS_LOCK:
-        scan = _DEDUPE_SCANS.get(scan_id)
+    scan = _shared_job_get("dedupe", scan_id, _DEDUPE_SCANS, _DEDUPE_SCANS_LOCK)
 
     if not scan:
         return _json_error("Scan nicht gefunden.", 404, code="not_found")
@@ -1207,7 +4559,10 @@ def api_dedupe_move():
 
         with _DEDUPE_SCANS_LOCK:
             scan["groups"] = groups
-            _DEDUPE_SCANS[scan_id] = scan
+            if scan_id in _DEDUPE_SCANS:
+                _DEDUPE_SCANS[scan_id] = scan
+            payload = _shared_job_mark("dedupe", scan_id, scan, _DEDUPE_SCANS_LOCK, force=True)
+        _shared_job_write("dedupe", scan_id, payload)
 
         if moved:
             _start_tag_index_build()
@@ -1246,17 +4601,24 @@ def api_transfer():
         os.makedirs(tgt_dir_abs, exist_ok=True)
 
         src_filename = os.path.basename(src_norm)
-        dest_filename = _unique_destination_filename(tgt_dir_abs, src_filename)
+        dest_filename = _queue_reserve_target(tgt_dir_abs, src_filename)
 
         target_relpath = dest_filename if tgt_subdir_norm == "" else f"{tgt_subdir_norm}/{dest_filename}"
         target_abs, _ = _safe_abs_path(app.config["TARGET_ROOT"], target_relpath)
 
-        if mode == "copy":
-            shutil.copy2(src_abs, target_abs)
-        else:
-            shutil.move(src_abs, target_abs)
-
-        item, _created = _queue_add_item(target_relpath, source_relpath=src_norm)
+        try:
+            ((item, _created, code),) = _queue_add_many(
+                [(target_relpath, src_norm)], state="copying", bytes_total=[os.path.getsize(src_abs)]
+            )
+        except Exception:
+            item, code = None, "server_error"
+        if item is None:
+            os.remove(target_abs)
+            if code == "duplicate":
+                return _json_error("Dieses Video ist bereits in der Queue.", 409, code="duplicate")
+            return _json_error("Transfer fehlgeschlagen.", 500, code="server_error")
+
+        _queue_submit_transfer(item["id"], src_abs, target_abs, mode)
         return jsonify(
             {
                 "ok": True,
@@ -1265,6 +4627,8 @@ def api_transfer():
                     "relpath": src_norm,
                     "filename": item["filename"],
                     "target_relpath": item["target_relpath"],
+                    "state": item["state"],
+                    "bytes_total": item["bytes_total"],
                 },
             }
         )
@@ -1280,6 +4644,136 @@ def api_transfer():
         return _json_error("Transfer fehlgeschlagen.", 500, code="server_error")
 
 
+def _batch_paths(body: dict, key: str):
+    paths = body.get(key)
+    if not isinstance(paths, list) or not all(isinstance(p, str) and p for p in paths):
+        return None, _json_error(f"{key} muss Liste von strings sein.", 400, code="bad_request")
+    if not paths:
+        return None, _json_error(f"{key} ist leer.", 400, code="bad_request")
+    if len(paths) > int(app.config.get("TRANSFER_BATCH_MAX", 500)):
+        return None, _json_error(f"Zu viele Einträge in {key}.", 400, code="bad_request")
+    return paths, None
+
+
+@app.route("/api/transfer/batch", methods=["POST"])
+def api_transfer_batch():
+    body = request.get_json(silent=True) or {}
+    target_subdir = body.get("target_subdir", "")
+    mode = body.get("mode", "copy")
+    if mode not in ("copy", "move"):
+        return _json_error("Ungültiger mode.", 400, code="bad_request")
+    source_paths, err = _batch_paths(body, "source_paths")
+    if err:
+        return err
+
+    try:
+        tgt_dir_abs, tgt_subdir_norm = _safe_abs_path(app.config["TARGET_ROOT"], target_subdir or "")
+    except ValueError:
+        return _json_error("Ungültiger Pfad.", 400, code="invalid_path")
+
+    results = [{"source_path": p, "ok": False} for p in source_paths]
+    planned = []
+    seen = set()
+    for i, p in enumerate(source_paths):
+        try:
+            src_abs, src_norm = _safe_abs_path(app.config["VIDEO_ROOT"], p)
+        except ValueError:
+            results[i].update(error="Ungültiger Pfad.", code="invalid_path")
+            continue
+        results[i]["relpath"] = src_norm
+        if not _is_allowed_video_filename(os.path.basename(src_norm)):
+            results[i].update(error="Nicht erlaubte Video-Endung.", code="invalid_video_extension")
+            continue
+        if not os.path.isfile(src_abs):
+            results[i].update(error="Quelldatei nicht gefunden.", code="not_found")
+            continue
+        if src_norm in seen or _queue_get_by_source_relpath(src_norm):
+            results[i].update(error="Dieses Video ist bereits in der Queue.", code="duplicate")
+            continue
+        seen.add(src_norm)
+        planned.append((i, src_abs, src_norm))
+
+    reserved = []
+    if planned:
+        os.makedirs(tgt_dir_abs, exist_ok=True)
+    for i, src_abs, src_norm in planned:
+        dest_filename = _queue_reserve_target(tgt_dir_abs, os.path.basename(src_norm))
+        target_relpath = dest_filename if tgt_subdir_norm == "" else f"{tgt_subdir_norm}/{dest_filename}"
+        target_abs, _ = _safe_abs_path(app.config["TARGET_ROOT"], target_relpath)
+        reserved.append((i, src_abs, src_norm, target_abs, target_relpath))
+
+    try:
+        added = _queue_add_many(
+            [(t[4], t[2]) for t in reserved],
+            state="copying",
+            bytes_total=[os.path.getsize(t[1]) for t in reserved],
+        )
+    except Exception:
+        _get_db().rollback()
+        added = [(None, False, "server_error")] * len(reserved)
+    for (i, src_abs, src_norm, target_abs, _target_relpath), (item, _created, code) in zip(reserved, added):
+        if item is None:
+            try:
+                os.remove(target_abs)
+            except OSError:
+                pass
+            results[i].update(error="Queue-Eintrag konnte nicht angelegt werden.", code=code or "server_error")
+            continue
+        _queue_submit_transfer(item["id"], src_abs, target_abs, mode)
+        results[i].update(
+            ok=True,
+            queue_item={
+                "id": item["id"],
+                "relpath": src_norm,
+                "filename": item["filename"],
+                "target_relpath": item["target_relpath"],
+                "state": item["state"],
+                "bytes_total": item["bytes_total"],
+            },
+        )
+
+    n_ok = sum(1 for r in results if r["ok"])
+    return jsonify({"ok": True, "added": n_ok, "failed": len(results) - n_ok, "results": results})
+
+
+@app.route("/api/queue/add/batch", methods=["POST"])
+def api_queue_add_batch():
+    body = request.get_json(silent=True) or {}
+    target_relpaths, err = _batch_paths(body, "target_relpaths")
+    if err:
+        return err
+
+    results = [{"target_relpath": p, "ok": False} for p in target_relpaths]
+    rows = []
+    for i, p in enumerate(target_relpaths):
+        try:
+            target_abs, norm = _safe_abs_path(app.config["TARGET_ROOT"], p)
+        except ValueError:
+            results[i].update(error="Ungültiger Pfad.", code="invalid_path")
+            continue
+        if not _is_allowed_video_filename(os.path.basename(norm)):
+            results[i].update(error="Nicht erlaubte Video-Endung.", code="invalid_video_extension")
+            continue
+        if not os.path.isfile(target_abs):
+            results[i].update(error="Zieldatei nicht gefunden.", code="not_found")
+            continue
+        rows.append((i, norm))
+
+    try:
+        added = _queue_add_many([(norm, None) for _i, norm in rows])
+    except Exception:
+        _get_db().rollback()
+        return _json_error("Queue add fehlgeschlagen.", 500, code="server_error")
+    for (i, _norm), (item, created, code) in zip(rows, added):
+        if item is None:
+            results[i].update(error="Dieses Video ist bereits in der Queue.", code=code or "duplicate")
+            continue
+        results[i].update(ok=True, created=created, item=item)
+
+    n_ok = sum(1 for r in results if r["ok"])
+    return jsonify({"ok": True, "added": n_ok, "failed": len(results) - n_ok, "results": results})
+
+
 @app.route("/api/queue", methods=["GET"])
 def api_queue():
     items = _queue_get_items()
@@ -1327,11 +4821,15 @@ def api_queue_reorder():
             if sorted(current_ids) != sorted(ordered_ids):
                 return _json_error("ordered_ids muss exakt alle aktuellen IDs enthalten.", 400, code="bad_request")
             order = ordered_ids
-            id_to_pos = {item_id: idx for idx, item_id in enumerate(order)}
+            current_pos = {it["id"]: it["position"] for it in items}
+            updates = [
+                ((idx + 1) * _QUEUE_POSITION_GAP, item_id)
+                for idx, item_id in enumerate(order)
+                if current_pos.get(item_id) != (idx + 1) * _QUEUE_POSITION_GAP
+            ]
             db = _get_db()
             with db:
-                for item_id, pos in id_to_pos.items():
-                    db.execute("UPDATE queue_items SET position = ? WHERE id = ?", (pos, item_id))
+                db.executemany("UPDATE queue_items SET position = ? WHERE id = ?", updates)
         else:
             if not isinstance(ordered_paths, list) or not all(isinstance(x, str) for x in ordered_paths):
                 return _json_error("ordered_target_relpaths muss Liste von strings sein.", 400, code="bad_request")
@@ -1344,11 +4842,15 @@ def api_queue_reorder():
                     code="bad_request",
                 )
             order = normalized
-            path_to_pos = {p: idx for idx, p in enumerate(order)}
+            current_pos = {it["target_relpath"]: it["position"] for it in items}
+            updates = [
+                ((idx + 1) * _QUEUE_POSITION_GAP, p)
+                for idx, p in enumerate(order)
+                if current_pos.get(p) != (idx + 1) * _QUEUE_POSITION_GAP
+            ]
             db = _get_db()
             with db:
-                for p, pos in path_to_pos.items():
-                    db.execute("UPDATE queue_items SET position = ? WHERE target_relpath = ?", (pos, p))
+                db.executemany("UPDATE queue_items SET position = ? WHERE target_relpath = ?", updates)
 
         return jsonify({"ok": True})
     except ValueError:
@@ -1357,6 +4859,32 @@ def api_queue_reorder():
         return _json_error("Reorder fehlgeschlagen.", 500, code="server_error")
 
 
+@app.route("/api/queue/move", methods=["POST"])
+def api_queue_move():
+    body = request.get_json(silent=True) or {}
+    item_id = body.get("id")
+    before_id = body.get("before_id")
+    after_id = body.get("after_id")
+
+    if not isinstance(item_id, int):
+        return _json_error("id muss integer sein.", 400, code="bad_request")
+    if (before_id is None) == (after_id is None):
+        return _json_error("Genau eines von before_id oder after_id angeben.", 400, code="bad_request")
+    anchor_id = before_id if before_id is not None else after_id
+    if not isinstance(anchor_id, int):
+        return _json_error("before_id/after_id muss integer sein.", 400, code="bad_request")
+    if anchor_id == item_id:
+        return jsonify({"ok": True, "item": _queue_get_by_id(item_id)})
+
+    try:
+        item = _queue_move_item(item_id, before_id=before_id, after_id=after_id)
+        return jsonify({"ok": True, "item": item})
+    except LookupError:
+        return _json_error("Eintrag nicht gefunden.", 404, code="not_found")
+    except Exception:
+        return _json_error("Verschieben fehlgeschlagen.", 500, code="server_error")
+
+
 @app.route("/api/queue/item", methods=["DELETE"])
 def api_queue_delete_item():
     item_id = request.args.get("id")
@@ -1420,127 +4948,271 @@ def api_queue_download_zip():
         if not it:
             return _json_error("Item nicht gefunden.", 404, code="not_found", details={"id": item_id})
         selected.append(it)
+    not_ready = _queue_not_ready(selected)
+    if not_ready:
+        return not_ready
 
-    tmp_dir = os.path.dirname(app.config["DB_PATH"])
-    zip_fd, zip_path = tempfile.mkstemp(prefix="queue_selected_", suffix=".zip", dir=tmp_dir)
-    os.close(zip_fd)
+    def _zip_arcname(index: int, item: dict) -> str:
+        fn = str(item.get("filename") or "")
+        rp = str(item.get("target_relpath") or "")
+        item_id = int(item.get("id") or 0)
 
-    try:
-        def _zip_arcname(index: int, item: dict) -> str:
-            fn = str(item.get("filename") or "")
-            rp = str(item.get("target_relpath") or "")
-            item_id = int(item.get("id") or 0)
-
-            h = hashlib.sha1(rp.encode("utf-8")).hexdigest()[:8] if rp else "00000000"
-            _base, ext = os.path.splitext(fn if fn else os.path.basename(rp))
-            ext = ext or ""
-            return f"{index:03d}_{item_id}_{h}{ext}"
+        h = hashlib.sha1(rp.encode("utf-8")).hexdigest()[:8] if rp else "00000000"
+        _base, ext = os.path.splitext(fn if fn else os.path.basename(rp))
+        ext = ext or ""
+        return f"{index:03d}_{item_id}_{h}{ext}"
 
-        with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
-            for idx, it in enumerate(selected, start=1):
-                rp = it.get("target_relpath")
-                if not rp:
-                    continue
-                abs_p, _ = _safe_abs_path(app.config["TARGET_ROOT"], rp)
-                if not os.path.isfile(abs_p):
-                    raise FileNotFoundError(rp)
-                arcname = _zip_arcname(idx, it)
-                zf.write(abs_p, arcname=arcname)
-    except FileNotFoundError:
-        try:
-            os.remove(zip_path)
-        except Exception:
-            pass
+    entries = []
+    etag_h = hashlib.sha1()
+    last_modified = 0.0
+    try:
+        for it in selected:
+            rp = it.get("target_relpath")
+            if not rp:
+                continue
+            abs_p, _ = _safe_abs_path(app.config["TARGET_ROOT"], rp)
+            st = os.stat(abs_p)
+            entries.append((_zip_arcname(len(entries) + 1, it), abs_p, st))
+            etag_h.update(f"{it.get('id')}:{rp}:{st.st_ino}:{st.st_size}:{st.st_mtime_ns}\n".encode("utf-8"))
+            last_modified = max(last_modified, st.st_mtime)
+    except (FileNotFoundError, ValueError):
         return _json_error("Datei nicht gefunden.", 404, code="not_found")
-    except Exception:
-        try:
-            os.remove(zip_path)
-        except Exception:
-            pass
-        return _json_error("ZIP-Erstellung fehlgeschlagen.", 500, code="server_error")
+    zip_etag = f'"zip-{etag_h.hexdigest()[:32]}"'
 
-    @after_this_request
-    def _cleanup(resp):
-        try:
-            os.remove(zip_path)
-        except Exception:
-            pass
+    def _headers(resp):
+        resp.headers["Accept-Ranges"] = "bytes"
+        resp.headers["ETag"] = zip_etag
+        resp.headers["Last-Modified"] = http_date(last_modified)
+        resp.headers["Cache-Control"] = "private, no-cache"
+        resp.headers["Content-Disposition"] = 'attachment; filename="queue_selected.zip"'
         return resp
 
-    return send_file(
-        zip_path,
-        mimetype="application/zip",
-        as_attachment=True,
-        download_name="queue_selected.zip",
-        conditional=False,
-    )
+    if _etag_matches(request.headers.get("If-None-Match"), zip_etag):
+        return _headers(Response(status=304))
+
+    plan = _zip_plan(entries)
+    size = plan["size"]
+
+    range_header = request.headers.get("Range")
+    if_range = request.headers.get("If-Range")
+    if range_header and if_range:
+        if_range = if_range.strip()
+        if if_range.startswith('"') or if_range.startswith("W/"):
+            range_ok = _etag_matches(if_range, zip_etag, weak=False)
+        else:
+            ir_date = parse_date(if_range)
+            range_ok = ir_date is not None and int(ir_date.timestamp()) == int(last_modified)
+        if not range_ok:
+            range_header = None
+    ranges = _parse_range_header(range_header, size) if range_header else None
+    if ranges is not None and not ranges:
+        resp = Response(status=416, mimetype="application/zip")
+        resp.headers["Content-Range"] = f"bytes */{size}"
+        return _headers(resp)
+    if ranges is None or len(ranges) > 1:
+        resp = Response(_zip_iter(plan, 0, size - 1), status=200, mimetype="application/zip", direct_passthrough=True)
+        resp.headers["Content-Length"] = str(size)
+        return _headers(resp)
+
+    start, end = ranges[0]
+    resp = Response(_zip_iter(plan, start, end), status=206, mimetype="application/zip", direct_passthrough=True)
+    resp.headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    resp.headers["Content-Length"] = str(end - start + 1)
+    return _headers(resp)
 
 
 @app.route("/api/merge/start", methods=["POST"])
 def api_merge_start():
     body = request.get_json(silent=True) or {}
     profile = body.get("profile", "android_small")
-    if profile not in ("android_small", "copy"):
+    if profile not in _MERGE_PROFILE_LABELS:
         profile = "android_small"
+    progressive = bool(body.get("progressive", False))
 
     items = _queue_get_items()
     if not items:
         return _json_error("Queue ist leer.", 400, code="empty_queue")
+    not_ready = _queue_not_ready(items)
+    if not_ready:
+        return not_ready
 
     rels = [it["target_relpath"] for it in items if it.get("target_relpath")]
     if not rels:
         return _json_error("Queue ist leer.", 400, code="empty_queue")
 
     try:
-        job_id = _start_merge_job(rels, profile)
+        job_id = _start_merge_job(rels, profile, progressive=progressive)
         return jsonify({"ok": True, "job_id": job_id, "count": len(rels)})
     except Exception:
         return _json_error("Merge konnte nicht gestartet werden.", 500, code="server_error")
 
 
+_EVENTS_POLL_SECONDS = 0.5
+_EVENTS_KEEPALIVE_SECONDS = 15.0
+_EVENTS_BATCH = 200
+
+
+def _events_since(last_id: int, topics: set, job_id: str | None) -> list:
+    sql = "SELECT id, topic, job_id, type, data FROM events WHERE id > ?"
+    args: list = [last_id]
+    if topics:
+        sql += f" AND topic IN ({','.join('?' * len(topics))})"
+        args += sorted(topics)
+    if job_id:
+        sql += " AND job_id = ?"
+        args.append(job_id)
+    sql += " ORDER BY id LIMIT ?"
+    args.append(_EVENTS_BATCH)
+    with app.app_context():
+        return _get_db().execute(sql, args).fetchall()
+
+
+def _events_stream(last_id: int, topics: set, job_id: str | None, max_seconds: float):
+    # Neue Zeilen per Polling der events-Tabelle (auch aus anderen Workern);
+    # lokale Events wecken sofort über _EVENTS_COND.
+    yield f"retry: 2000\nid: {last_id}\ndata: {json.dumps({'type': 'hello', 'last_event_id': last_id})}\n\n"
+    deadline = time.time() + max_seconds
+    last_sent = time.time()
+    while time.time() < deadline:
+        rows = _events_since(last_id, topics, job_id)
+        for r in rows:
+            last_id = int(r["id"])
+            payload = {"topic": r["topic"], "job_id": r["job_id"], "type": r["type"], "data": json.loads(r["data"])}
+            yield f"id: {last_id}\ndata: {json.dumps(payload)}\n\n"
+        if rows:
+            last_sent = time.time()
+            if len(rows) == _EVENTS_BATCH:
+                continue
+        elif time.time() - last_sent >= _EVENTS_KEEPALIVE_SECONDS:
+            yield ": keepalive\n\n"
+            last_sent = time.time()
+        with _EVENTS_COND:
+            _EVENTS_COND.wait(timeout=_EVENTS_POLL_SECONDS)
+
+
+@app.route("/api/events", methods=["GET"])
+def api_events():
+    topics = {t.strip() for t in request.args.get("topics", "").split(",") if t.strip()}
+    job_id = request.args.get("job_id") or None
+    last_raw = request.headers.get("Last-Event-ID") or request.args.get("last_event_id")
+    try:
+        last_id = int(last_raw) if last_raw else None
+    except ValueError:
+        return _json_error("Last-Event-ID muss int sein.", 400, code="bad_request")
+    if last_id is None:
+        row = _get_db().execute("SELECT MAX(id) AS m FROM events").fetchone()
+        last_id = int(row["m"] or 0)
+
+    # Kurze Streams: der Browser verbindet mit Last-Event-ID neu (retry: 2000),
+    # und ein Worker ist nie lange an einen Tab gebunden.
+    max_seconds = max(5.0, float(app.config.get("EVENTS_STREAM_MAX_SECONDS", 25)))
+    resp = Response(_events_stream(last_id, topics, job_id, max_seconds), mimetype="text/event-stream")
+    resp.headers["Cache-Control"] = "no-cache"
+    resp.headers["X-Accel-Buffering"] = "no"
+    return resp
+
+
 @app.route("/api/merge/status", methods=["GET"])
 def api_merge_status():
     job_id = request.args.get("job_id", "")
     if not job_id:
         return _json_error("job_id fehlt.", 400, code="bad_request")
-    disk_job = _merge_job_load(job_id)
-    with _MERGE_JOBS_LOCK:
-        job = disk_job or _MERGE_JOBS.get(job_id)
-        if job and not disk_job:
-            _merge_job_save(job_id, job)
-        if job:
-            _MERGE_JOBS[job_id] = job
-
+    job = _merge_job_get(job_id)
     if not job:
         return _json_error("Job nicht gefunden.", 404, code="not_found")
+    return jsonify(_merge_status_payload(job_id, job))
 
+
+def _merge_status_payload(job_id: str, job: dict) -> dict:
     out_abs = job.get("output_abs")
     output_exists = bool(out_abs and isinstance(out_abs, str) and os.path.isfile(out_abs))
     download_ready = job.get("status") == "done" and output_exists
-
-    return jsonify(
-        {
-            "ok": True,
-            "job_id": job_id,
-            "status": job.get("status"),
-            "phase": job.get("phase"),
-            "message": job.get("message"),
-            "progress_pct": job.get("progress_pct", 0),
-            "error": job.get("error"),
-            "download_ready": download_ready,
-        }
+    expired = bool(job.get("expired"))
+    hls_url = None
+    out_dir = job.get("output_dir")
+    playlist = job.get("playlist")
+    if out_dir and playlist and os.path.isfile(os.path.join(out_dir, playlist)):
+        hls_url = f"/media/hls/{job_id}/{playlist}"
+    stream_abs = job.get("stream_abs")
+    stream_ready = bool(
+        job.get("status") == "running"
+        and stream_abs
+        and isinstance(stream_abs, str)
+        and os.path.isfile(stream_abs)
+        and os.path.getsize(stream_abs) > 0
     )
 
+    return {
+        "ok": True,
+        "job_id": job_id,
+        "status": job.get("status"),
+        "phase": job.get("phase"),
+        "message": job.get("message"),
+        "progress_pct": job.get("progress_pct", 0),
+        "error": job.get("error"),
+        "download_ready": download_ready,
+        "progressive": bool(job.get("progressive")),
+        "stream_ready": stream_ready,
+        "hls_url": hls_url,
+        "expired": expired,
+        "expired_at": job.get("expired_at") if expired else None,
+    }
+
+
+def _merge_follow_output(job_id: str, abs_path: str):
+    with open(abs_path, "rb") as f:
+        while True:
+            chunk = f.read(1024 * 1024)
+            if chunk:
+                yield chunk
+                continue
+            job = _merge_job_get(job_id)
+            status = job.get("status") if job else None
+            if status != "running":
+                if status != "done":
+                    # Abbrechen statt sauber beenden: der Client soll die Verbindung
+                    # als abgebrochen sehen, nicht als fertige (aber kaputte) Datei.
+                    raise RuntimeError(f"Merge-Job {job_id} endete mit Status {status!r}")
+                while True:
+                    chunk = f.read(1024 * 1024)
+                    if not chunk:
+                        return
+                    yield chunk
+            time.sleep(0.25)
+
+
+def _merge_stream_response(job_id: str, abs_path: str):
+    _merge_job_update(job_id, downloaded_at=time.time())
+    resp = Response(_merge_follow_output(job_id, abs_path), status=200, mimetype="video/mp4")
+    resp.headers["Content-Disposition"] = 'attachment; filename="merged_queue.mp4"'
+    resp.headers["Cache-Control"] = "no-store"
+    resp.headers["X-Accel-Buffering"] = "no"
+    return resp
+
 
 @app.route("/api/merge/download/<job_id>", methods=["GET"])
 def api_merge_download(job_id):
-    disk_job = _merge_job_load(job_id)
-    with _MERGE_JOBS_LOCK:
-        job = disk_job or _MERGE_JOBS.get(job_id)
-        if job:
-            _MERGE_JOBS[job_id] = job
+    job = _merge_job_get(job_id)
     if not job:
         return _json_error("Job nicht gefunden.", 404, code="not_found")
+    if job.get("expired"):
+        return _json_error(
+            "Die Merge-Ausgabe ist abgelaufen und wurde gelöscht.",
+            410,
+            code="expired",
+            details={"expired_at": job.get("expired_at")},
+        )
+    if job.get("output_dir"):
+        return _json_error(
+            "HLS-Ausgaben werden gestreamt, nicht heruntergeladen.",
+            409,
+            code="hls_output",
+            details={"hls_url": f"/media/hls/{job_id}/{job.get('playlist') or 'master.m3u8'}"},
+        )
+    if job.get("status") == "running" and job.get("progressive"):
+        stream_abs = job.get("stream_abs")
+        if stream_abs and isinstance(stream_abs, str) and os.path.isfile(stream_abs):
+            return _merge_stream_response(job_id, stream_abs)
     if job.get("status") != "done":
         return _json_error(
             "Job ist nicht fertig.",
@@ -1552,12 +5224,12 @@ def api_merge_download(job_id):
     if not out_abs or not os.path.isfile(out_abs):
         return _json_error("Datei nicht gefunden.", 404, code="not_found")
 
-    return send_file(
+    _merge_job_update(job_id, downloaded_at=time.time())
+    return _send_file_with_range(
         out_abs,
-        mimetype="video/mp4",
-        as_attachment=True,
+        "video/mp4",
+        cache_control="private, max-age=31536000, immutable",
         download_name="merged_queue.mp4",
-        conditional=False,
     )
 
 
@@ -1587,12 +5259,13 @@ def api_tags_search():
             idx = _get_tag_index(refresh=refresh)
             entries = idx["entries"]
             
-            results = []
-            for e in entries:
-                if not e["tags"]:  # Datei hat keine Tags
-                    results.append({"relpath": e["relpath"], "name": e["name"], "tags": e["tags"]})
-                if len(results) >= limit:
-                    break
+            with _phase("index"):
+                results = []
+                for e in entries:
+                    if not e["tags"]:  # Datei hat keine Tags
+                        results.append({"relpath": e["relpath"], "name": e["name"], "tags": e["tags"]})
+                    if len(results) >= limit:
+                        break
             
             return jsonify(
                 {
@@ -1600,7 +5273,7 @@ def api_tags_search():
                     "query": query,
                     "mode": mode,
                     "count": len(results),
-                    "results": results,
+                    "results": _with_thumb_fields(results),
                 }
             )
         except ValueError as e:
@@ -1620,18 +5293,19 @@ def api_tags_search():
         idx = _get_tag_index(refresh=refresh)
         entries = idx["entries"]
 
-        results = []
-        for e in entries:
-            tags_lower = e["tags_lower"]
-            if mode == "and":
-                ok = all(t in tags_lower for t in want)
-            else:
-                ok = any(t in tags_lower for t in want)
-            if not ok:
-                continue
-            results.append({"relpath": e["relpath"], "name": e["name"], "tags": e["tags"]})
-            if len(results) >= limit:
-                break
+        with _phase("index"):
+            results = []
+            for e in entries:
+                tags_lower = e["tags_lower"]
+                if mode == "and":
+                    ok = all(t in tags_lower for t in want)
+                else:
+                    ok = any(t in tags_lower for t in want)
+                if not ok:
+                    continue
+                results.append({"relpath": e["relpath"], "name": e["name"], "tags": e["tags"]})
+                if len(results) >= limit:
+                    break
 
         return jsonify(
             {
@@ -1639,7 +5313,7 @@ def api_tags_search():
                 "query": query,
                 "mode": mode,
                 "count": len(results),
-                "results": results,
+                "results": _with_thumb_fields(results),
             }
         )
     except ValueError as e:
@@ -1797,24 +5471,498 @@ def api_files_rename():
         return _json_error("Umbenennen fehlgeschlagen.", 500, code="server_error")
 
 
-def _next_clip_filename(dir_abs: str, base_stem: str, ext: str, tags: list[str]) -> tuple[str, int]:
-    i = 1
+def _clip_reservation_path(dst_abs: str) -> str:
+    return os.path.join(os.path.dirname(dst_abs), f".{os.path.basename(dst_abs)}.reserved")
+
+
+def _clip_reserve(dst_abs: str) -> bool:
+    # Versteckte Markerdatei (O_EXCL), damit parallele Worker-Prozesse nicht denselben Namen wählen.
+    marker = _clip_reservation_path(dst_abs)
+    for _attempt in range(2):
+        try:
+            os.close(os.open(marker, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644))
+            return True
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(marker) < _CLIP_RESERVATION_MAX_AGE_SECONDS:
+                    return False
+                os.remove(marker)
+            except FileNotFoundError:
+                pass
+    return False
+
+
+def _clip_release(dst_abs: str):
+    try:
+        os.remove(_clip_reservation_path(dst_abs))
+    except FileNotFoundError:
+        pass
+
+
+def _next_clip_filename(dir_abs: str, base_stem: str, ext: str, tags: list[str], start: int = 1) -> tuple[str, int]:
+    i = start
     while True:
         candidate_stem = f"{base_stem}_{i:02d}"
         candidate = _build_filename_with_tags(candidate_stem, ext, tags)
-        if not os.path.exists(os.path.join(dir_abs, candidate)):
-            return candidate, i
+        candidate_abs = os.path.join(dir_abs, candidate)
+        if not os.path.exists(candidate_abs) and _clip_reserve(candidate_abs):
+            if not os.path.exists(candidate_abs):
+                return candidate, i
+            _clip_release(candidate_abs)
         i += 1
 
 
+def _clip_job_update(job_id: str, **fields):
+    with _CLIP_JOBS_LOCK:
+        st = _CLIP_JOBS.get(job_id)
+        if not st:
+            return
+        st.update(fields)
+        st["updated_at"] = _utc_now_iso()
+        payload = _shared_job_mark("clip", job_id, st, _CLIP_JOBS_LOCK, force="status" in fields)
+        event = json.loads(payload) if payload else json.loads(json.dumps(st))
+    if payload:
+        _shared_job_write("clip", job_id, payload)
+    status = event.get("status")
+    event_type = status if status in _EVENT_FINAL_TYPES else "progress"
+    _event_publish("clip", job_id, event_type, {"ok": True, **event}, coalesce=event_type == "progress")
+
+
+def _clip_job_segment_update(job_id: str, index: int, **fields):
+    with _CLIP_JOBS_LOCK:
+        st = _CLIP_JOBS.get(job_id)
+        if not st:
+            return
+        st["segments"][index].update(fields)
+        st["updated_at"] = _utc_now_iso()
+        payload = _shared_job_mark("clip", job_id, st, _CLIP_JOBS_LOCK)
+        event = json.loads(payload) if payload else json.loads(json.dumps(st))
+    if payload:
+        _shared_job_write("clip", job_id, payload)
+    _event_publish("clip", job_id, "progress", {"ok": True, **event}, coalesce=True)
+
+
+def _clip_plan_clusters(segments: list[dict], max_gap: float) -> list[list[dict]]:
+    # Nahe beieinander liegende, nicht überlappende Segmente teilen sich einen
+    # ffmpeg-Lauf; weit auseinander liegende bekommen eigene Läufe.
+    clusters = []
+    for seg in sorted(segments, key=lambda s: (s["start"], s["end"])):
+        cur = clusters[-1] if clusters else None
+        if cur and seg["start"] >= cur[-1]["end"] - 1e-6 and seg["start"] - cur[-1]["end"] <= max_gap:
+            cur.append(seg)
+        else:
+            clusters.append([seg])
+    return clusters
+
+
+def _clip_cut_points(cluster: list[dict], keyframes: array | None) -> tuple[list[float], list[int]] | None:
+    # Grenzen für einen Copy-Durchlauf mit dem segment-Muxer und der Stückindex je
+    # Segment. Der Muxer trennt nur an Keyframes: Anfänge landen auf dem Keyframe
+    # davor (wie -ss vor -i), Enden auf dem Keyframe danach. Zwischen Ende und
+    # nächstem Anfang kann ein verworfenes Lückenstück liegen. None, wenn sich
+    # Stücke überlappen würden oder ohne Keyframes nicht vorhersagbar ist, wo
+    # der Muxer trennt.
+    def _snap_start(t: float) -> float:
+        if keyframes:
+            before, _after = _keyframes_around(keyframes, t + 0.001)
+            if before is not None:
+                return before
+        return t
+
+    if len(cluster) == 1:
+        return [_snap_start(cluster[0]["start"]), cluster[0]["end"]], [0]
+    if not keyframes:
+        return None
+    points: list[float] = []
+    index: list[int] = []
+    for i, seg in enumerate(cluster):
+        start = _snap_start(seg["start"])
+        if points and start < points[-1] - 0.05:
+            return None
+        if not points or start > points[-1] + 0.05:
+            points.append(start)
+        index.append(len(points) - 1)
+        end = seg["end"]
+        if i < len(cluster) - 1:
+            # Das letzte Ende begrenzt -t exakt; innere Enden verschiebt der Muxer.
+            _before, after = _keyframes_around(keyframes, end - 0.001)
+            if after is not None:
+                end = after
+        if end <= points[-1] + 0.05:
+            return None
+        points.append(end)
+    return points, index
+
+
+def _clip_run_separately(job_id: str, ffmpeg_bin: str, src_abs: str, cluster: list[dict], keyframes, work_dir: str, on_seconds):
+    # Rückfall: ein -ss/-t-Schnitt pro Segment.
+    origin = cluster[0]["start"]
+    results = []
+    for seg in cluster:
+        offset = seg["start"] - origin
+
+        def _cb(sec: float, offset=offset):
+            on_seconds(offset + sec)
+
+        results += _clip_run_cluster(job_id, ffmpeg_bin, src_abs, [seg], keyframes, work_dir, _cb)
+    return results
+
+
+def _clip_run_cluster(job_id: str, ffmpeg_bin: str, src_abs: str, cluster: list[dict], keyframes, work_dir: str, on_seconds):
+    plan = _clip_cut_points(cluster, keyframes)
+    if plan is None:
+        return _clip_run_separately(job_id, ffmpeg_bin, src_abs, cluster, keyframes, work_dir, on_seconds)
+    points, index = plan
+    ext = os.path.splitext(src_abs)[1].lower()
+    base = points[0]
+    duration = points[-1] - base
+    mp4_like = ext in (".mp4", ".mov")
+    cmd = [
+        ffmpeg_bin,
+        "-y",
+        "-nostdin",
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-ss",
+        f"{base:.3f}",
+        "-t",
+        f"{duration:.3f}",
+        "-i",
+        src_abs,
+        "-map",
+        "0",
+        "-c",
+        "copy",
+        "-progress",
+        "pipe:1",
+        "-nostats",
+    ]
+    tag = uuid.uuid4().hex[:8]
+    if len(points) == 2:
+        pieces = [os.path.join(work_dir, f"{tag}_000{ext}")]
+        cmd += (["-movflags", "+faststart"] if mp4_like else []) + [pieces[0]]
+    else:
+        pieces = [os.path.join(work_dir, f"{tag}_{i:03d}{ext}") for i in range(len(points) - 1)]
+        cmd += [
+            "-f",
+            "segment",
+            "-segment_times",
+            # Innere Grenzen sind Keyframes; knapp davor zielen, damit Rundung
+            # nicht erst am nächsten Keyframe trennt.
+            ",".join(f"{max(0.0, p - base - 0.001):.3f}" for p in points[1:-1]),
+            "-reset_timestamps",
+            "1",
+        ]
+        if mp4_like:
+            cmd += ["-segment_format_options", "movflags=+faststart"]
+        cmd.append(os.path.join(work_dir, f"{tag}_%03d{ext}"))
+
+    for seg in cluster:
+        _clip_job_segment_update(job_id, seg["index"], status="running")
+    _run_ffmpeg_progress(cmd, on_progress=on_seconds)
+
+    if len(cluster) > 1:
+        produced = [n for n in os.listdir(work_dir) if n.startswith(f"{tag}_")]
+        if len(produced) != len(pieces) or not all(os.path.isfile(p) for p in pieces):
+            # Muxer hat anders getrennt als geplant; Stücke ließen sich nicht
+            # sicher zuordnen.
+            for n in produced:
+                try:
+                    os.remove(os.path.join(work_dir, n))
+                except OSError:
+                    pass
+            return _clip_run_separately(job_id, ffmpeg_bin, src_abs, cluster, keyframes, work_dir, on_seconds)
+
+    return [(seg, pieces[index[i]]) for i, seg in enumerate(cluster)]
+
+
+_SMART_CUT_ENCODERS = {"h264": "libx264", "hevc": "libx265"}
+_SMART_CUT_INBAND_TAGS = {"h264": "avc3", "hevc": "hev1"}
+_SMART_CUT_PROFILES = {
+    "baseline": "baseline",
+    "constrained baseline": "baseline",
+    "main": "main",
+    "high": "high",
+    "high 10": "high10",
+    "main 10": "main10",
+}
+
+
+def _ffprobe_video_params(abs_path: str) -> dict:
+    ffprobe_bin = _resolve_tool_binary("ffprobe")
+    if not ffprobe_bin:
+        return {}
+    cmd = [
+        ffprobe_bin,
+        "-v",
+        "error",
+        "-select_streams",
+        "v:0",
+        "-show_entries",
+        "stream=codec_name,profile,level,pix_fmt,width,height,r_frame_rate,has_b_frames",
+        "-of",
+        "json",
+        abs_path,
+    ]
+    try:
+        streams = json.loads(_tool_output(cmd, text=True) or "{}").get("streams") or []
+    except Exception:
+        return {}
+    return streams[0] if streams else {}
+
+
+def _smart_cut_encode_args(params: dict) -> list[str]:
+    codec = params.get("codec_name")
+    args = ["-c:v", _SMART_CUT_ENCODERS[codec], "-preset", "fast", "-crf", "16"]
+    profile = _SMART_CUT_PROFILES.get(str(params.get("profile") or "").lower())
+    if profile:
+        args += ["-profile:v", profile]
+    level = params.get("level")
+    if codec == "h264" and isinstance(level, int) and level > 0:
+        args += ["-level:v", f"{level / 10:.1f}"]
+    if params.get("pix_fmt"):
+        args += ["-pix_fmt", params["pix_fmt"]]
+    if params.get("r_frame_rate") and params["r_frame_rate"] != "0/0":
+        args += ["-r", params["r_frame_rate"]]
+    return args
+
+
+def _clip_smart_cut(
+    ffmpeg_bin: str, src_abs: str, seg: dict, keyframes: array, params: dict, work_dir: str, on_seconds
+) -> str:
+    # Video: Teil-GOP am Anfang (und bei B-Frames am Ende) neu kodieren, Rest
+    # kopieren, alles als MPEG-TS (Annex B) zusammenfügen. Audio: ein Copy-Schnitt.
+    start, end = seg["start"], seg["end"]
+    _before, k1 = _keyframes_around(keyframes, start - 0.001)
+    k1 = end if k1 is None else min(k1, end)
+    k2 = end
+    if int(params.get("has_b_frames") or 0) > 0:
+        before_end, _after = _keyframes_around(keyframes, end - 0.001)
+        if before_end is not None and before_end > k1:
+            k2 = before_end
+
+    tag = uuid.uuid4().hex[:8]
+    base = [ffmpeg_bin, "-y", "-nostdin", "-hide_banner", "-loglevel", "error"]
+    enc = _smart_cut_encode_args(params)
+    pieces = []
+    for kind, a, b in (("head", start, k1), ("body", k1, k2), ("tail", k2, end)):
+        if b - a < 0.001:
+            continue
+        out = os.path.join(work_dir, f"{tag}_{kind}.ts")
+        codec_args = ["-c:v", "copy"] if kind == "body" else enc
+        # Copy-Seek landet auf dem Keyframe <= ss; minimal dahinter zielen,
+        # damit Rundung nicht den vorherigen GOP erwischt.
+        seek = a + 0.0005 if kind == "body" else a
+        _tool_run(
+            base
+            + ["-ss", f"{seek:.6f}", "-i", src_abs, "-t", f"{b - a:.6f}", "-map", "0:v:0", "-an", *codec_args, "-f", "mpegts", out],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        pieces.append(out)
+        on_seconds(b - start)
+
+    list_path = os.path.join(work_dir, f"{tag}_list.txt")
+    _write_concat_list(list_path, pieces)
+    audio = os.path.join(work_dir, f"{tag}_audio.mka")
+    _tool_run(
+        base + ["-ss", f"{start:.6f}", "-i", src_abs, "-t", f"{end - start:.6f}", "-map", "0:a:0?", "-vn", "-c:a", "copy", audio],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    ext = os.path.splitext(src_abs)[1].lower()
+    out = os.path.join(work_dir, f"{tag}_smart{ext}")
+    cmd = base + ["-f", "concat", "-safe", "0", "-i", list_path]
+    if os.path.isfile(audio) and os.path.getsize(audio) > 0:
+        cmd += ["-i", audio, "-map", "0:v:0", "-map", "1:a:0?"]
+    else:
+        cmd += ["-map", "0:v:0"]
+    cmd += ["-c", "copy"]
+    if ext in (".mp4", ".mov"):
+        # Neu kodierte Teile und kopierter Mittelteil haben verschiedene SPS/PPS;
+        # avcC/hvcC fasst nur einen Satz. avc3/hev1 lässt die Parametersätze im
+        # Stream, damit auch Safari und Hardware-Decoder jeden Teil richtig lesen.
+        cmd += ["-tag:v", _SMART_CUT_INBAND_TAGS[params["codec_name"]], "-movflags", "+faststart"]
+    _tool_run(cmd + [out], check=True, capture_output=True, text=True)
+    _clip_verify_decode(ffmpeg_bin, out)
+    return out
+
+
+def _clip_verify_decode(ffmpeg_bin: str, path: str):
+    # Einmal vollständig dekodieren, bevor das Ergebnis etwas ersetzt.
+    res = _tool_run(
+        [ffmpeg_bin, "-nostdin", "-hide_banner", "-v", "error", "-xerror", "-i", path, "-map", "0:v:0", "-f", "null", "-"],
+        capture_output=True,
+        text=True,
+    )
+    if res.returncode != 0 or (res.stderr or "").strip():
+        raise RuntimeError(f"Smart-Cut-Ergebnis nicht dekodierbar: {(res.stderr or '').strip()[-300:]}")
+
+
+def _start_clip_job(ffmpeg_bin: str, src_abs: str, src_norm: str, segments: list[dict], mode: str = "copy") -> str:
+    job_id = uuid.uuid4().hex
+    with _CLIP_JOBS_LOCK:
+        _CLIP_JOBS[job_id] = {
+            "job_id": job_id,
+            "source_relpath": src_norm,
+            "mode": mode,
+            "created_at": _utc_now_iso(),
+            "updated_at": _utc_now_iso(),
+            "status": "running",
+            "phase": "Start",
+            "message": "Starte…",
+            "progress_pct": 0.0,
+            "segments": [
+                {
+                    "index": s["index"],
+                    "start": s["start"],
+                    "end": s["end"],
+                    "relpath": s["relpath"],
+                    "name": s["name"],
+                    "status": "queued",
+                    "error": None,
+                }
+                for s in segments
+            ],
+            "created": [],
+            "error": None,
+        }
+        payload = _shared_job_mark("clip", job_id, _CLIP_JOBS[job_id], _CLIP_JOBS_LOCK, force=True)
+    _shared_job_write("clip", job_id, payload)
+    _start_job_flusher()
+
+    def _worker():
+        with app.app_context():
+            dir_abs = os.path.dirname(src_abs)
+            work_dir = tempfile.mkdtemp(prefix=f".clips_{job_id}_", dir=dir_abs)
+            try:
+                try:
+                    keyframes = _keyframes_build(src_abs, src_norm)
+                except Exception:
+                    keyframes = None
+                params = {}
+                if mode == "smart":
+                    params = _ffprobe_video_params(src_abs)
+                    if params.get("codec_name") not in _SMART_CUT_ENCODERS or not keyframes:
+                        _clip_job_update(job_id, mode="copy", message="Smart-Cut nicht möglich, schneide ohne Neukodierung.")
+                        mode_eff = "copy"
+                    else:
+                        mode_eff = "smart"
+                else:
+                    mode_eff = "copy"
+                if mode_eff == "smart":
+                    clusters = [[s] for s in sorted(segments, key=lambda s: (s["start"], s["end"]))]
+                else:
+                    clusters = _clip_plan_clusters(segments, float(app.config.get("CLIP_CLUSTER_GAP_SECONDS", 30)))
+                total = sum(c[-1]["end"] - c[0]["start"] for c in clusters) or 1.0
+                done_seconds = [0.0] * len(clusters)
+                lock = threading.Lock()
+                _clip_job_update(
+                    job_id, phase="Schneiden", message=f"{len(segments)} Segmente in {len(clusters)} Durchläufen"
+                )
+
+                def _progress(ci: int, span: float):
+                    def _cb(sec: float):
+                        with lock:
+                            done_seconds[ci] = max(0.0, min(span, sec))
+                            pct = round(99.0 * sum(done_seconds) / total, 1)
+                        _clip_job_update(job_id, progress_pct=pct)
+
+                    return _cb
+
+                def _finish_cluster(ci: int, cluster: list[dict]):
+                    span = cluster[-1]["end"] - cluster[0]["start"]
+                    if mode_eff == "smart":
+                        seg = cluster[0]
+                        _clip_job_segment_update(job_id, seg["index"], status="running")
+                        try:
+                            piece = _clip_smart_cut(
+                                ffmpeg_bin, src_abs, seg, keyframes, params, work_dir, _progress(ci, span)
+                            )
+                            results = [(seg, piece)]
+                        except Exception:
+                            # Smart-Cut fehlgeschlagen oder nicht sauber dekodierbar:
+                            # dieses Segment ohne Neukodierung schneiden.
+                            _clip_job_segment_update(job_id, seg["index"], mode="copy")
+                            results = _clip_run_cluster(
+                                job_id, ffmpeg_bin, src_abs, cluster, keyframes, work_dir, _progress(ci, span)
+                            )
+                    else:
+                        results = _clip_run_cluster(
+                            job_id, ffmpeg_bin, src_abs, cluster, keyframes, work_dir, _progress(ci, span)
+                        )
+                    for seg, piece in results:
+                        if not piece or not os.path.isfile(piece):
+                            _clip_job_segment_update(job_id, seg["index"], status="error", error="Clip-Datei wurde nicht erstellt.")
+                            continue
+                        os.replace(piece, seg["abs_path"])
+                        _clip_job_segment_update(job_id, seg["index"], status="done")
+                        with _CLIP_JOBS_LOCK:
+                            _CLIP_JOBS[job_id]["created"].append(
+                                {
+                                    "relpath": seg["relpath"],
+                                    "name": seg["name"],
+                                    "start": seg["start"],
+                                    "end": seg["end"],
+                                    "index": seg["name_index"],
+                                }
+                            )
+
+                workers = max(1, min(int(app.config.get("CLIP_WORKERS", 2)), len(clusters)))
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    futures = {pool.submit(_finish_cluster, ci, c): c for ci, c in enumerate(clusters)}
+                    for fut, cluster in futures.items():
+                        try:
+                            fut.result()
+                        except Exception as e:
+                            err = str(getattr(e, "stderr", None) or e)[-500:]
+                            for seg in cluster:
+                                _clip_job_segment_update(job_id, seg["index"], status="error", error=err)
+
+                with _CLIP_JOBS_LOCK:
+                    st = _CLIP_JOBS[job_id]
+                    st["created"].sort(key=lambda c: (c["start"], c["end"]))
+                    n_ok = len(st["created"])
+                    n_err = sum(1 for s in st["segments"] if s["status"] == "error")
+                if n_ok == 0:
+                    _clip_job_update(
+                        job_id, status="error", phase="Error", message="Clip-Erstellung fehlgeschlagen.", error="Keine Clips erstellt."
+                    )
+                else:
+                    _clip_job_update(
+                        job_id,
+                        status="done",
+                        phase="Done",
+                        progress_pct=100.0,
+                        message=f"{n_ok} Clips erstellt" + (f", {n_err} fehlgeschlagen." if n_err else "."),
+                    )
+                    _start_tag_index_build()
+            except Exception as e:
+                _clip_job_update(job_id, status="error", phase="Error", message="Clip-Erstellung fehlgeschlagen.", error=str(e))
+            finally:
+                shutil.rmtree(work_dir, ignore_errors=True)
+                for s in segments:
+                    _clip_release(s["abs_path"])
+
+    t = threading.Thread(target=_worker, daemon=True)
+    t.start()
+    return job_id
+
+
 @app.route("/api/clips/create", methods=["POST"])
 def api_clips_create():
     body = request.get_json(silent=True) or {}
     relpath = body.get("relpath")
     segments = body.get("segments")
+    mode = body.get("mode", "copy")
 
     if not relpath or not isinstance(relpath, str):
         return _json_error("relpath fehlt.", 400, code="bad_request")
+    if mode not in ("copy", "smart"):
+        return _json_error("mode muss 'copy' oder 'smart' sein.", 400, code="bad_request")
     if not isinstance(segments, list):
         return _json_error("segments muss eine Liste sein.", 400, code="bad_request")
     if len(segments) == 0:
@@ -1844,7 +5992,7 @@ def api_clips_create():
         dir_norm = posixpath.dirname(src_norm)
         dir_abs = os.path.dirname(src_abs)
 
-        created = []
+        parsed = []
         for seg in segments:
             if not isinstance(seg, dict):
                 return _json_error("Segment hat falsches Format.", 400, code="bad_request")
@@ -1861,65 +6009,50 @@ def api_clips_create():
                 return _json_error("start muss >= 0 sein.", 400, code="bad_request")
             if end_f <= start_f + 0.05:
                 return _json_error("Segment ist zu kurz.", 400, code="bad_request")
+            parsed.append({"index": len(parsed), "start": start_f, "end": end_f})
 
-            duration = end_f - start_f
-
-            new_filename, used_idx = _next_clip_filename(dir_abs, base_stem, ext, tags)
-            new_relpath = new_filename if dir_norm in ("", ".") else f"{dir_norm}/{new_filename}"
-            dst_abs, dst_norm = _safe_abs_path(app.config["VIDEO_ROOT"], new_relpath)
-
-            cmd = [
-                ffmpeg_bin,
-                "-hide_banner",
-                "-loglevel",
-                "error",
-                "-ss",
-                str(start_f),
-                "-t",
-                str(duration),
-                "-i",
-                src_abs,
-                "-c",
-                "copy",
-                "-movflags",
-                "+faststart",
-                dst_abs,
-            ]
-
-            try:
-                subprocess.run(cmd, check=True, capture_output=True, text=True)
-            except FileNotFoundError:
-                return _json_error(
-                    "ffmpeg nicht gefunden. Bitte ffmpeg installieren.",
-                    500,
-                    code="ffmpeg_missing",
-                    details=_tool_missing_details("ffmpeg"),
-                )
-            except subprocess.CalledProcessError as e:
-                msg = (e.stderr or "").strip() or "ffmpeg Fehler"
-                return _json_error("Clip-Erstellung fehlgeschlagen.", 500, code="ffmpeg_error", details={"stderr": msg})
-
-            if not os.path.isfile(dst_abs):
-                return _json_error("Clip-Datei wurde nicht erstellt.", 500, code="server_error")
-
-            created.append(
-                {
-                    "relpath": dst_norm,
-                    "name": new_filename,
-                    "start": start_f,
-                    "end": end_f,
-                    "index": used_idx,
-                }
-            )
-
-        _start_tag_index_build()
-        return jsonify({"ok": True, "source_relpath": src_norm, "created": created})
+        # Reservierungen gehören erst dem Job, wenn sein Worker läuft; bis dahin selbst aufräumen.
+        reserved: list[str] = []
+        try:
+            with _CLIP_JOBS_LOCK:
+                next_idx = 1
+                for seg in parsed:
+                    new_filename, used_idx = _next_clip_filename(dir_abs, base_stem, ext, tags, start=next_idx)
+                    reserved.append(os.path.join(dir_abs, new_filename))
+                    next_idx = used_idx + 1
+                    new_relpath = new_filename if dir_norm in ("", ".") else f"{dir_norm}/{new_filename}"
+                    dst_abs, dst_norm = _safe_abs_path(app.config["VIDEO_ROOT"], new_relpath)
+                    seg.update({"abs_path": dst_abs, "relpath": dst_norm, "name": new_filename, "name_index": used_idx})
+
+            job_id = _start_clip_job(ffmpeg_bin, src_abs, src_norm, parsed, mode=mode)
+        except Exception:
+            for path in reserved:
+                _clip_release(path)
+            raise
+        return jsonify(
+            {
+                "ok": True,
+                "job_id": job_id,
+                "mode": mode,
+                "source_relpath": src_norm,
+                "planned": [{"relpath": s["relpath"], "name": s["name"], "start": s["start"], "end": s["end"]} for s in parsed],
+            }
+        )
     except ValueError:
         return _json_error("Ungültiger Pfad.", 400, code="invalid_path")
     except Exception:
         return _json_error("Clip-Erstellung fehlgeschlagen.", 500, code="server_error")
 
 
+@app.route("/api/clips/status", methods=["GET"])
+def api_clips_status():
+    job_id = request.args.get("job_id", "")
+    st = _shared_job_get("clip", job_id, _CLIP_JOBS, _CLIP_JOBS_LOCK)
+    if not st:
+        return _json_error("Job nicht gefunden.", 404, code="not_found")
+    return jsonify({"ok": True, **st})
+
+
 @app.route("/api/name/search", methods=["POST"])
 def api_name_search():
     body = request.get_json(silent=True) or {}
@@ -1943,16 +6076,17 @@ def api_name_search():
         idx = _get_tag_index(refresh=False)
         entries = idx["entries"]
 
-        results = []
-        for e in entries:
-            name_lower = e.get("name_lower", "")
-            if not all(t in name_lower for t in want):
-                continue
-            results.append({"relpath": e["relpath"], "name": e["name"], "tags": e["tags"]})
-            if len(results) >= limit:
-                break
+        with _phase("index"):
+            results = []
+            for e in entries:
+                name_lower = e.get("name_lower", "")
+                if not all(t in name_lower for t in want):
+                    continue
+                results.append({"relpath": e["relpath"], "name": e["name"], "tags": e["tags"]})
+                if len(results) >= limit:
+                    break
 
-        return jsonify({"ok": True, "query": query, "count": len(results), "results": results})
+        return jsonify({"ok": True, "query": query, "count": len(results), "results": _with_thumb_fields(results)})
     except ValueError as e:
         if str(e) == "tag_root_outside_video_root":
             return _json_error("TAG_SCAN_ROOT muss innerhalb von VIDEO_ROOT liegen.", 400, code="bad_request")
@@ -1971,10 +6105,11 @@ def api_tags_list():
             _start_tag_index_build()
 
         tag_root_abs = os.path.abspath(app.config["TAG_SCAN_ROOT"])
+        cached = _tag_index_shared(tag_root_abs, max_age=None)
         with _TAG_INDEX_LOCK:
-            cached = _TAG_INDEX_CACHE.get(tag_root_abs)
             building = bool(_TAG_INDEX_BUILDING)
-            last_error = _TAG_INDEX_LAST_ERROR
+        building = building or _leader_lock_busy("tag_index")
+        last_error = _app_state_get("tag_index_error")
 
         if not cached:
             return jsonify(
@@ -1987,10 +6122,11 @@ def api_tags_list():
                 }
             )
 
-        counts = {}
-        for e in cached.get("entries", []):
-            for t in e.get("tags_lower", set()):
-                counts[t] = counts.get(t, 0) + 1
+        with _phase("index"):
+            counts = {}
+            for e in cached.get("entries", []):
+                for t in e.get("tags_lower", set()):
+                    counts[t] = counts.get(t, 0) + 1
 
         tags = [{"tag": k, "count": v} for k, v in counts.items()]
         tags.sort(key=lambda x: (-x["count"], x["tag"]))
@@ -2022,12 +6158,202 @@ def media_source(relpath):
             return _json_error("Nicht erlaubte Video-Endung.", 400, code="invalid_video_extension")
         if not os.path.isfile(abs_path):
             return _json_error("Datei nicht gefunden.", 404, code="not_found")
+        # Diese URL liefert immer die Originaldatei; das Remux hat eine eigene URL
+        # (/media/remux), damit laufende Range-Abrufe nie die Datei wechseln.
+        if os.path.splitext(norm)[1].lower() in _REMUX_EXTENSIONS:
+            try:
+                _remux_ensure(abs_path)
+            except OSError:
+                pass
+        range_header = request.headers.get("Range", "")
+        if app.config.get("PROXY_AUTO") and (not range_header or range_header.strip().startswith("bytes=0-")):
+            try:
+                if os.path.getsize(abs_path) >= int(app.config.get("PROXY_MIN_BYTES", 0)):
+                    _proxy_ensure(abs_path)
+            except Exception:
+                pass
         mime = _guess_video_mimetype(abs_path)
         return _send_file_with_range(abs_path, mime)
     except ValueError:
         return _json_error("Ungültiger Pfad.", 400, code="invalid_path")
 
 
+@app.route("/media/remux/<path:relpath>", methods=["GET"])
+def media_remux(relpath):
+    try:
+        abs_path, norm = _safe_abs_path(app.config["VIDEO_ROOT"], relpath)
+        if os.path.splitext(norm)[1].lower() not in _REMUX_EXTENSIONS:
+            return _json_error("Nicht erlaubte Video-Endung.", 400, code="invalid_video_extension")
+        if not os.path.isfile(abs_path):
+            return _json_error("Datei nicht gefunden.", 404, code="not_found")
+        remux_abs, ready = _remux_ensure(abs_path)
+        if not ready:
+            resp, status = _json_error("Remux noch nicht erstellt.", 404, code="not_ready")
+            resp.headers["Cache-Control"] = "no-store"
+            return resp, status
+        _media_cache_touch(remux_abs)
+        return _send_file_with_range(remux_abs, "video/mp4")
+    except ValueError:
+        return _json_error("Ungültiger Pfad.", 400, code="invalid_path")
+    except OSError:
+        return _json_error("Datei nicht gefunden.", 404, code="not_found")
+
+
+@app.route("/api/remux/status", methods=["GET"])
+def api_remux_status():
+    relpath = request.args.get("relpath", "")
+    if not relpath:
+        return _json_error("relpath fehlt.", 400, code="bad_request")
+    try:
+        abs_path, norm = _safe_abs_path(app.config["VIDEO_ROOT"], relpath)
+        if not os.path.isfile(abs_path):
+            return _json_error("Datei nicht gefunden.", 404, code="not_found")
+        if os.path.splitext(norm)[1].lower() not in _REMUX_EXTENSIONS:
+            return jsonify({"ok": True, "relpath": norm, "needed": False, "ready": False, "url": None})
+        remux_abs, ready = _remux_ensure(abs_path)
+        # Die URL gibt es erst, wenn die Datei fertig ist.
+        return jsonify(
+            {
+                "ok": True,
+                "relpath": norm,
+                "needed": True,
+                "supported": remux_abs is not None,
+                "ready": ready,
+                "pending": remux_abs is not None and _media_task_pending(f"remux:{remux_abs}"),
+                "url": f"/media/remux/{quote(norm)}" if ready else None,
+            }
+        )
+    except ValueError:
+        return _json_error("Ungültiger Pfad.", 400, code="invalid_path")
+    except Exception:
+        return _json_error("Remux-Status konnte nicht geladen werden.", 500, code="server_error")
+
+
+@app.route("/media/proxy/<path:relpath>", methods=["GET"])
+def media_proxy(relpath):
+    try:
+        abs_path, norm = _safe_abs_path(app.config["VIDEO_ROOT"], relpath)
+        if not _is_allowed_video_filename(os.path.basename(norm)):
+            return _json_error("Nicht erlaubte Video-Endung.", 400, code="invalid_video_extension")
+        if not os.path.isfile(abs_path):
+            return _json_error("Datei nicht gefunden.", 404, code="not_found")
+        proxy_abs, ready = _proxy_ensure(abs_path)
+        if not ready:
+            resp = redirect(f"/media/source/{quote(norm)}", code=307)
+            resp.headers["Cache-Control"] = "no-store"
+            return resp
+        _media_cache_touch(proxy_abs)
+        # Gleiche URL, aber neuer Inhalt, wenn die Quelle ersetzt wird: immer revalidieren.
+        return _send_file_with_range(proxy_abs, "video/mp4")
+    except ValueError:
+        return _json_error("Ungültiger Pfad.", 400, code="invalid_path")
+    except FileNotFoundError:
+        return _json_error("Datei nicht gefunden.", 404, code="not_found")
+
+
+@app.route("/api/keyframes", methods=["GET"])
+def api_keyframes():
+    relpath = request.args.get("relpath", "")
+    if not relpath:
+        return _json_error("relpath fehlt.", 400, code="bad_request")
+    try:
+        abs_path, norm = _safe_abs_path(app.config["VIDEO_ROOT"], relpath)
+        if not os.path.isfile(abs_path):
+            return _json_error("Datei nicht gefunden.", 404, code="not_found")
+        query_times = []
+        for raw in request.args.getlist("t"):
+            try:
+                t = float(raw)
+            except ValueError:
+                return _json_error("t muss eine Zahl sein.", 400, code="bad_request")
+            if not math.isfinite(t) or t < 0:
+                return _json_error("t muss >= 0 sein.", 400, code="bad_request")
+            query_times.append(t)
+
+        times = _keyframes_ensure(abs_path, norm)
+        if times is None:
+            return jsonify({"ok": True, "relpath": norm, "ready": False}), 202
+
+        payload = {"ok": True, "relpath": norm, "ready": True, "count": len(times), "nearest": []}
+        for t in query_times:
+            before, after = _keyframes_around(times, t)
+            payload["nearest"].append({"t": t, "before": before, "after": after})
+        if request.args.get("all") == "1":
+            payload["keyframes"] = [round(x, 3) for x in times]
+        return jsonify(payload)
+    except ValueError:
+        return _json_error("Ungültiger Pfad.", 400, code="invalid_path")
+
+
+@app.route("/media/thumb/<key>/<kind>.jpg", methods=["GET"])
+def media_thumb(key, kind):
+    if not re.fullmatch(r"[0-9a-f]{40}", key) or kind not in ("poster", "sprite"):
+        return _json_error("Ungültiger Pfad.", 400, code="invalid_path")
+    abs_path = os.path.join(_media_cache_dir("thumbs"), f"{key}_{kind}.jpg")
+    if not os.path.isfile(abs_path):
+        resp, status = _json_error("Vorschaubild noch nicht erstellt.", 404, code="not_ready")
+        resp.headers["Cache-Control"] = "no-store"
+        return resp, status
+    return _send_file_with_range(abs_path, "image/jpeg", cache_control="public, max-age=31536000, immutable")
+
+
+@app.route("/api/thumbs", methods=["GET"])
+def api_thumbs():
+    relpath = request.args.get("relpath", "")
+    if not relpath:
+        return _json_error("relpath fehlt.", 400, code="bad_request")
+    try:
+        abs_path, norm = _safe_abs_path(app.config["VIDEO_ROOT"], relpath)
+        if not os.path.isfile(abs_path):
+            return _json_error("Datei nicht gefunden.", 404, code="not_found")
+        fields = _thumb_fields(abs_path)
+        return jsonify(
+            {
+                "ok": True,
+                "relpath": norm,
+                **fields,
+                "sprite": {
+                    "cols": _THUMB_SPRITE_COLS,
+                    "rows": _THUMB_SPRITE_ROWS,
+                    "tile_width": _THUMB_TILE_W,
+                    "tile_height": _THUMB_TILE_H,
+                },
+            }
+        )
+    except ValueError:
+        return _json_error("Ungültiger Pfad.", 400, code="invalid_path")
+
+
+@app.route("/api/proxy/status", methods=["GET"])
+def api_proxy_status():
+    relpath = request.args.get("relpath", "")
+    ensure = request.args.get("ensure", "").lower() in ("1", "true", "yes")
+    if not relpath:
+        return _json_error("relpath fehlt.", 400, code="bad_request")
+    try:
+        abs_path, norm = _safe_abs_path(app.config["VIDEO_ROOT"], relpath)
+        if not os.path.isfile(abs_path):
+            return _json_error("Datei nicht gefunden.", 404, code="not_found")
+        if ensure:
+            proxy_abs, ready = _proxy_ensure(abs_path)
+        else:
+            proxy_abs = _proxy_path_for(abs_path)
+            ready = os.path.isfile(proxy_abs)
+        return jsonify(
+            {
+                "ok": True,
+                "relpath": norm,
+                "ready": ready,
+                "pending": _media_task_pending(f"proxy:{proxy_abs}"),
+                "url": f"/media/proxy/{quote(norm)}",
+            }
+        )
+    except ValueError:
+        return _json_error("Ungültiger Pfad.", 400, code="invalid_path")
+    except Exception:
+        return _json_error("Proxy-Status konnte nicht geladen werden.", 500, code="server_error")
+
+
 @app.route("/media/target/<path:relpath>", methods=["GET"])
 def media_target(relpath):
     try:
@@ -2042,10 +6368,46 @@ def media_target(relpath):
         return _json_error("Ungültiger Pfad.", 400, code="invalid_path")
 
 
+@app.route("/media/hls/<job_id>/<path:name>", methods=["GET"])
+def media_hls(job_id, name):
+    job = _merge_job_get(job_id)
+    if not job or job.get("expired"):
+        return _json_error("Job nicht gefunden.", 404, code="not_found")
+    out_dir = job.get("output_dir")
+    if not out_dir or not isinstance(out_dir, str):
+        return _json_error("Job hat keine HLS-Ausgabe.", 404, code="not_found")
+    try:
+        abs_path, norm = _safe_abs_path(out_dir, name)
+    except ValueError:
+        return _json_error("Ungültiger Pfad.", 400, code="invalid_path")
+
+    ext = os.path.splitext(norm)[1].lower()
+    if ext == ".m3u8":
+        mime = "application/vnd.apple.mpegurl"
+    elif ext == ".ts":
+        mime = "video/mp2t"
+    else:
+        return _json_error("Nicht erlaubter Dateityp.", 400, code="bad_request")
+    if not os.path.isfile(abs_path):
+        return _json_error("Datei nicht gefunden.", 404, code="not_found")
+
+    if ext == ".ts":
+        cache_control = "public, max-age=31536000, immutable"
+    elif job.get("status") == "running":
+        cache_control = "no-cache"
+    else:
+        cache_control = "public, max-age=3600"
+    resp = _send_file_with_range(abs_path, mime, cache_control=cache_control)
+    resp.headers["Access-Control-Allow-Origin"] = "*"
+    return resp
+
+
 with app.app_context():
     _ensure_dirs()
     _init_db()
+    _queue_recover_transfers()
     _start_tag_index_build()
+    _start_merge_janitor()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,286 @@
+import argparse
+import gc
+import json
+import os
+import platform
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+BENCH_DIR = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, BENCH_DIR)
+
+import gen_library  # noqa: E402
+
+
+def _git_rev() -> str | None:
+    try:
+        out = subprocess.check_output(
+            ["git", "-C", REPO_ROOT, "describe", "--always", "--dirty"], text=True, stderr=subprocess.DEVNULL
+        )
+        return out.strip() or None
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _settle(app_module, timeout: float = 120.0):
+    # Background work started by the app (tag index, thumbnails, catalog probes)
+    # must not overlap a timed run.
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        with app_module._MEDIA_TASKS_LOCK:
+            media = sum(1 for f in app_module._MEDIA_TASKS.values() if not f.done())
+        with app_module._CATALOG_LOCK:
+            catalog = len(app_module._CATALOG_PENDING)
+        if not app_module._TAG_INDEX_BUILDING and media == 0 and catalog == 0:
+            return
+        time.sleep(0.05)
+
+
+def _measure(app_module, fn, repeat: int, setup=None, warmup: bool = False) -> dict:
+    if warmup:
+        fn()
+    times = []
+    extra = {}
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        _settle(app_module)
+        gc.collect()
+        t0 = time.perf_counter()
+        extra = fn() or {}
+        times.append(time.perf_counter() - t0)
+
+    # Separate pass for the allocation peak; tracemalloc slows the timed runs down.
+    if setup is not None:
+        setup()
+    _settle(app_module)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn()
+        _cur, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    out = {
+        "runs": repeat,
+        "min_s": round(min(times), 6),
+        "median_s": round(statistics.median(times), 6),
+        "max_s": round(max(times), 6),
+        "peak_kib": peak // 1024,
+    }
+    out.update(extra)
+    return out
+
+
+def _build_cases(app_module, client, root: str, summary: dict, args) -> list[tuple]:
+    A = app_module
+    tags = [t for t, _n in summary.get("tags") or []]
+    common = tags[:2] or ["Abwehr"]
+    rare = tags[-1:] or ["Abwehr"]
+
+    by_dir = {}
+    for dirpath, _dirnames, filenames in os.walk(root):
+        by_dir[dirpath] = len(filenames)
+    busiest = os.path.relpath(max(by_dir, key=by_dir.get), root)
+    busiest = "" if busiest == "." else busiest
+
+    largest = max(
+        (os.path.join(d, f) for d, _dn, fns in os.walk(root) for f in fns if not f.startswith(".")),
+        key=os.path.getsize,
+    )
+    range_len = min(os.path.getsize(largest), args.range_mib * 1024**2)
+
+    target = A.app.config["TARGET_ROOT"]
+    queue_relpaths = []
+    for i in range(args.queue_size):
+        rp = f"bench_queue/clip_{i:05d}.mp4"
+        p = os.path.join(target, rp)
+        os.makedirs(os.path.dirname(p), exist_ok=True)
+        with open(p, "wb") as f:
+            f.write(b"\0" * 1024)
+        queue_relpaths.append(rp)
+
+    def _ok(resp) -> dict:
+        if resp.status_code != 200:
+            raise RuntimeError(f"HTTP {resp.status_code}: {resp.get_data(as_text=True)[:200]}")
+        return resp.get_json()
+
+    def build_tag_index():
+        return {"items": len(A._build_tag_index(root, root))}
+
+    def tag_index_rebuild():
+        return {"items": len(A._tag_index_rebuild(root, root)["entries"])}
+
+    def tag_search_and():
+        return {"items": _ok(client.post("/api/tags/search", json={"query": " ".join(common), "limit": 2000}))["count"]}
+
+    def tag_search_or():
+        body = {"query": " ".join(common + rare), "mode": "or", "limit": 2000}
+        return {"items": _ok(client.post("/api/tags/search", json=body))["count"]}
+
+    def tag_search_rare():
+        return {"items": _ok(client.post("/api/tags/search", json={"query": rare[0], "limit": 2000}))["count"]}
+
+    def name_search():
+        return {"items": _ok(client.post("/api/name/search", json={"query": "spiel 00", "limit": 2000}))["count"]}
+
+    def list_cache_clear():
+        with A._LIST_CACHE_LOCK:
+            A._LIST_CACHE.clear()
+
+    def list_dir():
+        with A.app.app_context():
+            return {"items": A._list_dir(root, busiest)["total_videos"]}
+
+    def list_dir_size_desc():
+        with A.app.app_context():
+            return {"items": len(A._list_dir(root, busiest, sort="size", order="desc")["videos"])}
+
+    def list_api():
+        return {"items": len(_ok(client.get("/api/list", query_string={"path": busiest}))["videos"])}
+
+    def dedupe_scan():
+        before = A._METRICS_COUNTERS.get(("dedupe_hashed_bytes_total", ()), 0.0)
+        with A.app.app_context():
+            groups = A._dedupe_scan_dir(root, "")
+        hashed = A._METRICS_COUNTERS.get(("dedupe_hashed_bytes_total", ()), 0.0) - before
+        return {"items": len(groups), "hashed_bytes": int(hashed)}
+
+    def range_serve():
+        with A.app.test_request_context(headers={"Range": f"bytes=0-{range_len - 1}"}):
+            resp = A._send_file_with_range(largest, "video/mp4")
+            n = 0
+            for chunk in resp.response:
+                n += len(chunk)
+            if hasattr(resp.response, "close"):
+                resp.response.close()
+        return {"bytes": n}
+
+    def queue_clear():
+        _ok(client.post("/api/queue/clear"))
+
+    def queue_fill():
+        queue_clear()
+        queue_add_batch()
+
+    def queue_add_batch():
+        return {"items": _ok(client.post("/api/queue/add/batch", json={"target_relpaths": queue_relpaths}))["added"]}
+
+    def queue_list():
+        return {"items": len(_ok(client.get("/api/queue"))["items"])}
+
+    def queue_reorder():
+        ids = [it["id"] for it in _ok(client.get("/api/queue"))["items"]]
+        _ok(client.post("/api/queue/reorder", json={"ordered_ids": ids[::-1]}))
+        return {"items": len(ids)}
+
+    def queue_move():
+        ids = [it["id"] for it in _ok(client.get("/api/queue"))["items"]]
+        # Always insert at the front, which keeps halving the same gap.
+        for i in range(min(args.queue_moves, len(ids) - 1)):
+            _ok(client.post("/api/queue/move", json={"id": ids[-1 - i], "before_id": ids[0]}))
+        return {"items": min(args.queue_moves, len(ids) - 1)}
+
+    return [
+        ("build_tag_index", build_tag_index, None, False),
+        ("tag_index_rebuild", tag_index_rebuild, None, False),
+        ("tag_search_and", tag_search_and, None, True),
+        ("tag_search_or", tag_search_or, None, True),
+        ("tag_search_rare", tag_search_rare, None, True),
+        ("name_search", name_search, None, True),
+        ("list_dir_cold", list_dir, list_cache_clear, False),
+        ("list_dir_warm", list_dir, None, True),
+        ("list_dir_size_desc", list_dir_size_desc, None, True),
+        ("list_api_warm", list_api, None, True),
+        ("dedupe_scan", dedupe_scan, None, False),
+        ("range_serve", range_serve, None, True),
+        ("queue_add_batch", queue_add_batch, queue_clear, False),
+        ("queue_list", queue_list, queue_fill, False),
+        ("queue_reorder", queue_reorder, queue_fill, False),
+        ("queue_move", queue_move, queue_fill, False),
+    ]
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Time the hot paths of app.py against a synthetic library.")
+    gen_library.add_arguments(ap)
+    ap.add_argument("--library", help="existing library to use instead of generating one (kept afterwards)")
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--only", help="comma-separated case names")
+    ap.add_argument("--queue-size", type=int, default=500)
+    ap.add_argument("--queue-moves", type=int, default=100)
+    ap.add_argument("--range-mib", type=int, default=64, help="bytes served by range_serve")
+    ap.add_argument("--output", help="also write the JSON result to this file")
+    ap.add_argument("--json", action="store_true", help="print machine-readable results only")
+    args = ap.parse_args(argv)
+
+    work = tempfile.mkdtemp(prefix="bench_hot_")
+    try:
+        if args.library:
+            root = os.path.abspath(args.library)
+            summary = gen_library.load_manifest(root) or {"root": root}
+        else:
+            root = os.path.join(work, "library")
+            summary = gen_library.generate_from_args(root, args)
+
+        # The app reads its configuration on import.
+        os.environ["VIDEO_ROOT"] = root
+        os.environ["TAG_SCAN_ROOT"] = root
+        os.environ["PATH"] = os.path.join(BENCH_DIR, "stubs") + os.pathsep + os.environ.get("PATH", "")
+        os.environ.setdefault("DB_PATH", os.path.join(work, "storage", "app.db"))
+        os.environ.setdefault("TARGET_ROOT", os.path.join(work, "target"))
+        os.environ.setdefault("PROXY_AUTO", "0")
+        os.environ.setdefault("TRANSFER_BATCH_MAX", str(max(500, args.queue_size)))
+        sys.path.insert(0, REPO_ROOT)
+        import app as app_module
+
+        _settle(app_module)
+        client = app_module.app.test_client()
+        cases = _build_cases(app_module, client, root, summary, args)
+        only = {s.strip() for s in (args.only or "").split(",") if s.strip()}
+        unknown = only - {c[0] for c in cases}
+        if unknown:
+            ap.error(f"unknown case(s): {', '.join(sorted(unknown))}")
+
+        results = {}
+        for name, fn, setup, warmup in cases:
+            if only and name not in only:
+                continue
+            results[name] = _measure(app_module, fn, args.repeat, setup=setup, warmup=warmup)
+            if not args.json:
+                r = results[name]
+                print(f"{name:>20}: median {r['median_s'] * 1000:9.2f} ms  min {r['min_s'] * 1000:9.2f} ms  "
+                      f"peak {r['peak_kib']:>8} KiB", flush=True)
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+    out = {
+        "meta": {
+            "git": _git_rev(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "repeat": args.repeat,
+            "maxrss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+            "library": {k: v for k, v in summary.items() if k != "tags"},
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(out, f, indent=2)
+    if args.json:
+        print(json.dumps(out))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+import argparse
+import json
+import os
+import resource
+import shutil
+import socket
+import sys
+import tempfile
+import threading
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+class _SendfileWrapper:
+    # Mimics the wsgi.file_wrapper of gunicorn: the server drains it with
+    # os.sendfile() and stops after Content-Length bytes.
+    def __init__(self, filelike, blksize=8192):
+        self.filelike = filelike
+        self.blksize = blksize
+
+    def close(self):
+        self.filelike.close()
+
+
+def _drain(sock: socket.socket, counter: list):
+    buf = bytearray(1024 * 1024)
+    while True:
+        n = sock.recv_into(buf)
+        if n == 0:
+            break
+        counter[0] += n
+
+
+def _serve_once(flask_app, send_fn, abs_path: str, start: int, end: int, mode: str) -> int:
+    environ = {}
+    if mode == "sendfile":
+        environ["wsgi.file_wrapper"] = _SendfileWrapper
+
+    srv, cli = socket.socketpair()
+    received = [0]
+    t = threading.Thread(target=_drain, args=(cli, received), daemon=True)
+    t.start()
+    try:
+        with flask_app.test_request_context(headers={"Range": f"bytes={start}-{end}"}, environ_base=environ):
+            resp = send_fn(abs_path, "video/mp4")
+            length = int(resp.headers["Content-Length"])
+            body = resp.response
+            if isinstance(body, _SendfileWrapper):
+                fd = body.filelike.fileno()
+                offset = os.lseek(fd, 0, os.SEEK_CUR)
+                sent = 0
+                while sent < length:
+                    sent += os.sendfile(srv.fileno(), fd, offset + sent, min(length - sent, 0x7FFFF000))
+                body.close()
+            else:
+                for chunk in body:
+                    srv.sendall(chunk)
+                if hasattr(body, "close"):
+                    body.close()
+    finally:
+        srv.shutdown(socket.SHUT_WR)
+        t.join()
+        srv.close()
+        cli.close()
+    if received[0] != length:
+        raise RuntimeError(f"short transfer: {received[0]} != {length}")
+    return length
+
+
+def _run_mode(flask_app, send_fn, abs_path: str, size: int, streams: int, window: int, mode: str) -> dict:
+    ru0 = resource.getrusage(resource.RUSAGE_SELF)
+    t0 = time.perf_counter()
+    totals = [0] * streams
+    errors = []
+
+    def _stream(i: int):
+        try:
+            start = (i * window) % max(1, size - window)
+            totals[i] = _serve_once(flask_app, send_fn, abs_path, start, start + window - 1, mode)
+        except Exception as e:
+            errors.append(str(e))
+
+    threads = [threading.Thread(target=_stream, args=(i,)) for i in range(streams)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    wall = time.perf_counter() - t0
+    ru1 = resource.getrusage(resource.RUSAGE_SELF)
+    cpu = (ru1.ru_utime - ru0.ru_utime) + (ru1.ru_stime - ru0.ru_stime)
+    moved = sum(totals)
+    return {
+        "mode": mode,
+        "streams": streams,
+        "bytes": moved,
+        "wall_s": round(wall, 4),
+        "throughput_mib_s": round(moved / wall / 1024**2, 1) if wall > 0 else None,
+        "cpu_s": round(cpu, 4),
+        "cpu_s_per_stream": round(cpu / streams, 4),
+        "cpu_s_per_gib": round(cpu / (moved / 1024**3), 4) if moved else None,
+        "errors": errors,
+    }
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Compare generator vs. sendfile range serving.")
+    ap.add_argument("--size-mib", type=int, default=512, help="size of the test file")
+    ap.add_argument("--window-mib", type=int, default=128, help="bytes served per range request")
+    ap.add_argument("--streams", type=int, default=4, help="concurrent range requests")
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--file", help="existing file to serve instead of a generated one")
+    ap.add_argument("--json", action="store_true", help="print machine-readable results only")
+    args = ap.parse_args(argv)
+
+    work = tempfile.mkdtemp(prefix="bench_range_")
+    os.environ.setdefault("DB_PATH", os.path.join(work, "storage", "app.db"))
+    os.environ.setdefault("TARGET_ROOT", os.path.join(work, "target"))
+    sys.path.insert(0, REPO_ROOT)
+    import app as app_module
+
+    abs_path = args.file
+    if not abs_path:
+        abs_path = os.path.join(work, "bench.mp4")
+        block = os.urandom(1024 * 1024)
+        with open(abs_path, "wb") as f:
+            for _ in range(args.size_mib):
+                f.write(block)
+    size = os.path.getsize(abs_path)
+    window = min(size, args.window_mib * 1024 * 1024)
+
+    with open(abs_path, "rb") as f:
+        while f.read(8 * 1024 * 1024):
+            pass
+
+    results = []
+    try:
+        for mode in ("generator", "sendfile"):
+            runs = [
+                _run_mode(app_module.app, app_module._send_file_with_range, abs_path, size, args.streams, window, mode)
+                for _ in range(args.repeat)
+            ]
+            best = min(runs, key=lambda r: r["wall_s"])
+            best["runs"] = len(runs)
+            results.append(best)
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+    out = {"file_bytes": size, "window_bytes": window, "results": results}
+    if args.json:
+        print(json.dumps(out))
+        return 0
+
+    print(f"file={size / 1024**2:.0f} MiB window={window / 1024**2:.0f} MiB streams={args.streams}")
+    for r in results:
+        print(
+            f"{r['mode']:>10}: {r['throughput_mib_s']:>8} MiB/s  "
+            f"cpu/stream {r['cpu_s_per_stream']:.3f}s  cpu/GiB {r['cpu_s_per_gib']:.3f}s"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,49 @@
+import argparse
+import json
+import sys
+
+
+def _load(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return data.get("results") or {}
+
+
+def compare(base: dict, new: dict, metric: str, threshold: float) -> tuple[list[dict], list[str]]:
+    rows = []
+    regressions = []
+    for name in sorted(set(base) | set(new)):
+        b = (base.get(name) or {}).get(metric)
+        n = (new.get(name) or {}).get(metric)
+        change = (n - b) / b if b and n is not None else None
+        rows.append({"case": name, "base": b, "new": n, "change": change})
+        if change is not None and change > threshold:
+            regressions.append(name)
+    return rows, regressions
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Compare two bench_hot_paths.py JSON results.")
+    ap.add_argument("base", help="result of the reference version")
+    ap.add_argument("new", help="result of the candidate version")
+    ap.add_argument("--metric", default="median_s", help="result field to compare (median_s, min_s, peak_kib, ...)")
+    ap.add_argument("--threshold", type=float, default=0.10, help="relative slowdown that counts as regression")
+    ap.add_argument("--json", action="store_true", help="print machine-readable results only")
+    args = ap.parse_args(argv)
+
+    rows, regressions = compare(_load(args.base), _load(args.new), args.metric, args.threshold)
+    if args.json:
+        print(json.dumps({"metric": args.metric, "threshold": args.threshold, "rows": rows, "regressions": regressions}))
+    else:
+        print(f"{'case':>20} {'base':>12} {'new':>12} {'change':>8}")
+        for r in rows:
+            b = "-" if r["base"] is None else f"{r['base']:.6g}"
+            n = "-" if r["new"] is None else f"{r['new']:.6g}"
+            c = "" if r["change"] is None else f"{r['change'] * 100:+.1f}%"
+            mark = "  <-- regression" if r["case"] in regressions else ""
+            print(f"{r['case']:>20} {b:>12} {n:>12} {c:>8}{mark}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
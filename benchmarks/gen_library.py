@@ -0,0 +1,194 @@
+import argparse
+import hashlib
+import json
+import os
+import random
+import sys
+import time
+
+_TEAMS = ("HSG", "TSV", "SG", "HC", "TuS", "SV", "VfL", "ThSV")
+_EXTENSIONS = ((".mp4", 0.7), (".mov", 0.15), (".mkv", 0.1), (".avi", 0.05))
+_MANIFEST = ".bench_manifest.json"
+_BLOCK = 64 * 1024
+
+
+def _tag_vocabulary(n: int) -> list[str]:
+    base = ("Abwehr", "Angriff", "Tempo", "Konter", "7m", "Torwart", "Kreis", "Rückraum", "Außen", "Wechsel")
+    return [base[i] if i < len(base) else f"Tag{i:03d}" for i in range(n)]
+
+
+def _pick_tags(rng: random.Random, vocab: list[str], weights: list[float], max_tags: int, untagged_ratio: float):
+    if rng.random() < untagged_ratio:
+        return []
+    k = rng.randint(1, max(1, max_tags))
+    picked = []
+    while len(picked) < min(k, len(vocab)):
+        t = rng.choices(vocab, weights)[0]
+        if t not in picked:
+            picked.append(t)
+    return picked
+
+
+def _dir_paths(depth: int, fanout: int) -> list[str]:
+    dirs = [""]
+    level = [""]
+    for d in range(depth):
+        nxt = []
+        for parent in level:
+            for i in range(fanout):
+                name = f"Saison {2015 + i}" if d == 0 else f"Spieltag {i + 1:02d}"
+                nxt.append(name if parent == "" else f"{parent}/{name}")
+        dirs.extend(nxt)
+        level = nxt
+    return dirs
+
+
+def _write_content(path: str, content_id: int, size: int, sparse: bool):
+    # Content is a pure function of content_id, so duplicates hash equal without copying.
+    head = hashlib.sha256(f"bench:{content_id}".encode()).digest() * (_BLOCK // 32)
+    with open(path, "wb") as f:
+        if sparse:
+            f.write(head[: min(size, _BLOCK)])
+            if size > 2 * _BLOCK:
+                f.seek(size - _BLOCK)
+                f.write(head)
+            f.truncate(size)
+            return
+        left = size
+        while left > 0:
+            n = min(left, _BLOCK)
+            f.write(head[:n])
+            left -= n
+
+
+def generate(
+    out: str,
+    files: int = 2000,
+    depth: int = 2,
+    fanout: int = 4,
+    tags: int = 40,
+    tags_per_file: int = 3,
+    tag_skew: float = 1.1,
+    untagged_ratio: float = 0.1,
+    dup_ratio: float = 0.05,
+    size_kib: int = 64,
+    size_classes: int = 97,
+    sparse_ratio: float = 0.0,
+    sparse_mib: int = 512,
+    seed: int = 1,
+) -> dict:
+    t0 = time.perf_counter()
+    rng = random.Random(seed)
+    vocab = _tag_vocabulary(tags)
+    weights = [1.0 / (i + 1) ** tag_skew for i in range(len(vocab))]
+    dirs = _dir_paths(depth, fanout)
+    for d in dirs:
+        os.makedirs(os.path.join(out, d), exist_ok=True)
+
+    tag_counts = {}
+    originals = []
+    n_dup = n_sparse = logical = 0
+    for i in range(files):
+        rel_dir = rng.choice(dirs)
+        ext = rng.choices([e for e, _ in _EXTENSIONS], [w for _, w in _EXTENSIONS])[0]
+        file_tags = _pick_tags(rng, vocab, weights, tags_per_file, untagged_ratio)
+        for t in file_tags:
+            tag_counts[t] = tag_counts.get(t, 0) + 1
+        name = f"Spiel {i:06d} {rng.choice(_TEAMS)} - {rng.choice(_TEAMS)}"
+        if file_tags:
+            name += f" [{' '.join(file_tags)}]"
+
+        if originals and rng.random() < dup_ratio:
+            content_id, size, sparse = rng.choice(originals)
+            name = f"Kopie von {name}"
+            n_dup += 1
+        else:
+            sparse = rng.random() < sparse_ratio
+            # Few size classes, so dedupe has to hash same-size files that differ.
+            size = sparse_mib * 1024**2 if sparse else (size_kib * 1024 + (i % max(1, size_classes)) * 4096)
+            content_id = i
+            originals.append((content_id, size, sparse))
+        n_sparse += sparse
+        logical += size
+        _write_content(os.path.join(out, rel_dir, name + ext), content_id, size, sparse)
+
+    summary = {
+        "root": os.path.abspath(out),
+        "files": files,
+        "dirs": len(dirs),
+        "duplicates": n_dup,
+        "sparse_files": n_sparse,
+        "logical_bytes": logical,
+        "tags": sorted(tag_counts.items(), key=lambda kv: -kv[1]),
+        "seed": seed,
+        "generate_s": round(time.perf_counter() - t0, 3),
+    }
+    with open(os.path.join(out, _MANIFEST), "w", encoding="utf-8") as f:
+        json.dump(summary, f)
+    return summary
+
+
+def load_manifest(root: str) -> dict | None:
+    try:
+        with open(os.path.join(root, _MANIFEST), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def add_arguments(ap: argparse.ArgumentParser):
+    ap.add_argument("--files", type=int, default=2000, help="number of video files")
+    ap.add_argument("--depth", type=int, default=2, help="directory levels below the root")
+    ap.add_argument("--fanout", type=int, default=4, help="subdirectories per directory")
+    ap.add_argument("--tags", type=int, default=40, help="size of the tag vocabulary")
+    ap.add_argument("--tags-per-file", type=int, default=3, help="maximum tags per file name")
+    ap.add_argument("--tag-skew", type=float, default=1.1, help="zipf exponent of the tag distribution")
+    ap.add_argument("--untagged-ratio", type=float, default=0.1)
+    ap.add_argument("--dup-ratio", type=float, default=0.05, help="share of files that duplicate another file")
+    ap.add_argument("--size-kib", type=int, default=64, help="base size of regular files")
+    ap.add_argument("--size-classes", type=int, default=97, help="distinct sizes of regular files")
+    ap.add_argument("--sparse-ratio", type=float, default=0.0, help="share of large sparse files")
+    ap.add_argument("--sparse-mib", type=int, default=512, help="apparent size of sparse files")
+    ap.add_argument("--seed", type=int, default=1)
+
+
+def generate_from_args(out: str, args) -> dict:
+    return generate(
+        out,
+        files=args.files,
+        depth=args.depth,
+        fanout=args.fanout,
+        tags=args.tags,
+        tags_per_file=args.tags_per_file,
+        tag_skew=args.tag_skew,
+        untagged_ratio=args.untagged_ratio,
+        dup_ratio=args.dup_ratio,
+        size_kib=args.size_kib,
+        size_classes=args.size_classes,
+        sparse_ratio=args.sparse_ratio,
+        sparse_mib=args.sparse_mib,
+        seed=args.seed,
+    )
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Generate a synthetic VIDEO_ROOT for the benchmarks.")
+    ap.add_argument("out", help="target directory (created if missing)")
+    add_arguments(ap)
+    ap.add_argument("--json", action="store_true", help="print machine-readable summary only")
+    args = ap.parse_args(argv)
+
+    summary = generate_from_args(args.out, args)
+    if args.json:
+        print(json.dumps(summary))
+        return 0
+    print(
+        f"{summary['files']} files in {summary['dirs']} dirs, {summary['duplicates']} duplicates, "
+        f"{summary['sparse_files']} sparse, {summary['logical_bytes'] / 1024**2:.0f} MiB logical "
+        f"({summary['generate_s']}s)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,10 +2,53 @@ import os
 
 BASE_DIR = os.path.abspath(os.path.dirname(__file__))
 
-VIDEO_ROOT = os.path.expanduser("~/pve/Handball")
-TAG_SCAN_ROOT = os.path.expanduser("~/pve/Handball")
+VIDEO_ROOT = os.path.expanduser(os.environ.get("VIDEO_ROOT", "~/pve/Handball"))
+TAG_SCAN_ROOT = os.path.expanduser(os.environ.get("TAG_SCAN_ROOT", VIDEO_ROOT))
 TARGET_ROOT = os.environ.get("TARGET_ROOT", os.path.join(BASE_DIR, "target"))
 
 DB_PATH = os.environ.get("DB_PATH", os.path.join(BASE_DIR, "storage", "app.db"))
 
 ALLOWED_VIDEO_EXTENSIONS = {".mp4", ".mov", ".mkv", ".webm", ".avi"}
+
+MERGE_WORKERS = int(os.environ.get("MERGE_WORKERS", max(1, (os.cpu_count() or 1) // 4)))
+MERGE_CHUNK_SECONDS = float(os.environ.get("MERGE_CHUNK_SECONDS", "120"))
+
+MERGE_RETENTION_MAX_AGE_SECONDS = float(os.environ.get("MERGE_RETENTION_MAX_AGE_SECONDS", str(24 * 3600)))
+MERGE_RETENTION_MAX_BYTES = int(os.environ.get("MERGE_RETENTION_MAX_BYTES", str(20 * 1024**3)))
+MERGE_RETENTION_KEEP_LAST = int(os.environ.get("MERGE_RETENTION_KEEP_LAST", "10"))
+MERGE_JOB_STATE_MAX_AGE_SECONDS = float(os.environ.get("MERGE_JOB_STATE_MAX_AGE_SECONDS", str(7 * 24 * 3600)))
+MERGE_JANITOR_INTERVAL_SECONDS = float(os.environ.get("MERGE_JANITOR_INTERVAL_SECONDS", "300"))
+MERGE_HLS_SEGMENT_SECONDS = float(os.environ.get("MERGE_HLS_SEGMENT_SECONDS", "4"))
+
+RANGE_USE_FILE_WRAPPER = os.environ.get("RANGE_USE_FILE_WRAPPER", "1").lower() in ("1", "true", "yes")
+
+MEDIA_WORKERS = int(os.environ.get("MEDIA_WORKERS", max(1, min(4, (os.cpu_count() or 1) // 4))))
+THUMB_WORKERS = int(os.environ.get("THUMB_WORKERS", "1"))
+PROXY_AUTO = os.environ.get("PROXY_AUTO", "1").lower() in ("1", "true", "yes")
+PROXY_MIN_BYTES = int(os.environ.get("PROXY_MIN_BYTES", str(64 * 1024**2)))
+PROXY_CACHE_MAX_BYTES = int(os.environ.get("PROXY_CACHE_MAX_BYTES", str(50 * 1024**3)))
+THUMB_CACHE_MAX_BYTES = int(os.environ.get("THUMB_CACHE_MAX_BYTES", str(2 * 1024**3)))
+
+LIST_PAGE_SIZE = int(os.environ.get("LIST_PAGE_SIZE", "200"))
+LIST_PAGE_MAX = int(os.environ.get("LIST_PAGE_MAX", "2000"))
+CATALOG_WORKERS = int(os.environ.get("CATALOG_WORKERS", "2"))
+
+REMUX_CACHE_MAX_BYTES = int(os.environ.get("REMUX_CACHE_MAX_BYTES", str(20 * 1024**3)))
+
+CLIP_WORKERS = int(os.environ.get("CLIP_WORKERS", "2"))
+CLIP_CLUSTER_GAP_SECONDS = float(os.environ.get("CLIP_CLUSTER_GAP_SECONDS", "30"))
+
+TRANSFER_WORKERS = int(os.environ.get("TRANSFER_WORKERS", "4"))
+TRANSFER_BATCH_MAX = int(os.environ.get("TRANSFER_BATCH_MAX", "500"))
+
+# Jeder offene /api/events-Stream belegt einen Worker-Thread. Mit mehreren
+# Workern einen Thread- oder Async-Worker verwenden (z.B. gunicorn -k gthread
+# --threads 16); reine Sync-Prefork-Worker sind sonst schnell alle belegt.
+EVENTS_STREAM_MAX_SECONDS = float(os.environ.get("EVENTS_STREAM_MAX_SECONDS", "25"))
+EVENTS_RETENTION_SECONDS = float(os.environ.get("EVENTS_RETENTION_SECONDS", "3600"))
+
+SERVER_TIMING = os.environ.get("SERVER_TIMING", "1").lower() in ("1", "true", "yes")
+PROFILE_REQUESTS = os.environ.get("PROFILE_REQUESTS", "0").lower() in ("1", "true", "yes")
+PROFILE_SAMPLE_RATE = float(os.environ.get("PROFILE_SAMPLE_RATE", "1.0"))
+PROFILE_KEEP_PER_ROUTE = int(os.environ.get("PROFILE_KEEP_PER_ROUTE", "5"))
+PROFILE_ADMIN_TOKEN = os.environ.get("PROFILE_ADMIN_TOKEN", "")
@@ -1,6 +1,8 @@
 let state = {
   currentPath: "",
   lastList: null,
+  listSort: { sort: "name", order: "asc" },
+  listLoadingMore: false,
   lastResultsKind: "tag",
   queue: [],
   sortable: null,
@@ -13,6 +15,7 @@ let state = {
   currentFileTags: [],
   clipMarkers: [],
   clipBusy: false,
+  keyframes: { relpath: null, times: null, loading: false },
   dedupe: { scanId: null, groups: [], root: "", status: "idle", phase: "", message: "", lastPollMs: 0, lastUpdateMs: 0 },
 };
 
@@ -284,7 +287,7 @@ function renderDedupeHeartbeat() {
   if (status === "error") text = "Fehler.";
 
   run.textContent = text;
-  poll.textContent = state.dedupe.lastPollMs ? `Letzter Poll: ${pollAgo}` : "";
+  poll.textContent = state.dedupe.lastPollMs ? `Letztes Event: ${pollAgo}` : "";
   upd.textContent = state.dedupe.lastUpdateMs ? `Letztes Update: ${updAgo}` : "";
 
   const stale = running && state.dedupe.lastUpdateMs && (Date.now() - state.dedupe.lastUpdateMs > 5000);
@@ -437,6 +440,136 @@ function formatBytes(bytes) {
   return `${gb.toFixed(2)} GB`;
 }
 
+const jobEvents = { source: null, listeners: new Set(), stateListeners: new Set(), retryTimer: null };
+const EVENT_SOURCE_RETRY_MS = 15000;
+
+function notifyEventSourceState(kind) {
+  for (const fn of Array.from(jobEvents.stateListeners)) {
+    try {
+      fn(kind);
+    } catch (_) {}
+  }
+}
+
+function ensureEventSource() {
+  if (jobEvents.source || !window.EventSource) return jobEvents.source;
+  // Eine Verbindung für alle Jobs; der Browser setzt Last-Event-ID beim Reconnect selbst.
+  const es = new EventSource("/api/events");
+  let opened = false;
+  es.onopen = () => {
+    // Nach einem Neuaufbau einmal nachladen, was in der Lücke passiert ist.
+    if (opened) return;
+    opened = true;
+    notifyEventSourceState("open");
+  };
+  es.onerror = () => {
+    // Bei HTTP-Fehlern (z.B. 502 vom Proxy) verbindet der Browser nicht neu:
+    // auf Polling umschalten und später selbst einen neuen Versuch starten.
+    if (es.readyState !== EventSource.CLOSED || jobEvents.source !== es) return;
+    jobEvents.source = null;
+    notifyEventSourceState("closed");
+    if (!jobEvents.retryTimer) {
+      jobEvents.retryTimer = window.setTimeout(() => {
+        jobEvents.retryTimer = null;
+        if (jobEvents.listeners.size > 0) ensureEventSource();
+      }, EVENT_SOURCE_RETRY_MS);
+    }
+  };
+  es.onmessage = (msg) => {
+    let evt = null;
+    try {
+      evt = JSON.parse(msg.data);
+    } catch (_) {
+      return;
+    }
+    if (!evt || !evt.topic) return;
+    for (const fn of Array.from(jobEvents.listeners)) {
+      try {
+        fn(evt);
+      } catch (_) {}
+    }
+  };
+  jobEvents.source = es;
+  return es;
+}
+
+function onJobEvent(listener) {
+  ensureEventSource();
+  jobEvents.listeners.add(listener);
+  return () => jobEvents.listeners.delete(listener);
+}
+
+function followJob({ topic, jobId, statusUrl, onUpdate, onLog }) {
+  // Erst abonnieren, dann den aktuellen Stand einmal holen; danach nur noch Events.
+  // Ohne Event-Verbindung wird jede Sekunde gepollt.
+  return new Promise((resolve, reject) => {
+    let finished = false;
+    let fallbackTimer = null;
+    const finish = (st, err) => {
+      if (finished) return;
+      finished = true;
+      off();
+      jobEvents.stateListeners.delete(onSourceState);
+      if (fallbackTimer) window.clearTimeout(fallbackTimer);
+      if (err) reject(err);
+      else if (st.status === "error") reject(new Error(st.error || st.message || "Job fehlgeschlagen."));
+      else resolve(st);
+    };
+    const handle = (st) => {
+      if (!st || finished) return;
+      if (onUpdate) onUpdate(st);
+      if (st.status === "done" || st.status === "error") finish(st);
+    };
+    const off = onJobEvent((evt) => {
+      if (evt.topic !== topic || String(evt.job_id) !== String(jobId)) return;
+      if (evt.type === "log") {
+        if (onLog && evt.data) onLog(evt.data.line);
+        return;
+      }
+      handle(evt.data);
+    });
+    const poll = async () => {
+      fallbackTimer = null;
+      try {
+        handle(await apiGet(statusUrl));
+      } catch (e) {
+        finish(null, e);
+        return;
+      }
+      if (!finished && !jobEvents.source && !fallbackTimer) fallbackTimer = window.setTimeout(poll, 1000);
+    };
+    const onSourceState = () => {
+      if (finished) return;
+      if (fallbackTimer) window.clearTimeout(fallbackTimer);
+      poll();
+    };
+    jobEvents.stateListeners.add(onSourceState);
+    poll();
+  });
+}
+
+function setupJobEventListeners() {
+  onJobEvent((evt) => {
+    if (evt.topic === "tags" && evt.type !== "building") {
+      loadTagIndex({ refresh: false });
+    } else if (evt.topic === "tags") {
+      setTagIndexStatus("Tag-Scan läuft…");
+    } else if (evt.topic === "transfer") {
+      const d = evt.data || {};
+      const it = (state.queue || []).find((x) => Number(x.id) === Number(d.id));
+      if (!it) return;
+      if (evt.type === "progress") {
+        it.state = d.state || it.state;
+        it.bytes_done = d.bytes_done;
+        it.bytes_total = d.bytes_total;
+        renderQueue(state.queue);
+      } else {
+        loadQueue();
+      }
+    }
+  });
+}
+
 function renderDedupeResults(groups) {
   const el = $("dedupeResults");
   const summaryEl = $("dedupeSummary");
@@ -619,10 +752,8 @@ function setupDedupeUI() {
         throw new Error("Scan konnte nicht gestartet werden.");
       }
 
-      const startedAt = Date.now();
-      while (true) {
-        state.dedupe.lastPollMs = Date.now();
-        const st = await apiGet(`/api/dedupe/scan/status/${state.dedupe.scanId}`);
+      let logLines = [];
+      const onUpdate = (st) => {
         state.dedupe.lastPollMs = Date.now();
         const p = st && st.progress ? st.progress : {};
         const msg = st && st.message ? String(st.message) : "";
@@ -645,28 +776,30 @@ function setupDedupeUI() {
           const dups = Number(p.duplicate_files) || 0;
           summaryEl.textContent = `Ordner: ${rootLabel} | ${msg} | Dirs: ${dirs} | Videos: ${vids} | Kandidaten: ${cand} | Hash: ${hashed}/${cand} | Duplikate: ${dups}`;
         }
-        renderDedupeLog(st.log_tail || []);
-
-        if (st.status === "done") {
-          state.dedupe.groups = st.groups || [];
-          renderDedupeResults(state.dedupe.groups);
-          setStatus("Suche abgeschlossen.", "ok");
-          state.dedupe.status = "done";
-          renderDedupeHeartbeat();
-          break;
-        }
-        if (st.status === "error") {
-          const err = st && st.error ? String(st.error) : "Scan fehlgeschlagen.";
-          state.dedupe.status = "error";
-          renderDedupeHeartbeat();
-          throw new Error(err);
+        if (Array.isArray(st.log_tail)) {
+          logLines = st.log_tail.slice();
+          renderDedupeLog(logLines);
         }
-
-        if (Date.now() - startedAt > 1000 * 60 * 30) {
-          throw new Error("Scan dauert zu lange (Timeout). ");
-        }
-        await new Promise((r) => setTimeout(r, 500));
-      }
+      };
+      const onLog = (line) => {
+        state.dedupe.lastPollMs = Date.now();
+        logLines.push(String(line || ""));
+        if (logLines.length > 60) logLines = logLines.slice(-60);
+        renderDedupeLog(logLines);
+      };
+
+      const st = await followJob({
+        topic: "dedupe",
+        jobId: state.dedupe.scanId,
+        statusUrl: `/api/dedupe/scan/status/${state.dedupe.scanId}`,
+        onUpdate,
+        onLog,
+      });
+      state.dedupe.groups = st.groups || [];
+      renderDedupeResults(state.dedupe.groups);
+      setStatus("Suche abgeschlossen.", "ok");
+      state.dedupe.status = "done";
+      renderDedupeHeartbeat();
     } catch (e) {
       state.dedupe.status = "error";
       state.dedupe.message = e.message;
@@ -809,7 +942,7 @@ async function renameSourceVideoFile(relpath, displayName) {
       state.currentVideo.relpath = newRelpath;
       const player = $("videoPlayer");
       if (player) {
-        player.src = `/media/source/${encodePath(newRelpath)}`;
+        player.src = sourceMediaUrl(newRelpath);
         player.load();
         player.play().catch(() => {});
       }
@@ -843,6 +976,43 @@ async function renameSourceVideoFile(relpath, displayName) {
   }
 }
 
+function keyframeAtOrBefore(t) {
+  const times = state.keyframes && state.keyframes.times;
+  if (!times || times.length === 0) return null;
+  let lo = 0;
+  let hi = times.length - 1;
+  if (times[0] > t) return null;
+  while (lo < hi) {
+    const mid = (lo + hi + 1) >> 1;
+    if (times[mid] <= t) lo = mid;
+    else hi = mid - 1;
+  }
+  return times[lo];
+}
+
+async function loadKeyframesForCurrentVideo(attempt = 0) {
+  const cv = state.currentVideo;
+  if (!cv || cv.kind !== "source") return;
+  const relpath = cv.relpath;
+  if (state.keyframes.relpath === relpath && (state.keyframes.times || (state.keyframes.loading && attempt === 0))) return;
+  state.keyframes = { relpath, times: null, loading: true };
+  try {
+    const res = await fetch(`/api/keyframes?relpath=${encodeURIComponent(relpath)}&all=1`, { headers: { "Accept": "application/json" } });
+    const data = await res.json().catch(() => null);
+    if (!state.currentVideo || state.currentVideo.relpath !== relpath) return;
+    if (res.status === 202 && attempt < 20) {
+      setTimeout(() => loadKeyframesForCurrentVideo(attempt + 1), 1500);
+      return;
+    }
+    if (res.ok && data && Array.isArray(data.keyframes)) {
+      state.keyframes = { relpath, times: data.keyframes, loading: false };
+      renderSegmentList();
+      return;
+    }
+  } catch (_) {}
+  if (state.keyframes.relpath === relpath) state.keyframes.loading = false;
+}
+
 function renderSegmentList() {
   const wrap = $("segmentList");
   if (!wrap) return;
@@ -856,12 +1026,17 @@ function renderSegmentList() {
 
   for (let i = 0; i < segs.length; i++) {
     const s = segs[i];
+    const kf = keyframeAtOrBefore(s.start + 0.001);
+    const smartCb = $("smartCutCb");
+    const snapped = (kf !== null && s.start - kf > 0.05 && !(smartCb && smartCb.checked))
+      ? ` <span class="clip-snap" title="Schnitt ohne Neukodierung beginnt am vorherigen Keyframe">(Schnitt ab ${escapeHtml(formatTime(kf))})</span>`
+      : "";
     const row = document.createElement("div");
     row.className = "clip-row";
     row.innerHTML = `
       <div class="clip-row-left">
         <span class="badge">C</span>
-        <div class="name">${escapeHtml(formatTime(s.start))} → ${escapeHtml(formatTime(s.end))}</div>
+        <div class="name">${escapeHtml(formatTime(s.start))} → ${escapeHtml(formatTime(s.end))}${snapped}</div>
       </div>
       <div class="clip-actions">
         <button class="btn btn-sm btn-primary" type="button">Erstellen</button>
@@ -887,6 +1062,7 @@ function refreshClipEditorForCurrentVideo() {
 
   setClipEditorHint(state.currentVideo.relpath);
   setClipEditorEnabled(!state.clipBusy);
+  loadKeyframesForCurrentVideo();
   renderMarkerList();
   renderSegmentList();
   renderMarkerTimeline();
@@ -1737,10 +1913,28 @@ async function createClipsForSegments(segments) {
   state.clipBusy = true;
   refreshClipEditorForCurrentVideo();
   try {
-    const resp = await apiPost("/api/clips/create", { relpath: state.currentVideo.relpath, segments: segs });
-    const created = (resp && resp.created) ? resp.created : [];
+    const smartEl = $("smartCutCb");
+    const mode = (smartEl && smartEl.checked) ? "smart" : "copy";
+    const resp = await apiPost("/api/clips/create", { relpath: state.currentVideo.relpath, segments: segs, mode });
+    const jobId = resp && resp.job_id;
+    if (!jobId) {
+      throw new Error("Clip-Job konnte nicht gestartet werden.");
+    }
+
+    const st = await followJob({
+      topic: "clip",
+      jobId,
+      statusUrl: `/api/clips/status?job_id=${encodeURIComponent(jobId)}`,
+      onUpdate: (cur) => {
+        const parts = cur.segments || [];
+        const done = parts.filter((x) => x.status === "done").length;
+        setStatus(`Clips: ${done}/${parts.length} (${Math.round(Number(cur.progress_pct || 0))}%)`, "");
+      },
+    });
+
+    const created = (st && st.created) ? st.created : [];
     if (created.length > 0) {
-      setStatus(`Clips erstellt: ${created.length}`, "ok");
+      setStatus(st.message || `Clips erstellt: ${created.length}`, "ok");
     } else {
       setStatus("Keine Clips erstellt.", "error");
     }
@@ -1852,7 +2046,7 @@ async function applyTagEditToRelpath(relpath, action, tag) {
       state.currentVideo.relpath = newRelpath;
       const player = $("videoPlayer");
       if (player) {
-        player.src = `/media/source/${encodePath(newRelpath)}`;
+        player.src = sourceMediaUrl(newRelpath);
         player.load();
         player.play().catch(() => {});
       }
@@ -2021,15 +2215,79 @@ async function loadTagIndex({ refresh = false } = {}) {
 }
 
 async function waitForTagIndexReady({ maxMs = 30000 } = {}) {
-  const start = Date.now();
-  while (Date.now() - start < maxMs) {
-    const data = await loadTagIndex({ refresh: false });
-    if (data && !data.building) {
-      return data;
+  if (!window.EventSource) {
+    const start = Date.now();
+    while (Date.now() - start < maxMs) {
+      const data = await loadTagIndex({ refresh: false });
+      if (data && !data.building) return data;
+      await new Promise((r) => setTimeout(r, 700));
     }
-    await new Promise((r) => setTimeout(r, 700));
+    return null;
+  }
+  let off = null;
+  const built = new Promise((resolve) => {
+    off = onJobEvent((evt) => {
+      if (evt.topic === "tags" && evt.type !== "building") resolve(true);
+    });
+  });
+  try {
+    const data = await loadTagIndex({ refresh: false });
+    if (data && !data.building) return data;
+    const ok = await Promise.race([built, new Promise((r) => setTimeout(() => r(false), maxMs))]);
+    return ok ? await loadTagIndex({ refresh: false }) : null;
+  } finally {
+    off();
   }
-  return null;
+}
+
+const THUMB_SPRITE_COLS = 10;
+const THUMB_SPRITE_ROWS = 10;
+
+function thumbHtml(v) {
+  if (!v || !v.thumb_url) return "";
+  return `<span class="thumb" data-thumb="${escapeHtml(v.thumb_url)}" data-sprite="${escapeHtml(v.sprite_url || "")}"></span>`;
+}
+
+function bindThumb(row, v, attempt = 0) {
+  const el = row ? row.querySelector(".thumb") : null;
+  if (!el) return;
+  if (v && v.thumb_failed) return;
+  const posterUrl = el.dataset.thumb;
+  const spriteUrl = el.dataset.sprite;
+
+  const img = new Image();
+  img.onload = () => {
+    el.style.backgroundImage = `url("${posterUrl}")`;
+    el.classList.add("ready");
+  };
+  img.onerror = () => {
+    // Vorschaubild wird im Hintergrund erstellt: einige Male nachladen.
+    if (attempt < 5 && el.isConnected) {
+      setTimeout(() => bindThumb(row, v, attempt + 1), 2000 * (attempt + 1));
+    }
+  };
+  img.src = posterUrl;
+  if (attempt > 0 || !spriteUrl) return;
+
+  el.addEventListener("mousemove", (e) => {
+    if (!el.classList.contains("ready")) return;
+    const rect = el.getBoundingClientRect();
+    const frac = Math.min(0.999, Math.max(0, (e.clientX - rect.left) / Math.max(1, rect.width)));
+    const idx = Math.floor(frac * THUMB_SPRITE_COLS * THUMB_SPRITE_ROWS);
+    const col = idx % THUMB_SPRITE_COLS;
+    const rowIdx = Math.floor(idx / THUMB_SPRITE_COLS);
+    el.classList.add("scrub");
+    el.style.backgroundImage = `url("${spriteUrl}")`;
+    el.style.backgroundSize = `${THUMB_SPRITE_COLS * rect.width}px ${THUMB_SPRITE_ROWS * rect.height}px`;
+    el.style.backgroundPosition = `${-col * rect.width}px ${-rowIdx * rect.height}px`;
+  });
+  el.addEventListener("mouseleave", () => {
+    if (!el.classList.contains("ready")) return;
+    el.classList.remove("scrub");
+    el.style.backgroundImage = `url("${posterUrl}")`;
+    el.style.backgroundSize = "";
+    el.style.backgroundPosition = "";
+  });
 }
 
 function renderResults(kind, results) {
@@ -2065,6 +2323,7 @@ function renderResults(kind, results) {
       <div class="item-left">
         <input class="source-select" type="checkbox" ${state.sourceSelectedRelpaths instanceof Set && state.sourceSelectedRelpaths.has(String(r.relpath || "")) ? "checked" : ""} />
         <span class="badge">${kind === "name" ? "NAME" : "TAG"}</span>
+        ${thumbHtml(r)}
         <div class="name">${escapeHtml(r.name)}</div>
       </div>
       <div class="mono" style="font-size:11px; color: var(--muted); max-width: 55%; overflow:hidden; text-overflow: ellipsis; white-space: nowrap;">
@@ -2093,6 +2352,7 @@ function renderResults(kind, results) {
     });
 
     bindFileContextMenu(row, r.relpath, r.name);
+    bindThumb(row, r);
 
     const nameEl = row.querySelector(".name");
     if (nameEl) {
@@ -2365,6 +2625,15 @@ function setupClipEditorUI() {
     });
   }
 
+  const smartCb = $("smartCutCb");
+  if (smartCb) {
+    smartCb.checked = window.localStorage.getItem("smartCut") === "1";
+    smartCb.addEventListener("change", () => {
+      window.localStorage.setItem("smartCut", smartCb.checked ? "1" : "0");
+      renderSegmentList();
+    });
+  }
+
   if (player) {
     player.addEventListener("loadedmetadata", () => {
       refreshClipEditorForCurrentVideo();
@@ -2402,39 +2671,75 @@ async function startMergeDownload() {
   const btn = $("mergeDownloadBtn");
   const profileEl = $("mergeProfile");
   const profile = profileEl ? String(profileEl.value || "android_small") : "android_small";
+  const progressiveEl = $("mergeProgressive");
+  const progressive = Boolean(progressiveEl && progressiveEl.checked);
   if (btn) btn.disabled = true;
   setMergeProgress({ visible: true, pct: 0, text: "Starte Merge…" });
 
   try {
-    const resp = await apiPost("/api/merge/start", { profile });
+    const resp = await apiPost("/api/merge/start", { profile, progressive });
     const jobId = resp && resp.job_id;
     if (!jobId) {
       throw new Error("Merge-Job konnte nicht gestartet werden.");
     }
 
-    const start = Date.now();
-    while (true) {
-      const st = await apiGet(`/api/merge/status?job_id=${encodeURIComponent(jobId)}`);
-      const pct = Number(st.progress_pct || 0);
-      const phase = st.phase || "";
-      const msg = st.message || "";
-      setMergeProgress({ visible: true, pct, text: `${phase}${msg ? ": " + msg : ""}` });
+    let streamStarted = false;
+    let hlsUrl = null;
+    const statusUrl = `/api/merge/status?job_id=${encodeURIComponent(jobId)}`;
+    let st = await followJob({
+      topic: "merge",
+      jobId,
+      statusUrl,
+      onUpdate: (cur) => {
+        const pct = Number(cur.progress_pct || 0);
+        const phase = cur.phase || "";
+        const msg = cur.message || "";
+        if (cur.hls_url && !hlsUrl) {
+          // Playlist ist abspielbar, sobald das erste Segment geschrieben ist.
+          hlsUrl = new URL(cur.hls_url, window.location.href).toString();
+          setStatus(`HLS-Playlist abspielbar (wird noch erweitert): ${hlsUrl}`, "ok");
+        }
+        const suffix = streamStarted ? " (Download läuft)" : (hlsUrl ? ` | HLS: ${hlsUrl}` : "");
+        setMergeProgress({ visible: true, pct, text: `${phase}${msg ? ": " + msg : ""}${suffix}` });
+        if (cur.stream_ready && !streamStarted) {
+          streamStarted = true;
+          window.location.href = `/api/merge/download/${encodeURIComponent(jobId)}`;
+        }
+      },
+    });
 
+    // Nach "done" kann die Ausgabe noch kurz finalisiert werden
+    let delivered = false;
+    for (let attempt = 0; attempt < 20; attempt++) {
       if (st.status === "done") {
+        if (st.hls_url) {
+          const url = new URL(st.hls_url, window.location.href).toString();
+          setMergeProgress({ visible: true, pct: 100, text: `Fertig. HLS-Playlist: ${url}` });
+          setStatus(`HLS-Playlist bereit: ${url}`, "ok");
+          delivered = true;
+          break;
+        }
+        if (streamStarted) {
+          setMergeProgress({ visible: true, pct: 100, text: "Fertig." });
+          delivered = true;
+          break;
+        }
         if (st.download_ready) {
           setMergeProgress({ visible: true, pct: 100, text: "Fertig. Download startet…" });
           window.location.href = `/api/merge/download/${encodeURIComponent(jobId)}`;
+          delivered = true;
           break;
         }
         setMergeProgress({ visible: true, pct: 99, text: "Finalisiere Ausgabe…" });
       }
-      if (st.status === "error") {
-        throw new Error(st.error || "Merge fehlgeschlagen.");
-      }
-      if (Date.now() - start > 1000 * 60 * 60) {
-        throw new Error("Timeout beim Merge.");
+      if (st.expired) {
+        throw new Error("Merge-Ausgabe ist abgelaufen.");
       }
       await new Promise((r) => setTimeout(r, 700));
+      st = await apiGet(statusUrl);
+    }
+    if (!delivered) {
+      throw new Error("Merge ist fertig, aber die Ausgabe ist nicht verfügbar. Bitte erneut versuchen.");
     }
   } finally {
     if (btn) btn.disabled = false;
@@ -2454,7 +2759,9 @@ function setupMergeDownloadUI() {
       }
       const profileEl = $("mergeProfile");
       const profile = profileEl ? String(profileEl.value || "android_small") : "android_small";
-      const profileLabel = profile === "copy" ? "Original (Copy)" : "Android (klein)";
+      const profileLabel = profileEl && profileEl.selectedOptions && profileEl.selectedOptions[0]
+        ? profileEl.selectedOptions[0].textContent
+        : "Android (klein)";
       if (!window.confirm(`Alle Videos in der Queue (${state.queue.length}) zu einem Video mergen und downloaden?\n\nProfil: ${profileLabel}`)) {
         return;
       }
@@ -2719,9 +3026,10 @@ function renderFolders(listData) {
       <div class="item-left">
         <input class="source-select" type="checkbox" ${state.sourceSelectedRelpaths instanceof Set && state.sourceSelectedRelpaths.has(String(v.relpath || "")) ? "checked" : ""} />
         <span class="badge">VID</span>
+        ${thumbHtml(v)}
         <div class="name">${escapeHtml(v.name)}</div>
       </div>
-      <div></div>
+      <div class="item-meta">${v.duration ? `${formatTime(v.duration)} · ` : ""}${formatBytes(v.size)}</div>
     `;
 
     const cb = row.querySelector(".source-select");
@@ -2744,6 +3052,7 @@ function renderFolders(listData) {
     });
 
     bindFileContextMenu(row, v.relpath, v.name);
+    bindThumb(row, v);
 
     const nameEl = row.querySelector(".name");
     if (nameEl) {
@@ -2758,6 +3067,15 @@ function renderFolders(listData) {
     folderList.appendChild(row);
   }
 
+  if (listData.next_cursor) {
+    const row = document.createElement("div");
+    row.className = "item list-more";
+    const rest = Math.max(0, (Number(listData.total_videos) || 0) - videos.length);
+    row.innerHTML = `<button class="btn" type="button">Mehr laden (${rest} weitere)</button>`;
+    row.querySelector("button").addEventListener("click", () => loadMoreList());
+    folderList.appendChild(row);
+  }
+
   updateActivePlayingHighlights();
 }
 
@@ -2827,13 +3145,77 @@ function renderBreadcrumb(currentPath) {
   el.textContent = currentPath || "/";
 }
 
+function useProxyPlayback() {
+  return window.localStorage.getItem("useProxy") === "1";
+}
+
+function sourceMediaUrl(relpath) {
+  const base = useProxyPlayback() ? "/media/proxy/" : "/media/source/";
+  return `${base}${encodePath(relpath)}`;
+}
+
+function setupProxyToggleUI() {
+  const cb = $("useProxyCb");
+  if (!cb) return;
+  cb.checked = useProxyPlayback();
+  cb.addEventListener("change", () => {
+    window.localStorage.setItem("useProxy", cb.checked ? "1" : "0");
+    const cur = state.currentVideo;
+    if (!cur || cur.kind !== "source") return;
+    switchPlayerSrc(sourceMediaUrl(cur.relpath));
+    if (!cb.checked && needsRemux(cur.relpath)) followRemux(cur.relpath);
+  });
+}
+
+const REMUX_EXTENSIONS = [".mkv", ".avi"];
+
+function needsRemux(relpath) {
+  const lower = String(relpath || "").toLowerCase();
+  return REMUX_EXTENSIONS.some((ext) => lower.endsWith(ext));
+}
+
+function switchPlayerSrc(url) {
+  // Neue URL laden und an derselben Stelle weiterspielen.
+  const player = $("videoPlayer");
+  const t = Number(player.currentTime || 0);
+  const paused = player.paused;
+  player.src = url;
+  player.load();
+  player.addEventListener("loadedmetadata", () => {
+    player.currentTime = t;
+    if (!paused) player.play().catch(() => {});
+  }, { once: true });
+}
+
+async function followRemux(relpath, attempt = 0) {
+  // Das Remux hat eine eigene URL; erst wechseln, wenn es fertig ist.
+  const cur = state.currentVideo;
+  if (!cur || cur.kind !== "source" || cur.relpath !== relpath || useProxyPlayback()) return;
+  let data = null;
+  try {
+    data = await apiGet(`/api/remux/status?relpath=${encodeURIComponent(relpath)}`);
+  } catch {
+    data = null;
+  }
+  const now = state.currentVideo;
+  if (!now || now.kind !== "source" || now.relpath !== relpath || useProxyPlayback()) return;
+  if (data && data.ready && data.url) {
+    switchPlayerSrc(data.url);
+    return;
+  }
+  if (data && data.supported === false) return;
+  if (attempt >= 200) return;
+  window.setTimeout(() => followRemux(relpath, attempt + 1), 3000);
+}
+
 function playSource(relpath) {
   const player = $("videoPlayer");
   hidePlayerMsg();
   state.currentVideo = { kind: "source", relpath };
-  player.src = `/media/source/${encodePath(relpath)}`;
+  player.src = sourceMediaUrl(relpath);
   player.load();
   player.play().catch(() => {});
+  if (needsRemux(relpath) && !useProxyPlayback()) followRemux(relpath);
   refreshTagEditorForCurrentVideo();
   refreshClipEditorForCurrentVideo();
   updateActivePlayingHighlights();
@@ -2862,9 +3244,12 @@ function computeQueueInsertIndex(containerEl, clientY) {
   return items.length;
 }
 
-async function saveQueueOrder(orderedIds) {
-  await apiPost("/api/queue/reorder", { ordered_ids: orderedIds });
-  await loadQueue();
+async function moveQueueItem(itemId, { beforeId = null, afterId = null } = {}) {
+  const body = { id: Number(itemId) };
+  if (beforeId !== null && beforeId !== undefined) body.before_id = Number(beforeId);
+  else if (afterId !== null && afterId !== undefined) body.after_id = Number(afterId);
+  else return;
+  await apiPost("/api/queue/move", body);
 }
 
 function isRelpathAlreadyInQueue(relpath, kind) {
@@ -2884,8 +3269,13 @@ async function ensureQueueInsertedAt(itemId, insertIndex) {
   if (existingIdx === -1) return;
   ids.splice(existingIdx, 1);
   const idx = Math.max(0, Math.min(insertIndex, ids.length));
-  ids.splice(idx, 0, idNum);
-  await saveQueueOrder(ids);
+  if (idx === existingIdx || ids.length === 0) return;
+  if (idx < ids.length) {
+    await moveQueueItem(idNum, { beforeId: ids[idx] });
+  } else {
+    await moveQueueItem(idNum, { afterId: ids[ids.length - 1] });
+  }
+  await loadQueue();
 }
 
 async function handleQueueDrop(relpath, insertIndex, kind) {
@@ -2907,6 +3297,31 @@ async function handleQueueDrop(relpath, insertIndex, kind) {
       return;
     }
 
+    const selected = _selectedSourceRelpathsArray();
+    if (selected.length > 1 && selected.includes(String(relpath || ""))) {
+      const batch = await apiPost("/api/transfer/batch", {
+        source_paths: selected,
+        target_subdir: "",
+        mode: mode,
+      });
+      const results = (batch && batch.results) || [];
+      const ids = results.map((r) => r.ok && r.queue_item && r.queue_item.id).filter(Boolean);
+      if (ids.length > 0 && insertIndex !== null && insertIndex !== undefined) {
+        await ensureQueueInsertedAt(ids[0], insertIndex);
+        for (let i = 1; i < ids.length; i++) {
+          await moveQueueItem(ids[i], { afterId: ids[i - 1] });
+        }
+      }
+      await loadQueue();
+      const failed = Number(batch && batch.failed) || 0;
+      if (failed > 0) {
+        setStatus(`In Queue aufgenommen: ${batch.added}, Fehler: ${failed}`, "error");
+      } else {
+        setStatus(`In Queue aufgenommen: ${batch.added}`, "ok");
+      }
+      return;
+    }
+
     const resp = await apiPost("/api/transfer", {
       source_path: relpath,
       target_subdir: "",
@@ -2976,10 +3391,17 @@ function setupVideoPlayerDiagnostics() {
   });
 }
 
+function listQuery(rel, extra) {
+  const params = new URLSearchParams({ path: rel, sort: state.listSort.sort, order: state.listSort.order, ...extra });
+  return `/api/list?${params.toString()}`;
+}
+
 async function loadList(path) {
   const rel = path || "";
   try {
-    const data = await apiGet(`/api/list?path=${encodeURIComponent(rel)}`);
+    // Beim Neuladen desselben Ordners schon nachgeladene Seiten behalten
+    const loaded = state.lastList && state.currentPath === rel ? (state.lastList.videos || []).length : 0;
+    const data = await apiGet(listQuery(rel, loaded > 0 ? { limit: String(loaded) } : {}));
     state.currentPath = data.current_path || "";
     state.lastList = data;
 
@@ -2995,6 +3417,58 @@ async function loadList(path) {
   }
 }
 
+async function loadMoreList() {
+  const prev = state.lastList;
+  if (!prev || !prev.next_cursor || state.listLoadingMore) return;
+  state.listLoadingMore = true;
+  try {
+    const data = await apiGet(listQuery(prev.current_path || "", { cursor: prev.next_cursor }));
+    if (state.lastList !== prev) return;
+    prev.videos = (prev.videos || []).concat(data.videos || []);
+    prev.next_cursor = data.next_cursor;
+    prev.next_offset = data.next_offset;
+    prev.total_videos = data.total_videos;
+    renderFolders(prev);
+  } catch (e) {
+    setStatus(e.message, "error");
+  } finally {
+    state.listLoadingMore = false;
+  }
+}
+
+function setupListSortUI() {
+  const sel = $("listSortSelect");
+  const btn = $("listOrderBtn");
+  const saved = String(window.localStorage.getItem("listSort") || "").split(":");
+  if (["name", "size", "mtime", "duration"].includes(saved[0])) state.listSort.sort = saved[0];
+  if (saved[1] === "asc" || saved[1] === "desc") state.listSort.order = saved[1];
+
+  const sync = () => {
+    if (sel) sel.value = state.listSort.sort;
+    if (btn) btn.textContent = state.listSort.order === "asc" ? "↑" : "↓";
+    window.localStorage.setItem("listSort", `${state.listSort.sort}:${state.listSort.order}`);
+  };
+  const reload = () => {
+    sync();
+    state.lastList = null;
+    loadList(state.currentPath);
+  };
+
+  if (sel) {
+    sel.addEventListener("change", () => {
+      state.listSort.sort = sel.value;
+      reload();
+    });
+  }
+  if (btn) {
+    btn.addEventListener("click", () => {
+      state.listSort.order = state.listSort.order === "asc" ? "desc" : "asc";
+      reload();
+    });
+  }
+  sync();
+}
+
 function renderQueue(items) {
   state.queue = items || [];
   const el = $("queueList");
@@ -3008,20 +3482,33 @@ function renderQueue(items) {
     if (!validIds.has(Number(id))) state.queueSelectedIds.delete(id);
   }
 
-  for (const it of state.queue) {
+  for (const [idx, it] of state.queue.entries()) {
     const row = document.createElement("div");
     row.className = "queue-item";
     row.dataset.id = it.id;
     row.dataset.targetRelpath = it.target_relpath;
 
+    const itemState = it.state || "ready";
+    let stateBadge = "";
+    if (itemState === "copying") {
+      const total = Number(it.bytes_total) || 0;
+      const pct = total > 0 ? Math.floor((100 * (Number(it.bytes_done) || 0)) / total) : 0;
+      stateBadge = `<span class="badge queue-state">Kopiere ${pct}%</span>`;
+      row.classList.add("copying");
+    } else if (itemState === "error") {
+      stateBadge = `<span class="badge queue-state error" title="${escapeHtml(it.error || "")}">Fehler</span>`;
+      row.classList.add("failed");
+    }
+
     row.innerHTML = `
       <div class="item-left" style="min-width:0;">
         <input class="queue-select" type="checkbox" ${state.queueSelectedIds.has(Number(it.id)) ? "checked" : ""} />
-        <span class="badge queue-drag-handle">#${it.position}</span>
+        <span class="badge queue-drag-handle">#${idx + 1}</span>
+        ${stateBadge}
         <div class="name">${escapeHtml(it.filename)}</div>
       </div>
       <div class="queue-actions">
-        <button class="btn" type="button">Play</button>
+        <button class="btn" type="button" ${itemState === "ready" ? "" : "disabled"}>Play</button>
         <button class="btn" type="button" data-action="remove">Entfernen</button>
       </div>
     `;
@@ -3075,8 +3562,9 @@ function renderQueue(items) {
     state.sortable = new Sortable(el, {
       animation: 150,
       handle: ".queue-drag-handle",
-      onEnd: async () => {
-        await persistQueueOrder();
+      onEnd: async (evt) => {
+        if (evt && evt.oldIndex === evt.newIndex) return;
+        await persistQueueMove(evt && evt.item);
       },
     });
   }
@@ -3086,8 +3574,44 @@ async function loadQueue() {
   try {
     const data = await apiGet("/api/queue");
     renderQueue(data.items || []);
+    scheduleQueueTransferPoll();
+  } catch (e) {
+    setStatus(e.message, "error");
+  }
+}
+
+function scheduleQueueTransferPoll() {
+  // Mit EventSource kommen Fortschritt und Abschluss als "transfer"-Events
+  if (jobEvents.source) return;
+  const copying = (state.queue || []).some((it) => it && it.state === "copying");
+  if (!copying || scheduleQueueTransferPoll._t) return;
+  scheduleQueueTransferPoll._t = window.setTimeout(async () => {
+    scheduleQueueTransferPoll._t = null;
+    await loadQueue();
+  }, 1000);
+}
+
+async function persistQueueMove(itemEl) {
+  if (!itemEl || !itemEl.dataset || !itemEl.dataset.id) {
+    await persistQueueOrder();
+    return;
+  }
+  const next = itemEl.nextElementSibling;
+  const prev = itemEl.previousElementSibling;
+  const isItem = (n) => n && n.classList && n.classList.contains("queue-item") && n.dataset.id;
+  try {
+    if (isItem(next)) {
+      await moveQueueItem(itemEl.dataset.id, { beforeId: next.dataset.id });
+    } else if (isItem(prev)) {
+      await moveQueueItem(itemEl.dataset.id, { afterId: prev.dataset.id });
+    } else {
+      return;
+    }
+    await loadQueue();
+    setStatus("Reihenfolge gespeichert.", "ok");
   } catch (e) {
     setStatus(e.message, "error");
+    await loadQueue();
   }
 }
 
@@ -3160,10 +3684,13 @@ async function main() {
   setupTagSearchUI();
   setupTagEditorUI();
   setupClipEditorUI();
+  setupProxyToggleUI();
   setupMarkerTimelineUI();
   setupMarkerShortcut();
   setupVideoShiftClickMarker();
   setupVideoPlayerDiagnostics();
+  setupListSortUI();
+  setupJobEventListeners();
 
   const initialPath = getInitialBrowserPath();
   window.history.replaceState({ path: initialPath }, "", urlWithBrowserPath(initialPath));